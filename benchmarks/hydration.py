@@ -0,0 +1,102 @@
+"""
+Hydration benchmark, times building Transaction resources from a listing of
+10,000 transactions with the schema driven decoding, with the old type
+guessing of every value, lazily while reading two fields of each, and as
+raw dictionaries with only the typed fields converted.
+
+    $ python benchmarks/hydration.py
+"""
+import timeit
+import uuid
+
+from emburse.context import ClientContext
+from emburse.resource import Transaction, convert_to_emburse_object
+
+COUNT = 10000
+
+
+def transaction(index):
+    return {
+        'id': str(uuid.uuid4()),
+        'url': 'https://api.emburse.com/v1/transactions/{0}'.format(index),
+        'amount': -119.21,
+        'state': 'pending',
+        'vendor': {
+            'mid': 445201094999,
+            'mcc': 7311,
+            'name': 'ADROLL',
+            'address': None,
+            'city': 'SAN FRANCISCO',
+            'state': 'CA',
+            'zip_code': '94103'
+        },
+        'card': {
+            'id': str(uuid.uuid4()),
+            'url': 'https://api.emburse.com/v1/cards/c195f95f',
+            'state': 'active',
+            'description': 'Advertising',
+            'last_four': '7640'
+        },
+        'member': {
+            'id': str(uuid.uuid4()),
+            'url': 'https://api.emburse.com/v1/members/d8ef8d51',
+            'email': 'justin@example.com',
+            'first_name': 'Justin',
+            'last_name': 'Jones'
+        },
+        'category': {
+            'id': str(uuid.uuid4()),
+            'url': 'https://api.emburse.com/v1/categories/c66b60c5',
+            'code': None,
+            'name': 'Sales & Marketing'
+        },
+        'department': None,
+        'label': None,
+        'location': None,
+        'receipt': None,
+        'note': '',
+        'time': '2016-08-19T04:02:05Z',
+        'created_at': '2016-08-19T04:02:07.016369Z'
+    }
+
+
+def hydrate(payload, context):
+    return convert_to_emburse_object(payload, context.auth_token,
+                                     klass_name='transaction', context=context)
+
+
+def hydrate_lazy(payload, context):
+    for transaction in hydrate(payload, context):
+        transaction.id
+        transaction.amount
+
+
+def main(repeat=3):
+    context = ClientContext('benchmark')
+    lazy_context = ClientContext('benchmark', lazy=True)
+    payload = [transaction(i) for i in range(COUNT)]
+    schema = Transaction.fields
+
+    def best(func):
+        return min(timeit.repeat(func, number=1, repeat=repeat))
+
+    Transaction.fields = None
+    try:
+        guessed = best(lambda: hydrate(payload, context))
+    finally:
+        Transaction.fields = schema
+    decoded = best(lambda: hydrate(payload, context))
+    lazy = best(lambda: hydrate_lazy(payload, lazy_context))
+    typed = best(lambda: Transaction.typed_values(payload))
+    print('{0} transactions'.format(COUNT))
+    print('  type guessing: {0:.3f}s'.format(guessed))
+    print('  schema:        {0:.3f}s ({1:.1f}x)'.format(
+        decoded, guessed / decoded))
+    print('  lazy, 2 reads: {0:.3f}s ({1:.1f}x)'.format(
+        lazy, guessed / lazy))
+    print('  raw, typed:    {0:.3f}s ({1:.1f}x)'.format(
+        typed, guessed / typed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+"""
+JSON codec benchmark, times decoding a 10,000 transaction listing from the
+response bytes with each JSON codec installed.
+
+    $ python benchmarks/json_codecs.py
+"""
+import json
+import timeit
+
+import emburse.codec as codec
+from emburse.requestor import Requestor
+
+from hydration import COUNT, transaction
+
+
+def main(repeat=5):
+    body = json.dumps(
+        {'transactions': [transaction(i) for i in range(COUNT)]}
+    ).encode('utf-8')
+    print('{0} transactions, {1:,} bytes'.format(COUNT, len(body)))
+    for name in codec.available_codecs():
+        requestor = Requestor(token='benchmark', json_codec=name)
+        seconds = min(timeit.repeat(
+            lambda: requestor.interpret_response(body, 200, {}),
+            number=1, repeat=repeat))
+        print('  {0:<8} {1:.3f}s'.format(name, seconds))
+
+
+if __name__ == '__main__':
+    main()
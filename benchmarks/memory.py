@@ -0,0 +1,47 @@
+"""
+Memory benchmark, reports the bytes still held per transaction after a
+listing of 10,000 is decoded and hydrated and the response is dropped, for
+full resources and for compact resources, measured with tracemalloc.
+
+    $ python benchmarks/memory.py
+"""
+import gc
+import json
+import tracemalloc
+
+from emburse.compact import compact
+from emburse.context import ClientContext
+from emburse.resource import convert_to_emburse_object
+
+from hydration import COUNT, transaction
+
+
+def measure(body, build):
+    gc.collect()
+    tracemalloc.start()
+    objects = build(json.loads(body))
+    gc.collect()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def main():
+    context = ClientContext('benchmark')
+    body = json.dumps([transaction(i) for i in range(COUNT)])
+    full = measure(body, lambda payload: convert_to_emburse_object(
+        payload, context.auth_token, klass_name='transaction',
+        context=context))
+    lean = measure(body, lambda payload: compact(
+        payload, 'transaction', context))
+    decoded = measure(body, lambda payload: payload)
+    print('{0} transactions'.format(COUNT))
+    print('  json dicts: {0:,} bytes per object'.format(decoded // COUNT))
+    print('  resources:  {0:,} bytes per object'.format(full // COUNT))
+    print('  compact:    {0:,} bytes per object ({1:.1f}x smaller)'.format(
+        lean // COUNT, float(full) / lean))
+
+
+if __name__ == '__main__':
+    main()
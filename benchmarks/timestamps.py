@@ -0,0 +1,42 @@
+"""
+Timestamp benchmark, times parsing 10,000 distinct api timestamps with
+dateutil's parser and with emburse.util.parse_datetime.
+
+    $ python benchmarks/timestamps.py
+"""
+import datetime
+import timeit
+
+from dateutil.parser import parse as date_parser
+
+import emburse.util as util
+
+COUNT = 10000
+
+
+def main(repeat=3):
+    start = datetime.datetime(2016, 8, 19, 4, 2, 7, 16369)
+    values = [
+        (start + datetime.timedelta(seconds=i)).strftime(
+            '%Y-%m-%dT%H:%M:%S.%fZ')
+        for i in range(COUNT)
+    ]
+
+    def fast():
+        util._datetime_cache.clear()
+        for value in values:
+            util.parse_datetime(value)
+
+    def best(func):
+        return min(timeit.repeat(func, number=1, repeat=repeat))
+
+    dateutil_time = best(lambda: [date_parser(value) for value in values])
+    fast_time = best(fast)
+    print('{0} timestamps'.format(COUNT))
+    print('  dateutil:       {0:.3f}s'.format(dateutil_time))
+    print('  parse_datetime: {0:.3f}s ({1:.1f}x)'.format(
+        fast_time, dateutil_time / fast_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -9,6 +9,8 @@
     :copyright: (c) 2017 by Marc Ford.
     :license: GNU GENERAL PUBLIC LICENSE, see LICENSE file for more details.
 """
+import sys
+
 from .client import (
     Client,
     Account,
@@ -24,4 +26,8 @@ from .client import (
     Statement,
     Transaction
 )
-from .errors import *
\ No newline at end of file
+from .errors import *
+from .retry import RetryPolicy
+
+if sys.version_info >= (3, 5):
+    from .async_client import AsyncClient
@@ -0,0 +1,479 @@
+import asyncio
+import emburse.errors as error
+from emburse.async_http_client import new_default_async_http_client
+from emburse.context import ClientContext
+from emburse.deadline import Deadline
+from emburse.requestor import Requestor
+from emburse.resource import (
+    APIResource,
+    CreateableAPIResource,
+    DeletableAPIResource,
+    ListableAPIResource,
+    UpdateableAPIResource,
+    Account,
+    Allowance,
+    Card,
+    Category,
+    Company,
+    Department,
+    Label,
+    Location,
+    Member,
+    SharedLink,
+    Statement,
+    Transaction
+)
+
+
+class AsyncRequestor(Requestor):
+    """
+    Async Requestor, asyncio counterpart of emburse.requestor.Requestor.
+    Requests are built and responses interpreted exactly as the blocking
+    requestor does, only the transport call is awaited.
+    """
+
+    def __init__(self, token=None, proxy=None, client=None,
+                 verify_ssl_certs=True, retry_policy=None,
+                 rate_limiter=None, circuit_breaker=None, json_codec=None):
+        owns_client = client is None
+        client = client or new_default_async_http_client(
+            verify_ssl_certs=verify_ssl_certs, proxy=proxy)
+        super(AsyncRequestor, self).__init__(
+            token=token,
+            proxy=proxy,
+            client=client,
+            verify_ssl_certs=verify_ssl_certs,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            json_codec=json_codec
+        )
+        self._owns_client = owns_client
+
+    async def request(self, method, url_, params=None, headers=None,
+                      deadline=None):
+        """
+        Request, makes a request to the emburse API
+        Args:
+            method (str): The HTTP method used to send request
+            url_ (str): The URL to make request to.
+            params (dict): Params to send to the API
+            headers (dict): Custom Headers to send to with request.
+            deadline (Deadline|float): Time budget for the call, retries
+                included.
+
+        Returns:
+            set (dict, str): Dict of response body and the api key in a set.
+        """
+        resp_body, resp_code, resp_headers, my_api_key = await self.request_raw(
+            method.lower(), url_, params, headers, deadline=deadline)
+        resp = self.interpret_response(resp_body, resp_code, resp_headers)
+        return resp, my_api_key
+
+    async def request_raw(self, method, url, params=None,
+                          supplied_headers=None, deadline=None):
+        """
+        Request Raw, coroutine for issuing an API call
+        """
+        deadline = Deadline.coerce(deadline)
+        abs_url, headers, post_data, my_auth_token = self.prepare_request(
+            method, url, params, supplied_headers)
+
+        steps = self.attempts(method, abs_url, headers, deadline)
+        action, value = next(steps)
+        while action != Requestor.DONE:
+            try:
+                if action == Requestor.SLEEP:
+                    await asyncio.sleep(value)
+                    outcome = None
+                else:
+                    outcome = await self._client.request(
+                        method, abs_url, headers, post_data, **value)
+            except BaseException as e:
+                action, value = steps.throw(e)
+            else:
+                action, value = steps.send(outcome)
+        resp_body, resp_code, resp_headers = value
+
+        self.log_response(method, abs_url, resp_code, resp_body)
+        return resp_body, resp_code, resp_headers, my_auth_token
+
+    async def close(self):
+        """
+        Close, releases the pooled connections of the HTTP client if this
+        requestor created it.
+        """
+        if self._owns_client:
+            await self._client.close()
+
+
+class AsyncResource(object):
+    """
+    Async Resource
+
+    Awaitable retrieve, list, create, update and delete for one resource
+    type. Validation, URL building and hydration are done by the resource
+    class itself, so the objects returned are the same emburse.resource
+    instances the blocking Client returns. Calls can be run concurrently,
+    e.g. with asyncio.gather, and share the AsyncClient's connection pool.
+
+    """
+
+    def __init__(self, resource_class, client):
+        """
+        Async Resource
+
+        Args:
+            resource_class (type): The emburse.resource class, e.g. Card.
+
+            client (AsyncClient): The client the calls are made through.
+
+        """
+        self.resource_class = resource_class
+        self.client = client
+
+    def __repr__(self):
+        return '<AsyncResource {0}>'.format(self.resource_class.__name__)
+
+    def _new(self, **values):
+        return self.resource_class(
+            auth_token=self.client.auth_token,
+            context=self.client.context,
+            **values
+        )
+
+    def _require(self, base, action):
+        if not issubclass(self.resource_class, base):
+            raise error.EmburseNotImplementedError(
+                '{0} does not support {1}!'.format(
+                    self.resource_class.__name__, action)
+            )
+
+    async def _request(self, method, url_, params=None, deadline=None):
+        resp, api_key = await self.client.requestor.request(
+            method=method,
+            url_=url_,
+            params=params,
+            deadline=deadline
+        )
+        return resp
+
+    async def retrieve(self, identifier, deadline=None, raw=False,
+                       typed=False):
+        """
+        Retrieve, gets data from api for the object type by a given identifier.
+
+        Args:
+            identifier (str): UUID of the object.
+
+            deadline (Deadline|float, optional): Time budget for the call in
+                seconds, retries included.
+
+            raw (bool): Return the dictionary decoded from the api response
+                instead of a resource object.
+
+            typed (bool): With raw, convert the typed fields of the schema.
+
+        Returns:
+            An instance of the resource type with data from the api.
+
+        """
+        instance = self._new()
+        if self.resource_class.retrieve is not APIResource.retrieve:
+            # Resources such as Statement override retrieve to refuse it.
+            return instance.retrieve(identifier)
+        instance.id = identifier
+        resp = await self._request('get', instance.instance_url(),
+                                   deadline=deadline)
+        if raw:
+            return instance.hydrate(resp, raw=True, typed=typed)
+        return instance.refresh_from(resp)
+
+    async def list(self, deadline=None, compact=False, raw=False, typed=False,
+                   **params):
+        """
+        List, gets a list of objects of the resource type from the api.
+
+        Args:
+            deadline (Deadline|float, optional): Time budget for the call in
+                seconds, retries included.
+
+            compact (bool): Return emburse.compact.CompactResource objects.
+
+            raw (bool): Return the dictionaries decoded from the api response
+                without building resource objects.
+
+            typed (bool): With raw, convert the typed fields of the schema.
+
+            **params: Query parameters to filter list objects.
+
+        Returns:
+            A list of resource objects.
+
+        """
+        self._require(ListableAPIResource, 'list')
+        cls = self.resource_class
+        resp = await self._request('get', cls.class_url(), params,
+                                   deadline=deadline)
+        return self._new().hydrate(
+            resp.get(cls.class_name_plural(), []),
+            compact=compact,
+            raw=raw,
+            typed=typed
+        )
+
+    async def create(self, deadline=None, **params):
+        """
+        Create, creates a new resource with the given values.
+
+        Args:
+            deadline (Deadline|float, optional): Time budget for the call in
+                seconds, retries included.
+
+            **params: Values to create a new resource
+
+        Returns:
+            APIResource: New resource instance
+
+        """
+        instance = self._new()
+        if not issubclass(self.resource_class, CreateableAPIResource):
+            # Allowances are built locally and sent along with a Card.
+            if self.resource_class is Allowance:
+                return instance.create(**params)
+            self._require(CreateableAPIResource, 'create')
+        params = instance.build_create_params(params)
+        resp = await self._request('post', instance.class_url(), params,
+                                   deadline=deadline)
+        return instance.construct_from(
+            values=resp,
+            auth_token=self.client.auth_token,
+            context=self.client.context
+        )
+
+    async def update(self, identifier, deadline=None, **params):
+        """
+        Update, updates the given values of a resource.
+
+        Args:
+            identifier (str): UUID of the object.
+
+            deadline (Deadline|float, optional): Time budget for the call in
+                seconds, retries included.
+
+            **params: Values to be updated
+
+        Returns:
+            The updated resource instance.
+
+        """
+        self._require(UpdateableAPIResource, 'update')
+        instance = self._new()
+        instance.id = identifier
+        params = instance.build_update_params(params)
+        resp = await self._request('put', instance.instance_url(), params,
+                                   deadline=deadline)
+        return instance.refresh_from(resp)
+
+    async def delete(self, identifier, deadline=None):
+        """
+        Delete, deletes a resource from the api.
+
+        Args:
+            identifier (str): UUID of the object.
+
+            deadline (Deadline|float, optional): Time budget for the call in
+                seconds, retries included.
+
+        Returns:
+            The deleted resource instance.
+
+        """
+        self._require(DeletableAPIResource, 'delete')
+        instance = self._new()
+        instance.id = identifier
+        await self._request('delete', instance.instance_url(),
+                            deadline=deadline)
+        return instance
+
+
+class AsyncClient(object):
+    """
+    Emburse asyncio API Client
+
+    Mirrors emburse.Client, each resource property returns an AsyncResource
+    whose methods are coroutines. All calls share one AsyncRequestor and
+    connection pool, so many requests can overlap on one event loop.
+
+        >>> async with AsyncClient(auth_token='abc123') as client:
+        >>>     cards = await asyncio.gather(
+        >>>         *[client.Card.retrieve(card_id) for card_id in card_ids])
+
+    Objects returned by the client are regular emburse.resource instances;
+    calling their blocking methods uses the client's blocking transport.
+
+    """
+
+    def __init__(self, auth_token, proxy=None, verify_ssl_certs=True,
+                 http_client=None, retry_policy=None, rate_limiter=None,
+                 circuit_breaker=None, lazy=False, json_codec=None):
+        """
+        Emburse asyncio API Client
+
+        Args:
+            auth_token (str): Your application's auth token from
+                https://app.emburse.com/applications
+
+            proxy (str|dict, optional): Proxy URL(s) for the HTTP client.
+
+            verify_ssl_certs (bool): Verify the API's SSL certificate.
+
+            http_client (emburse.async_http_client.AsyncHTTPClient, optional):
+                Transport to use, if not given an AiohttpClient is built.
+
+            retry_policy (emburse.retry.RetryPolicy, optional): Policy for
+                retrying failed calls, by default calls are not retried.
+
+            rate_limiter (emburse.ratelimit.TokenBucket, optional): Limiter
+                every request of the client waits on.
+
+            circuit_breaker (emburse.circuit.CircuitBreaker, optional):
+                Breaker that fails calls fast while the API is failing.
+
+            lazy (bool): Convert the fields of returned resources the first
+                time they are read instead of up front.
+
+            json_codec (str|emburse.codec.JSONCodec, optional): JSON codec,
+                e.g. 'orjson', defaults to emburse.codec's default codec.
+
+        """
+        self.auth_token = auth_token
+        self.context = ClientContext(
+            auth_token,
+            proxy=proxy,
+            verify_ssl_certs=verify_ssl_certs,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            lazy=lazy,
+            json_codec=json_codec
+        )
+        self.requestor = AsyncRequestor(
+            token=auth_token,
+            proxy=proxy,
+            client=http_client,
+            verify_ssl_certs=verify_ssl_certs,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            json_codec=json_codec
+        )
+
+    async def close(self):
+        """
+        Close, releases the pooled connections held by the client.
+        """
+        await self.requestor.close()
+        self.context.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @property
+    def Account(self):
+        """
+        Emburse Account Object, async
+        :rtype: AsyncResource
+        """
+        return AsyncResource(Account, self)
+
+    @property
+    def Allowance(self):
+        """
+        Emburse Allowance Object, async
+        :rtype: AsyncResource
+        """
+        return AsyncResource(Allowance, self)
+
+    @property
+    def Card(self):
+        """
+        Emburse Card Object, async
+        :rtype: AsyncResource
+        """
+        return AsyncResource(Card, self)
+
+    @property
+    def Category(self):
+        """
+        Emburse Category Object, async
+        :rtype: AsyncResource
+        """
+        return AsyncResource(Category, self)
+
+    @property
+    def Company(self):
+        """
+        Emburse Company Object, async
+        :rtype: AsyncResource
+        """
+        return AsyncResource(Company, self)
+
+    @property
+    def Department(self):
+        """
+        Emburse Department Object, async
+        :rtype: AsyncResource
+        """
+        return AsyncResource(Department, self)
+
+    @property
+    def Label(self):
+        """
+        Emburse Label Object, async
+        :rtype: AsyncResource
+        """
+        return AsyncResource(Label, self)
+
+    @property
+    def Location(self):
+        """
+        Emburse Location Object, async
+        :rtype: AsyncResource
+        """
+        return AsyncResource(Location, self)
+
+    @property
+    def Member(self):
+        """
+        Emburse Member Object, async
+        :rtype: AsyncResource
+        """
+        return AsyncResource(Member, self)
+
+    @property
+    def SharedLink(self):
+        """
+        Emburse SharedLink Object, async
+        :rtype: AsyncResource
+        """
+        return AsyncResource(SharedLink, self)
+
+    @property
+    def Statement(self):
+        """
+        Emburse Statement Object, async
+        :rtype: AsyncResource
+        """
+        return AsyncResource(Statement, self)
+
+    @property
+    def Transaction(self):
+        """
+        Emburse Transaction Object, async
+        :rtype: AsyncResource
+        """
+        return AsyncResource(Transaction, self)
@@ -0,0 +1,168 @@
+import asyncio
+import os
+import ssl
+import textwrap
+
+import emburse.errors as error
+from emburse.http_client import HTTPClient
+
+# - aiohttp is the only asyncio transport currently supported
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+def new_default_async_http_client(*args, **kwargs):
+    if not aiohttp:
+        raise error.EmburseNotImplementedError(
+            'The Emburse AsyncClient requires the "aiohttp" library. HINT: '
+            'install it with "pip install aiohttp".'
+        )
+    return AiohttpClient(*args, **kwargs)
+
+
+class AsyncHTTPClient(HTTPClient):
+    """
+    Async HTTP Client, base class for asyncio transports. Subclasses
+    implement `request` and `close` as coroutines.
+    """
+
+    async def request(self, method, url, headers, post_data=None,
+                      timeout=None):
+        raise NotImplementedError(
+            'AsyncHTTPClient subclasses must implement `request`')
+
+    async def close(self):
+        """
+        Close, releases any pooled connections held by the client.
+        """
+        pass
+
+    def __enter__(self):
+        raise TypeError('Use "async with" with an AsyncHTTPClient')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+class AiohttpClient(AsyncHTTPClient):
+    name = 'aiohttp'
+
+    def __init__(self, timeout=80, connect_timeout=None, read_timeout=None,
+                 limit=100, limit_per_host=0, session=None, **kwargs):
+        """
+        Aiohttp Client, asyncio HTTP client backed by an aiohttp.ClientSession
+        with a pooled connector. The session is created on first use so the
+        client can be built outside of a running event loop.
+
+        Args:
+            timeout (int): Seconds to wait for the API to respond.
+
+            connect_timeout (float, optional): Seconds to wait for a
+                connection to be established, defaults to timeout.
+
+            read_timeout (float, optional): Seconds to wait between reads of
+                the response, defaults to timeout.
+
+            limit (int): Maximum number of open connections, 0 for no limit.
+
+            limit_per_host (int): Maximum number of open connections per host,
+                0 for no limit.
+
+            session (aiohttp.ClientSession, optional): Session to send
+                requests through. The client will not close a session it did
+                not create.
+
+        """
+        super(AiohttpClient, self).__init__(**kwargs)
+        self._timeout = timeout
+        self._connect_timeout = (
+            connect_timeout if connect_timeout is not None else timeout)
+        self._read_timeout = (
+            read_timeout if read_timeout is not None else timeout)
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._session = session
+        self._owns_session = session is None
+
+    @property
+    def session(self):
+        """
+        Session, the pooled aiohttp.ClientSession used by this client, created
+        on first use.
+
+        Returns:
+            aiohttp.ClientSession: The shared session.
+
+        """
+        if self._session is None or self._session.closed:
+            self._session = self._build_session()
+        return self._session
+
+    def _build_session(self):
+        if self._verify_ssl_certs:
+            ssl_context = ssl.create_default_context(
+                cafile=os.path.join(
+                    os.path.dirname(__file__), 'data/ca-certificates.crt'))
+        else:
+            ssl_context = False
+        connector = aiohttp.TCPConnector(
+            limit=self._limit,
+            limit_per_host=self._limit_per_host,
+            ssl=ssl_context
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    async def close(self):
+        """
+        Close, closes the pooled session if this client created it.
+        """
+        if not self._owns_session:
+            return
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+
+    def _proxy_for(self, url):
+        if not self._proxy:
+            return None
+        scheme = 'https' if url.startswith('https') else 'http'
+        return self._proxy.get(scheme)
+
+    def _timeouts(self, timeout=None):
+        total, connect, read = (
+            self._timeout, self._connect_timeout, self._read_timeout)
+        if timeout is not None:
+            total = min(total, timeout)
+            connect = min(connect, timeout)
+            read = min(read, timeout)
+        return aiohttp.ClientTimeout(total=total, connect=connect,
+                                     sock_read=read)
+
+    async def request(self, method, url, headers, post_data=None,
+                      timeout=None):
+        try:
+            async with self.session.request(
+                    method.upper(),
+                    url,
+                    headers=headers,
+                    data=post_data,
+                    proxy=self._proxy_for(url),
+                    timeout=self._timeouts(timeout)
+            ) as result:
+                content = await result.read()
+                status_code = result.status
+                resp_headers = result.headers
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._handle_request_error(e)
+        return content, status_code, resp_headers
+
+    def _handle_request_error(self, e):
+        msg = "Unexpected error communicating with Emburse."
+        err = "{0}: {1}".format(type(e).__name__, str(e))
+        msg = textwrap.fill(msg) + "\n\n(Network error: {0})".format(err)
+        raise error.EmburseAPIConnectionError(msg)
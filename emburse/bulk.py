@@ -0,0 +1,274 @@
+import collections
+import threading
+
+from emburse.concurrency import DEFAULT_CONCURRENCY, TaskRunner
+
+
+class BulkResult(object):
+    """
+    Bulk Result, outcome of a bulk operation such as Card.create_many.
+
+    The calls run in the background from the moment the operation starts.
+    Iterate over the result to handle each item as it completes, or call
+    wait() to block until the whole batch is done. Every loop over the
+    result sees every item, those completed before it started first. The
+    counts and lists below take in whatever has finished without waiting,
+    and cancel() stops the batch from starting calls on any more inputs.
+
+        >>> result = client.Card.create_many(specs, concurrency=8)
+        >>> for item in result:
+        ...     if not item.ok:
+        ...         print(item.item, item.error)
+        >>> cards = result.succeeded
+
+    Every item is an emburse.concurrency.TaskResult: `item` is the input it
+    was made from, `value` what the call returned and `error` what it
+    raised, if anything.
+
+    """
+
+    def __init__(self, inputs, runner):
+        """
+        Bulk Result
+
+        Args:
+            inputs (list): The inputs of the operation, in order.
+
+            runner (emburse.concurrency.TaskRunner): The started runner,
+                called with the index of each input.
+
+        """
+        self.inputs = inputs
+        self._runner = runner
+        self._lock = threading.Lock()
+        self._completed = []
+
+    def _collect(self, block):
+        # Takes the next finished item from the runner, the lock must be
+        # held.
+        task = self._runner.next_result(block=block)
+        if task is not None:
+            task.item = self.inputs[task.index]
+            self._completed.append(task)
+        return task
+
+    def __iter__(self):
+        position = 0
+        while True:
+            with self._lock:
+                if position < len(self._completed):
+                    task = self._completed[position]
+                else:
+                    task = self._collect(block=True)
+                    if task is None:
+                        return
+            position += 1
+            yield task
+
+    def poll(self):
+        """
+        Poll, takes in every item that has completed so far without
+        waiting for the others.
+
+        Returns:
+            self
+
+        """
+        with self._lock:
+            while self._collect(block=False) is not None:
+                pass
+        return self
+
+    def wait(self):
+        """
+        Wait, blocks until every item has completed, or every call started
+        before cancel() has.
+
+        Returns:
+            self
+
+        """
+        for _ in self:
+            pass
+        return self
+
+    def cancel(self):
+        """
+        Cancel, stops the batch from starting calls on any more inputs.
+        Calls already running finish and are reported as usual, inputs that
+        were never started are counted as 'cancelled'.
+
+        Returns:
+            self
+
+        """
+        self._runner.cancel()
+        return self
+
+    @property
+    def done(self):
+        """
+        Done, whether no call is running or left to start.
+        """
+        self.poll()
+        return self._runner.finished
+
+    @property
+    def completed(self):
+        """
+        Completed, the items completed so far, in the order they finished.
+        """
+        self.poll()
+        return list(self._completed)
+
+    @property
+    def results(self):
+        """
+        Results, the completed items in input order.
+        """
+        return sorted(self.completed, key=lambda task: task.index)
+
+    @property
+    def succeeded(self):
+        """
+        Succeeded, what each successful call returned, in input order.
+        """
+        return [task.value for task in self.results if task.ok]
+
+    @property
+    def failed(self):
+        """
+        Failed, the items whose call raised, in input order.
+        """
+        return [task for task in self.results if not task.ok]
+
+    @property
+    def ok(self):
+        return self.done and not self.failed and \
+            len(self._completed) == len(self.inputs)
+
+    def summary(self):
+        """
+        Summary, counts of the items so far.
+
+        Returns:
+            dict: The number of items 'total', 'succeeded', 'failed', still
+            'pending' and 'cancelled' without being started.
+
+        """
+        done = self.done
+        completed = len(self._completed)
+        failed = len([task for task in self._completed if not task.ok])
+        remaining = len(self.inputs) - completed
+        return {
+            'total': len(self.inputs),
+            'succeeded': completed - failed,
+            'failed': failed,
+            'pending': 0 if done else remaining,
+            'cancelled': remaining if done else 0,
+        }
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def __repr__(self):
+        completed = self.completed
+        return '<{0} total={1} completed={2} failed={3}>'.format(
+            type(self).__name__, len(self.inputs), len(completed),
+            len([task for task in completed if not task.ok]))
+
+
+class DeleteResult(BulkResult):
+    """
+    Delete Result, outcome of delete_many. The value of each deleted item is
+    True, or False if the api answered 404 because it was already gone.
+    Both count as succeeded.
+    """
+
+    @property
+    def already_deleted(self):
+        """
+        Already Deleted, the items that were gone before the delete, in input
+        order.
+        """
+        return [task for task in self.results if task.ok and not task.value]
+
+    def summary(self):
+        """
+        Summary, counts of the items so far.
+
+        Returns:
+            dict: As BulkResult.summary, plus the number 'already_deleted',
+            which are included in 'succeeded'.
+
+        """
+        summary = super(DeleteResult, self).summary()
+        summary['already_deleted'] = len(self.already_deleted)
+        return summary
+
+
+class RetrieveResult(collections.OrderedDict):
+    """
+    Retrieve Result, resources fetched by retrieve_many, an ordered dict
+    mapping each id found to its resource, in the order the ids were given.
+    Ids the api has no resource for are listed in `missing`, and ids that
+    could not be fetched for another reason are in `failed` with the error,
+    both in the same order.
+    """
+
+    def __init__(self, found=None, missing=None, failed=None):
+        """
+        Retrieve Result
+
+        Args:
+            found (dict, optional): Resources by id.
+
+            missing (list, optional): Ids the api answered 404 for.
+
+            failed (dict, optional): Errors by id.
+
+        """
+        super(RetrieveResult, self).__init__(found or ())
+        self.missing = missing or []
+        self.failed = collections.OrderedDict(failed or ())
+
+    @property
+    def ok(self):
+        return not self.missing and not self.failed
+
+    def __repr__(self):
+        return '<{0} found={1} missing={2} failed={3}>'.format(
+            type(self).__name__, len(self), len(self.missing),
+            len(self.failed))
+
+
+def run_bulk(func, inputs, concurrency=DEFAULT_CONCURRENCY,
+             rate_limiter=None, result_class=BulkResult):
+    """
+    Run Bulk, starts calling func for every input in the background.
+
+    Args:
+        func (callable): Called with the index of an input.
+
+        inputs (list): The inputs.
+
+        concurrency (int): Maximum number of calls running at once.
+
+        rate_limiter (emburse.ratelimit.TokenBucket, optional): Limiter a
+            token is taken from before each call, on top of the client's
+            own.
+
+        result_class (type): The BulkResult subclass returned.
+
+    Returns:
+        BulkResult
+
+    """
+    def call(index):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        return func(index)
+
+    runner = TaskRunner(call, range(len(inputs)), concurrency=concurrency,
+                        buffer_size=0)
+    return result_class(inputs, runner.start())
@@ -0,0 +1,208 @@
+import collections
+import threading
+
+import emburse.errors as error
+import emburse.util as util
+
+
+class CircuitBreaker(object):
+    """
+    Circuit Breaker
+
+    Sits between the Requestor and its HTTP client and stops sending requests
+    while the API is failing, so callers fail fast instead of each waiting
+    out the transport timeout.
+
+    The breaker keeps the outcome of the last `window_size` calls. Once at
+    least `minimum_calls` have been seen and either the share of failed
+    calls reaches `failure_rate_threshold` or the share of calls slower than
+    `slow_call_threshold` reaches `slow_call_rate_threshold`, the circuit
+    opens and every call raises EmburseCircuitOpenError. After `open_timeout`
+    seconds the circuit is half-open and lets `half_open_max_calls` trial
+    calls through, closing again if they all succeed and reopening if any
+    fails.
+
+    Connection errors and responses with a status in `failure_statuses`
+    count as failures.
+
+        >>> client = emburse.Client(
+        >>>     auth_token='abc123',
+        >>>     circuit_breaker=CircuitBreaker(slow_call_threshold=5.0)
+        >>> )
+
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_rate_threshold=0.5, slow_call_threshold=None,
+                 slow_call_rate_threshold=1.0, window_size=20,
+                 minimum_calls=10, open_timeout=30.0, half_open_max_calls=1,
+                 failure_statuses=(500, 502, 503, 504), on_state_change=None):
+        """
+        Circuit Breaker
+
+        Args:
+            failure_rate_threshold (float): Share of failed calls, 0 to 1,
+                that opens the circuit.
+
+            slow_call_threshold (float, optional): Seconds after which a call
+                counts as slow. Slow calls are not tracked if not given.
+
+            slow_call_rate_threshold (float): Share of slow calls, 0 to 1,
+                that opens the circuit.
+
+            window_size (int): Number of recent calls the rates are computed
+                over.
+
+            minimum_calls (int): Calls needed in the window before the
+                circuit can open.
+
+            open_timeout (float): Seconds the circuit stays open before
+                trial calls are let through.
+
+            half_open_max_calls (int): Trial calls let through while
+                half-open.
+
+            failure_statuses (tuple): HTTP statuses that count as failures.
+
+            on_state_change (callable, optional): Called with the breaker,
+                the old state and the new state on every transition.
+
+        """
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_size = window_size
+        self.minimum_calls = minimum_calls
+        self.open_timeout = open_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_statuses = tuple(failure_statuses)
+        self.on_state_change = on_state_change
+        self._calls = collections.deque(maxlen=window_size)
+        self._state = CircuitBreaker.CLOSED
+        self._opened_at = None
+        self._trial_calls = 0
+        self._trial_successes = 0
+        self._lock = threading.RLock()
+
+    @property
+    def state(self):
+        """
+        State, the current state of the circuit, closed, open or half-open.
+
+        Returns:
+            str: One of CLOSED, OPEN or HALF_OPEN.
+
+        """
+        with self._lock:
+            self._check_open_timeout()
+            return self._state
+
+    def _check_open_timeout(self):
+        if (self._state == CircuitBreaker.OPEN and
+                util.monotonic() - self._opened_at >= self.open_timeout):
+            self._transition(CircuitBreaker.HALF_OPEN)
+
+    def _transition(self, new_state):
+        old_state, self._state = self._state, new_state
+        if new_state == CircuitBreaker.OPEN:
+            self._opened_at = util.monotonic()
+        elif new_state == CircuitBreaker.HALF_OPEN:
+            self._trial_calls = 0
+            self._trial_successes = 0
+        elif new_state == CircuitBreaker.CLOSED:
+            self._calls.clear()
+        util.logger.warning(
+            'Emburse circuit breaker changed from {old} to {new}'.format(
+                old=old_state, new=new_state)
+        )
+        if self.on_state_change is not None:
+            self.on_state_change(self, old_state, new_state)
+
+    def before_call(self):
+        """
+        Before Call, checks that a call may be made.
+
+        Raises:
+            emburse.errors.EmburseCircuitOpenError: if the circuit is open, or
+                half-open with every trial call already in flight.
+
+        """
+        with self._lock:
+            self._check_open_timeout()
+            if self._state == CircuitBreaker.OPEN:
+                raise error.EmburseCircuitOpenError(
+                    'Circuit breaker is open, the Emburse API is failing. '
+                    'Retry in {0:.1f}s.'.format(
+                        max(self.open_timeout - (util.monotonic() - self._opened_at), 0.0))
+                )
+            if self._state == CircuitBreaker.HALF_OPEN:
+                if self._trial_calls >= self.half_open_max_calls:
+                    raise error.EmburseCircuitOpenError(
+                        'Circuit breaker is half-open and waiting on trial '
+                        'calls to the Emburse API.'
+                    )
+                self._trial_calls += 1
+
+    def release(self):
+        """
+        Release, gives back the trial slot taken by before_call for a call
+        that was never sent, e.g. because its deadline passed first.
+        """
+        with self._lock:
+            if self._state == CircuitBreaker.HALF_OPEN and self._trial_calls > 0:
+                self._trial_calls -= 1
+
+    def is_failure(self, status_code=None, error=None):
+        """
+        Is Failure, whether a call outcome counts as a failure.
+
+        Args:
+            status_code (int, optional): HTTP status of the response.
+
+            error (Exception, optional): Error raised by the transport.
+
+        Returns:
+            bool
+
+        """
+        return error is not None or status_code in self.failure_statuses
+
+    def record(self, elapsed, status_code=None, error=None):
+        """
+        Record, records the outcome of a call made after before_call.
+
+        Args:
+            elapsed (float): Seconds the call took.
+
+            status_code (int, optional): HTTP status of the response.
+
+            error (Exception, optional): Error raised by the transport.
+
+        """
+        failed = self.is_failure(status_code=status_code, error=error)
+        slow = (self.slow_call_threshold is not None and
+                elapsed >= self.slow_call_threshold)
+        with self._lock:
+            if self._state == CircuitBreaker.HALF_OPEN:
+                if failed or slow:
+                    self._transition(CircuitBreaker.OPEN)
+                else:
+                    self._trial_successes += 1
+                    if self._trial_successes >= self.half_open_max_calls:
+                        self._transition(CircuitBreaker.CLOSED)
+                return
+            if self._state != CircuitBreaker.CLOSED:
+                return
+            self._calls.append((failed, slow))
+            if len(self._calls) < self.minimum_calls:
+                return
+            calls = float(len(self._calls))
+            failure_rate = sum(1 for f, s in self._calls if f) / calls
+            slow_rate = sum(1 for f, s in self._calls if s) / calls
+            if (failure_rate >= self.failure_rate_threshold or
+                    (self.slow_call_threshold is not None and
+                     slow_rate >= self.slow_call_rate_threshold)):
+                self._transition(CircuitBreaker.OPEN)
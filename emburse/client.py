@@ -1,3 +1,4 @@
+from emburse.context import ClientContext
 from emburse.resource import (
     EmburseObject,
     Account,
@@ -32,122 +33,190 @@ class Client(EmburseObject):
         
     """
 
+    def __init__(self, auth_token, proxy=None, verify_ssl_certs=True,
+                 http_client=None, retry_policy=None, rate_limiter=None,
+                 circuit_breaker=None, lazy=False, json_codec=None, **kwargs):
+        """
+        Emburse API Client
+
+        Every resource returned by the client, and every object hydrated from
+        their responses, shares the client's context and so a single
+        Requestor and HTTP connection pool.
+
+        Args:
+            auth_token (str): Your application's auth token from
+                https://app.emburse.com/applications
+
+            proxy (str|dict, optional): Proxy URL(s) for the HTTP client.
+
+            verify_ssl_certs (bool): Verify the API's SSL certificate.
+
+            http_client (emburse.http_client.HTTPClient, optional): Transport
+                to use, if not given the default HTTP client is built.
+
+            retry_policy (emburse.retry.RetryPolicy, optional): Policy for
+                retrying failed calls, by default calls are not retried.
+
+            rate_limiter (emburse.ratelimit.TokenBucket, optional): Limiter
+                shared by every request of the client, across threads.
+
+            circuit_breaker (emburse.circuit.CircuitBreaker, optional):
+                Breaker that fails calls fast while the API is failing.
+
+            lazy (bool): Convert the fields of returned resources the first
+                time they are read instead of up front. Cheaper when only a
+                few fields of many objects are used.
+
+            json_codec (str|emburse.codec.JSONCodec, optional): JSON codec,
+                e.g. 'orjson' or 'auto' for the fastest installed, defaults
+                to emburse.codec's default codec, the stdlib json.
+
+        """
+        context = ClientContext(
+            auth_token,
+            proxy=proxy,
+            verify_ssl_certs=verify_ssl_certs,
+            http_client=http_client,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            lazy=lazy,
+            json_codec=json_codec
+        )
+        super(Client, self).__init__(
+            auth_token=auth_token,
+            context=context,
+            **kwargs
+        )
+
+    def close(self):
+        """
+        Close, releases the pooled connections held by the client.
+        """
+        self.context.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     @property
     def Account(self):
         """
         Emburse Account Object,
-        configured with the auth token from the client
+        configured with the client's shared context
         :return: A configured emburse.resource.Account
         :rtype: Account
         """
-        return Account(auth_token=self.auth_token)
+        return Account(auth_token=self.auth_token, context=self.context)
 
     @property
     def Allowance(self):
         """
         Emburse Allowance Object,
-        configured with the auth token from the client
+        configured with the client's shared context
         :return: A configured emburse.resource.Allowance
         :rtype: Allowance
         """
-        return Allowance(auth_token=self.auth_token)
+        return Allowance(auth_token=self.auth_token, context=self.context)
 
     @property
     def Card(self):
         """
         Emburse Card Object,
-        configured with the auth token from the client
+        configured with the client's shared context
         :return: A configured emburse.resource.Card
         :rtype: Card
         """
-        return Card(auth_token=self.auth_token)
+        return Card(auth_token=self.auth_token, context=self.context)
 
     @property
     def Category(self):
         """
         Emburse Category Object,
-        configured with the auth token from the client
+        configured with the client's shared context
         :return: A configured emburse.resource.Category
         :rtype: Category
         """
-        return Category(auth_token=self.auth_token)
+        return Category(auth_token=self.auth_token, context=self.context)
 
     @property
     def Company(self):
         """
         Emburse Company Object,
-        configured with the auth token from the client
+        configured with the client's shared context
         :return: A configured emburse.resource.Company
         :rtype: Company
         """
-        return Company(auth_token=self.auth_token)
+        return Company(auth_token=self.auth_token, context=self.context)
 
     @property
     def Department(self):
         """
         Emburse Department Object,
-        configured with the auth token from the client
+        configured with the client's shared context
         :return: A configured emburse.resource.Department
         :rtype: Department
         """
-        return Department(auth_token=self.auth_token)
+        return Department(auth_token=self.auth_token, context=self.context)
 
     @property
     def Label(self):
         """
         Emburse Label Object,
-        configured with the auth token from the client
+        configured with the client's shared context
         :return: A configured emburse.resource.Label
         :rtype: Label
         """
-        return Label(auth_token=self.auth_token)
+        return Label(auth_token=self.auth_token, context=self.context)
 
     @property
     def Location(self):
         """
         Emburse Location Object,
-        configured with the auth token from the client
+        configured with the client's shared context
         :return: A configured emburse.resource.Location
         :rtype: Location
         """
-        return Location(auth_token=self.auth_token)
+        return Location(auth_token=self.auth_token, context=self.context)
 
     @property
     def Member(self):
         """
         Emburse Member Object,
-        configured with the auth token from the client
+        configured with the client's shared context
         :return: A configured emburse.resource.Member
         :rtype: Member
         """
-        return Member(auth_token=self.auth_token)
+        return Member(auth_token=self.auth_token, context=self.context)
 
     @property
     def SharedLink(self):
         """
         Emburse SharedLink Object,
-        configured with the auth token from the client
+        configured with the client's shared context
         :return: A configured emburse.resource.SharedLink
         :rtype: SharedLink
         """
-        return SharedLink(auth_token=self.auth_token)
+        return SharedLink(auth_token=self.auth_token, context=self.context)
 
     @property
     def Statement(self):
         """
         Emburse Statement Object,
-        configured with the auth token from the client
+        configured with the client's shared context
         :return: A configured emburse.resource.Statement
         :rtype: Statement
         """
-        return Statement(auth_token=self.auth_token)
+        return Statement(auth_token=self.auth_token, context=self.context)
 
     @property
     def Transaction(self):
         """
         Emburse Transaction Object,
-        configured with the auth token from the client
+        configured with the client's shared context
         :return: A configured emburse.resource.Transaction
         :rtype: Transaction
         """
-        return Transaction(auth_token=self.auth_token)
+        return Transaction(auth_token=self.auth_token, context=self.context)
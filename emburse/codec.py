@@ -0,0 +1,190 @@
+import sys
+
+import emburse.errors as error
+import emburse.util as util
+
+# - The stdlib json (or simplejson, see emburse.util) is always available
+# - orjson, msgspec and ujson are used when installed and selected
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JSONCodec(object):
+    """
+    JSON Codec, encodes request bodies and decodes response bodies. This one
+    uses the stdlib json module, or simplejson where emburse.util picked it.
+
+    Codecs decode bytes as well as text, so a response body can be handed
+    over as it came off the wire, and encode to text.
+
+    """
+
+    name = 'json'
+
+    def loads(self, data):
+        """
+        Loads, decodes a JSON document.
+
+        Args:
+            data (bytes|str): UTF-8 encoded or text JSON.
+
+        Returns:
+            The decoded value.
+
+        Raises:
+            ValueError: if data is not valid JSON.
+
+        """
+        if (3, 0) <= sys.version_info < (3, 6) and isinstance(data, bytes):
+            data = data.decode('utf-8')
+        return util.json.loads(data)
+
+    def dumps(self, value):
+        """
+        Dumps, encodes a value as JSON.
+
+        Args:
+            value: The value to encode.
+
+        Returns:
+            str: The JSON document.
+
+        """
+        return util.json.dumps(value)
+
+    def __repr__(self):
+        return '<{0} {1}>'.format(type(self).__name__, self.name)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Orjson Codec, JSON codec backed by orjson.
+    """
+
+    name = 'orjson'
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+    def dumps(self, value):
+        return orjson.dumps(value).decode('utf-8')
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    Msgspec Codec, JSON codec backed by msgspec.json.
+    """
+
+    name = 'msgspec'
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data):
+        return self._decoder.decode(data)
+
+    def dumps(self, value):
+        return self._encoder.encode(value).decode('utf-8')
+
+
+class UjsonCodec(JSONCodec):
+    """
+    Ujson Codec, JSON codec backed by ujson.
+    """
+
+    name = 'ujson'
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+    def dumps(self, value):
+        return ujson.dumps(value)
+
+
+_codecs = [
+    (OrjsonCodec, lambda: orjson is not None),
+    (MsgspecCodec, lambda: msgspec is not None),
+    (UjsonCodec, lambda: ujson is not None),
+    (JSONCodec, lambda: True),
+]
+
+_default = JSONCodec()
+
+
+def available_codecs():
+    """
+    Available Codecs, names of the JSON codecs that can be used here.
+
+    Returns:
+        list: Codec names, fastest first.
+
+    """
+    return [klass.name for klass, available in _codecs if available()]
+
+
+def get_codec(codec=None):
+    """
+    Get Codec, resolves a JSON codec.
+
+    Args:
+        codec (str|JSONCodec, optional): A codec, or the name of one: 'json',
+            'orjson', 'msgspec', 'ujson', or 'auto' for the fastest one
+            installed. Defaults to the codec set with set_default_codec,
+            the stdlib json unless changed.
+
+    Returns:
+        JSONCodec
+
+    Raises:
+        emburse.errors.EmburseNotImplementedError: if the named codec's
+            library is not installed.
+
+        emburse.errors.EmburseValueError: if the name is not a known codec.
+
+    """
+    if codec is None:
+        return _default
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == 'auto':
+        codec = available_codecs()[0]
+    for klass, available in _codecs:
+        if klass.name == codec:
+            if not available():
+                raise error.EmburseNotImplementedError(
+                    'The "{0}" JSON codec requires the "{0}" library. HINT: '
+                    'install it with "pip install {0}".'.format(codec)
+                )
+            return klass()
+    raise error.EmburseValueError(
+        'Unknown JSON codec {0!r}, expected one of {1}.'.format(
+            codec, ', '.join(klass.name for klass, _ in _codecs))
+    )
+
+
+def set_default_codec(codec):
+    """
+    Set Default Codec, sets the JSON codec used by requestors that were not
+    given one.
+
+        >>> emburse.codec.set_default_codec('auto')
+
+    Args:
+        codec (str|JSONCodec): A codec or the name of one, see get_codec.
+
+    """
+    global _default
+    _default = get_codec(codec)
@@ -0,0 +1,185 @@
+import re
+import threading
+
+import emburse.fields as field
+
+
+class CompactResource(object):
+    """
+    Compact Resource
+
+    Memory lean, read only form of an api resource for holding many objects
+    at once, e.g. a year of transactions for reconciliation. Instances are
+    slotted: the id, url and the fields in the resource's schema each get a
+    slot, any other values are kept together in `extra`, and the only other
+    state is a reference to the shared client context.
+
+        >>> transactions = client.Transaction.list(compact=True)
+        >>> total = sum(t.amount for t in transactions)
+
+    Use to_resource() to get the full resource, e.g. to update it.
+
+    """
+
+    __slots__ = ('context', 'extra')
+
+    #: The emburse.resource.APIResource subclass this is a compact form of
+    resource_class = None
+
+    #: Names of the slots holding the resource's fields
+    field_names = ()
+
+    def __init__(self, context, values):
+        """
+        Compact Resource
+
+        Args:
+            context (emburse.context.ClientContext): Shared client context.
+
+            values (dict): The resource's values from the api.
+
+        """
+        self.context = context
+        self.extra = None
+        schema = self.resource_class.fields or {}
+        for name in self.field_names:
+            setattr(self, name, None)
+        for name, value in values.items():
+            decoder = schema.get(name)
+            if isinstance(decoder, field.Resource):
+                value = compact(
+                    value,
+                    decoder.klass_name or self.resource_class.class_name(),
+                    context
+                )
+            elif decoder is not None:
+                value = decoder.decode(value, None)
+            if name in self.field_names:
+                setattr(self, name, value)
+            else:
+                if self.extra is None:
+                    self.extra = {}
+                self.extra[name] = value
+
+    def __getattr__(self, name):
+        # Only called for names without a slot, look in the extra values.
+        if name in CompactResource.__slots__:
+            raise AttributeError(name)
+        extra = self.extra
+        if extra is None or name not in extra:
+            raise AttributeError(
+                "'{0}' object has no attribute '{1}'".format(
+                    type(self).__name__, name)
+            )
+        return extra[name]
+
+    @property
+    def auth_token(self):
+        return self.context.auth_token
+
+    def as_dict(self):
+        """
+        As Dict, converts the compact resource to a dictionary.
+
+        Returns:
+            dict: The resource's values, nested resources as dictionaries.
+
+        """
+        values = {}
+        for name in self.field_names:
+            value = getattr(self, name)
+            if value is not None:
+                values[name] = value
+        if self.extra:
+            values.update(self.extra)
+        for name, value in values.items():
+            if isinstance(value, CompactResource):
+                values[name] = value.as_dict()
+            elif isinstance(value, list):
+                values[name] = [
+                    item.as_dict() if isinstance(item, CompactResource)
+                    else item
+                    for item in value
+                ]
+        return values
+
+    def to_resource(self):
+        """
+        To Resource, builds the full resource from the compact form.
+
+        Returns:
+            emburse.resource.APIResource: The resource, sharing the context.
+
+        """
+        return self.resource_class.construct_from(
+            self.as_dict(), self.context.auth_token, context=self.context)
+
+    def __repr__(self):
+        return "<{0} id='{1}'>".format(type(self).__name__, self.id)
+
+
+_classes = {}
+
+_classes_lock = threading.Lock()
+
+
+def compact_class(resource_class):
+    """
+    Compact Class, the CompactResource subclass for a resource class, built
+    from the resource's schema on first use.
+
+    Args:
+        resource_class (type): An emburse.resource.APIResource subclass.
+
+    Returns:
+        type: The compact class.
+
+    """
+    klass = _classes.get(resource_class)
+    if klass is None:
+        with _classes_lock:
+            klass = _classes.get(resource_class)
+            if klass is None:
+                names = ['id', 'url']
+                names.extend(sorted(
+                    name for name in (resource_class.fields or {})
+                    if name not in names
+                ))
+                klass = type(
+                    'Compact{0}'.format(resource_class.__name__),
+                    (CompactResource,),
+                    {
+                        '__slots__': tuple(names),
+                        'resource_class': resource_class,
+                        'field_names': tuple(names),
+                    }
+                )
+                _classes[resource_class] = klass
+    return klass
+
+
+def compact(values, klass_name, context):
+    """
+    Compact, builds compact resources from api response data.
+
+    Args:
+        values: A dict of resource values, or a list of them. Anything else
+            is returned as it is.
+
+        klass_name (str): Name of the resource, e.g. 'transaction'.
+
+        context (emburse.context.ClientContext): Shared client context.
+
+    Returns:
+        A CompactResource, a list of them, or values unchanged.
+
+    """
+    if isinstance(values, list):
+        return [compact(item, klass_name, context) for item in values]
+    if not isinstance(values, dict):
+        return values
+    from emburse.resource import RESOURCE_TYPES
+    resource_class = RESOURCE_TYPES.get(re.sub('[^a-zA-Z]', '', klass_name))
+    if resource_class is None:
+        return values
+    return compact_class(resource_class)(context, values)
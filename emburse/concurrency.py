@@ -0,0 +1,268 @@
+import collections
+import threading
+import time
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+#: Number of calls run at once by the bulk helpers unless told otherwise
+DEFAULT_CONCURRENCY = 8
+
+
+class TaskResult(object):
+    """
+    Task Result, outcome of calling a function on one item in run_tasks.
+    """
+
+    def __init__(self, index, item, value=None, error=None, elapsed=0.0):
+        """
+        Task Result
+
+        Args:
+            index (int): Position of the item in the input.
+
+            item: The input item.
+
+            value: What the function returned, None if it raised.
+
+            error (Exception, optional): What the function raised.
+
+            elapsed (float): Seconds the call took.
+
+        """
+        self.index = index
+        self.item = item
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        return '<{0} index={1} ok={2} elapsed={3:.3f}>'.format(
+            type(self).__name__, self.index, self.ok, self.elapsed)
+
+
+class TaskRunner(object):
+    """
+    Task Runner, pool of worker threads calling a function on every item of
+    an input. Items are taken from the iterable as workers become free, so
+    a large or lazy input is never read ahead of the work. An exception
+    raised by the function is captured in that item's TaskResult rather than
+    stopping the others.
+
+    Most callers want run_tasks, which runs a pool for the length of a loop.
+
+    """
+
+    def __init__(self, func, items, concurrency=DEFAULT_CONCURRENCY,
+                 ordered=False, buffer_size=None):
+        """
+        Task Runner
+
+        Args:
+            func (callable): Called with one item.
+
+            items (iterable): The inputs.
+
+            concurrency (int): Maximum number of calls running at once.
+
+            ordered (bool): Yield results in the order of the input instead
+                of the order they finish in.
+
+            buffer_size (int, optional): Maximum finished results waiting to
+                be taken, once reached the workers block until the caller
+                catches up. Defaults to twice the concurrency, 0 for no
+                limit.
+
+        """
+        self.func = func
+        self.concurrency = max(int(concurrency), 1)
+        self.ordered = ordered
+        if buffer_size is None:
+            buffer_size = self.concurrency * 2
+        self._source = enumerate(items)
+        self._source_lock = threading.Lock()
+        self._results = queue.Queue(maxsize=buffer_size)
+        self._stop = threading.Event()
+        self._cancel = threading.Event()
+        self._done = object()
+        self._workers = []
+        self._running = 0
+        self._pending = {}
+        self._ready = collections.deque()
+        self._next_index = 0
+
+    def start(self):
+        """
+        Start, starts the worker threads.
+
+        Returns:
+            self
+
+        """
+        for number in range(self.concurrency):
+            worker = threading.Thread(
+                target=self._work, name='emburse-worker-{0}'.format(number))
+            worker.daemon = True
+            self._workers.append(worker)
+        self._running = len(self._workers)
+        for worker in self._workers:
+            worker.start()
+        return self
+
+    @property
+    def finished(self):
+        """
+        Finished, whether every worker has exited and every result has been
+        taken.
+        """
+        return not self._running and not self._ready
+
+    def next_result(self, block=True):
+        """
+        Next Result, takes the next outcome, as the calls finish or in input
+        order if the runner is ordered. Results are taken by one caller at a
+        time.
+
+        Args:
+            block (bool): Wait for a call to finish if no result is ready.
+
+        Returns:
+            TaskResult: The next result, or None once every item is done or,
+            without block, when none is ready yet.
+
+        Raises:
+            Exception: Whatever reading the input raised.
+
+        """
+        while True:
+            if self._ready:
+                return self._ready.popleft()
+            if not self._running:
+                return None
+            try:
+                result = self._results.get(block=block)
+            except queue.Empty:
+                return None
+            if result is self._done:
+                self._running -= 1
+                continue
+            if result.index is None:
+                raise result.error
+            if not self.ordered:
+                return result
+            self._pending[result.index] = result
+            while self._next_index in self._pending:
+                self._ready.append(self._pending.pop(self._next_index))
+                self._next_index += 1
+
+    def results(self):
+        """
+        Results, generator of the outcomes as the calls finish, or in input
+        order if the runner is ordered. Ends once every item is done.
+
+        Returns:
+            generator: A TaskResult per item.
+
+        Raises:
+            Exception: Whatever reading the input raised.
+
+        """
+        while True:
+            result = self.next_result()
+            if result is None:
+                return
+            yield result
+
+    def cancel(self):
+        """
+        Cancel, stops the workers from starting calls on any more items.
+        Calls already running finish and their results are still reported.
+        """
+        self._cancel.set()
+
+    def stop(self):
+        """
+        Stop, makes the workers stop after their current calls, discarding
+        results no one has taken.
+        """
+        self._stop.set()
+
+    def _put(self, result):
+        while not self._stop.is_set():
+            try:
+                self._results.put(result, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _take(self):
+        with self._source_lock:
+            return next(self._source, None)
+
+    def _work(self):
+        try:
+            while not self._stop.is_set() and not self._cancel.is_set():
+                try:
+                    task = self._take()
+                except Exception as e:
+                    # Reading the input failed, report it and stop.
+                    self._put(TaskResult(None, None, error=e))
+                    self._stop.set()
+                    return
+                if task is None:
+                    return
+                index, item = task
+                started = time.time()
+                try:
+                    result = TaskResult(index, item, value=self.func(item))
+                except Exception as e:
+                    result = TaskResult(index, item, error=e)
+                result.elapsed = time.time() - started
+                if not self._put(result):
+                    return
+        finally:
+            self._put(self._done)
+
+
+def run_tasks(func, items, concurrency=DEFAULT_CONCURRENCY, ordered=False):
+    """
+    Run Tasks, calls func on every item from a pool of worker threads and
+    yields the outcomes as the calls finish.
+
+    Workers start when iteration starts. Finished results wait in a small
+    buffer until the caller takes them; once it is full the workers block,
+    so a slow consumer holds back the calls instead of letting results pile
+    up. Closing the generator stops the workers after their current calls.
+
+        >>> for result in run_tasks(card.retrieve, ids, concurrency=4):
+        >>>     print(result.item, result.value if result.ok else result.error)
+
+    Args:
+        func (callable): Called with one item.
+
+        items (iterable): The inputs, read as workers become free.
+
+        concurrency (int): Maximum number of calls running at once.
+
+        ordered (bool): Yield results in the order of the input instead of
+            the order they finish in.
+
+    Returns:
+        generator: A TaskResult per item, errors raised by func are captured
+        in it.
+
+    """
+    runner = TaskRunner(func, items, concurrency=concurrency, ordered=ordered)
+    runner.start()
+    try:
+        for result in runner.results():
+            yield result
+    finally:
+        runner.stop()
@@ -0,0 +1,109 @@
+import threading
+from emburse.requestor import Requestor
+
+
+class ClientContext(object):
+    """
+    Client Context
+
+    Holds the state shared by a Client and every resource built from it, the
+    auth token, the transport configuration and a single Requestor. Resources
+    and the objects hydrated from their responses keep a reference to the
+    context instead of building their own Requestor and HTTP client, so they
+    are cheap to create and share one connection pool.
+
+    """
+
+    def __init__(self, auth_token, proxy=None, verify_ssl_certs=True,
+                 http_client=None, requestor=None, retry_policy=None,
+                 rate_limiter=None, circuit_breaker=None, lazy=False,
+                 json_codec=None):
+        """
+        Client Context
+
+        Args:
+            auth_token (str): Your application's auth token from
+                https://app.emburse.com/applications
+
+            proxy (str|dict, optional): Proxy URL(s) for the HTTP client.
+
+            verify_ssl_certs (bool): Verify the API's SSL certificate.
+
+            http_client (emburse.http_client.HTTPClient, optional): Transport
+                to use, if not given the default HTTP client is built.
+
+            requestor (emburse.requestor.Requestor, optional): Requestor to
+                use, if not given one is built on first use.
+
+            retry_policy (emburse.retry.RetryPolicy, optional): Policy for
+                retrying failed calls, by default calls are not retried.
+
+            rate_limiter (emburse.ratelimit.TokenBucket, optional): Limiter
+                shared by every request made through the context.
+
+            circuit_breaker (emburse.circuit.CircuitBreaker, optional):
+                Breaker shared by every request made through the context.
+
+            lazy (bool): Keep the raw response data of resources and convert
+                each field the first time it is read.
+
+            json_codec (str|emburse.codec.JSONCodec, optional): JSON codec
+                of the requestor, defaults to emburse.codec's default codec.
+
+        """
+        self.auth_token = auth_token
+        self.proxy = proxy
+        self.verify_ssl_certs = verify_ssl_certs
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.lazy = lazy
+        self.json_codec = json_codec
+        self._http_client = http_client
+        self._requestor = requestor
+        self._lock = threading.Lock()
+
+    @property
+    def requestor(self):
+        """
+        Requestor, the Requestor shared by everything using this context,
+        built on first use.
+
+        Returns:
+            emburse.requestor.Requestor
+
+        """
+        if self._requestor is None:
+            with self._lock:
+                if self._requestor is None:
+                    self._requestor = self.build_requestor()
+        return self._requestor
+
+    def build_requestor(self):
+        """
+        Build Requestor, creates the Requestor for this context.
+
+        Returns:
+            emburse.requestor.Requestor
+
+        """
+        return Requestor(
+            token=self.auth_token,
+            proxy=self.proxy,
+            client=self._http_client,
+            verify_ssl_certs=self.verify_ssl_certs,
+            retry_policy=self.retry_policy,
+            rate_limiter=self.rate_limiter,
+            circuit_breaker=self.circuit_breaker,
+            json_codec=self.json_codec
+        )
+
+    def close(self):
+        """
+        Close, releases the pooled connections of the shared transport. A
+        transport passed in by the caller is left open.
+        """
+        with self._lock:
+            requestor, self._requestor = self._requestor, None
+        if requestor is not None:
+            requestor.close()
@@ -0,0 +1,140 @@
+import emburse.errors as error
+import emburse.util as util
+from emburse.concurrency import run_tasks
+
+
+def split_date_range(start_date, end_date, windows):
+    """
+    Split Date Range, splits [start_date, end_date] into contiguous windows
+    of equal length, so one long query can be sent as several smaller ones.
+
+    Each window ends where the next one starts. The edges are the UTC
+    datetimes Requestor.encode_datetime would send, so the first start and
+    the last end are encoded exactly as they are for a single request.
+
+        >>> split_date_range(datetime(2017, 1, 1), datetime(2017, 1, 5), 2)
+        [(2017-01-01 00:00+00:00, 2017-01-03 00:00+00:00),
+         (2017-01-03 00:00+00:00, 2017-01-05 00:00+00:00)]
+
+    Args:
+        start_date (datetime.datetime): Start of the range.
+
+        end_date (datetime.datetime): End of the range.
+
+        windows (int): Number of windows, fewer are returned if the range
+            is too short to split into that many.
+
+    Returns:
+        list: (start, end) tuples of datetimes, in order.
+
+    Raises:
+        emburse.errors.EmburseValueError: if end_date is before start_date or
+            windows is less than 1.
+
+    """
+    start = util.to_utc(start_date)
+    end = util.to_utc(end_date)
+    if end < start:
+        raise error.EmburseValueError(
+            'End date {0} is before start date {1}.'.format(end, start))
+    if windows < 1:
+        raise error.EmburseValueError(
+            'At least one window is needed, {0} was given.'.format(windows))
+    span = end - start
+    step = span // windows
+    if not step:
+        return [(start, end)]
+    edges = [start + step * i for i in range(windows)] + [end]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def fetch_windows(fetch, start_date, end_date, windows, concurrency=None):
+    """
+    Fetch Windows, splits a date range and calls fetch for every window in
+    parallel, returning the results in date order.
+
+    Args:
+        fetch (callable): Called with the start and end of a window.
+
+        start_date (datetime.datetime): Start of the range.
+
+        end_date (datetime.datetime): End of the range.
+
+        windows (int): Number of windows to split the range into.
+
+        concurrency (int, optional): Maximum windows fetched at once,
+            defaults to one per window.
+
+    Returns:
+        list: What fetch returned for each window, earliest first.
+
+    Raises:
+        Exception: The first error raised by fetch, the merged result of a
+            range with a window missing would be wrong.
+
+    """
+    ranges = split_date_range(start_date, end_date, windows)
+    results = []
+    for task in run_tasks(lambda window: fetch(*window), ranges,
+                          concurrency=concurrency or len(ranges),
+                          ordered=True):
+        if not task.ok:
+            raise task.error
+        results.append(task.value)
+    return results
+
+
+def merge_csv(bodies):
+    """
+    Merge CSV, joins CSV documents for consecutive windows, keeping the
+    header row of the first one only.
+
+    Args:
+        bodies (list): The CSV documents as text, in order.
+
+    Returns:
+        str: One CSV document.
+
+    """
+    merged = []
+    header = None
+    for body in bodies:
+        lines = body.splitlines(True)
+        if not lines:
+            continue
+        if header is None:
+            header = lines[0]
+        elif lines[0].rstrip('\r\n') == header.rstrip('\r\n'):
+            lines = lines[1:]
+        if merged and lines and not merged[-1].endswith('\n'):
+            merged[-1] += '\n'
+        merged.extend(lines)
+    return ''.join(merged)
+
+
+def merge_unique(pages, key='id'):
+    """
+    Merge Unique, joins lists of objects for consecutive windows, dropping
+    objects already seen, e.g. ones on the edge between two windows.
+
+    Args:
+        pages (list): Lists of dictionaries, in order.
+
+        key (str): Key identifying an object.
+
+    Returns:
+        list: The objects in order, each once. Objects without the key are
+        all kept.
+
+    """
+    seen = set()
+    merged = []
+    for page in pages:
+        for item in page:
+            identifier = item.get(key)
+            if identifier is not None:
+                if identifier in seen:
+                    continue
+                seen.add(identifier)
+            merged.append(item)
+    return merged
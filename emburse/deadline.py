@@ -0,0 +1,84 @@
+import emburse.errors as error
+import emburse.util as util
+
+
+class Deadline(object):
+    """
+    Deadline
+
+    Time budget for one logical call. The same Deadline is handed down to
+    every request the call makes, its retries and every page of a listing,
+    and each of them only gets the time that is left, so a call stops at
+    the budget instead of after the transport timeout of every request.
+
+        >>> cards = client.Card.list(deadline=5.0)
+        >>> deadline = Deadline(30)
+        >>> for transaction in client.Transaction.iter(deadline=deadline):
+        >>>     ...
+
+    """
+
+    def __init__(self, seconds):
+        """
+        Deadline
+
+        Args:
+            seconds (float): Budget in seconds, starting now.
+
+        """
+        self.seconds = float(seconds)
+        self.expires_at = util.monotonic() + self.seconds
+
+    @classmethod
+    def coerce(cls, value):
+        """
+        Coerce, builds a Deadline from a number of seconds, passes Deadline
+        instances and None through.
+
+        Args:
+            value (Deadline|float|None): The deadline or budget in seconds.
+
+        Returns:
+            Deadline: or None if value is None.
+
+        """
+        if value is None or isinstance(value, Deadline):
+            return value
+        return cls(value)
+
+    def remaining(self):
+        """
+        Remaining, seconds left before the deadline.
+
+        Returns:
+            float: Seconds left, 0 once the deadline has passed.
+
+        """
+        return max(self.expires_at - util.monotonic(), 0.0)
+
+    @property
+    def expired(self):
+        return self.remaining() <= 0
+
+    def check(self):
+        """
+        Check, raises if the deadline has passed.
+
+        Returns:
+            float: Seconds left.
+
+        Raises:
+            emburse.errors.EmburseDeadlineExceededError: if the deadline has
+                passed.
+
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise error.EmburseDeadlineExceededError(
+                'Deadline of {0:.3f}s exceeded.'.format(self.seconds)
+            )
+        return remaining
+
+    def __repr__(self):
+        return '<Deadline {0:.3f}s remaining of {1:.3f}s>'.format(
+            self.remaining(), self.seconds)
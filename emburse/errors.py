@@ -59,7 +59,11 @@ class EmburseInvalidRequestError(EmburseError):
     """
     Emburse Invalid Request Error
     """
-    pass
+    def __init__(self, message=None, param=None, http_body=None,
+                 http_status=None, json_body=None, headers=None):
+        super(EmburseInvalidRequestError, self).__init__(
+            message, http_body, http_status, json_body, headers)
+        self.param = param
 
 
 class EmburseResourceError(EmburseError):
@@ -82,3 +86,19 @@ class EmburseAuthenticationError(EmburseError):
 
 class EmbursePermissionError(EmburseError):
     pass
+
+
+class EmburseCircuitOpenError(EmburseAPIConnectionError):
+    """
+    Emburse Circuit Open Error, raised without contacting the API while the
+    client's circuit breaker is open.
+    """
+    pass
+
+
+class EmburseDeadlineExceededError(EmburseAPIConnectionError):
+    """
+    Emburse Deadline Exceeded Error, raised when a call's deadline runs out
+    before the API answered.
+    """
+    pass
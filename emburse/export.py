@@ -0,0 +1,241 @@
+import os
+import time
+
+import emburse.http_client as http_client
+
+
+class ExportResult(object):
+    """
+    Export Result, outcome of writing an exported file, e.g. a statement
+    written by Statement.export_to.
+    """
+
+    def __init__(self, path, bytes_written, elapsed, file_format=None,
+                 error=None, skipped=False, key=None):
+        """
+        Export Result
+
+        Args:
+            path (str): Path of the written file, None when written to a file
+                object.
+
+            bytes_written (int): Size of the body written.
+
+            elapsed (float): Seconds from sending the request to the last
+                byte being written.
+
+            file_format (str, optional): Format of the export, e.g. 'pdf'.
+
+            error (Exception, optional): Error that stopped the export.
+
+            skipped (bool): True if the file already existed and was not
+                downloaded again.
+
+            key (optional): What was exported, e.g. the account id for a
+                statement from Statement.export_many.
+
+        """
+        self.path = path
+        self.bytes_written = bytes_written
+        self.elapsed = elapsed
+        self.file_format = file_format
+        self.error = error
+        self.skipped = skipped
+        self.key = key
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        return '<{0} path={1!r} bytes_written={2} elapsed={3:.3f}>'.format(
+            type(self).__name__, self.path, self.bytes_written, self.elapsed)
+
+
+class ExportReport(object):
+    """
+    Export Report, outcome of a bulk export, one ExportResult per file.
+    """
+
+    def __init__(self, results, elapsed):
+        """
+        Export Report
+
+        Args:
+            results (list): ExportResult objects, in the order requested.
+
+            elapsed (float): Seconds the whole export took.
+
+        """
+        self.results = results
+        self.elapsed = elapsed
+
+    @property
+    def exported(self):
+        """
+        Exported, results of the files downloaded by this export.
+        """
+        return [r for r in self.results if r.ok and not r.skipped]
+
+    @property
+    def skipped(self):
+        """
+        Skipped, results of the files that were already complete.
+        """
+        return [r for r in self.results if r.skipped]
+
+    @property
+    def failed(self):
+        """
+        Failed, results of the files that could not be exported.
+        """
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def ok(self):
+        return not self.failed
+
+    @property
+    def bytes_written(self):
+        return sum(r.bytes_written for r in self.results)
+
+    def __repr__(self):
+        return '<{0} exported={1} skipped={2} failed={3} elapsed={4:.3f}>'.format(
+            type(self).__name__, len(self.exported), len(self.skipped),
+            len(self.failed), self.elapsed)
+
+
+def statement_filename(account_id, start_date=None, end_date=None,
+                       file_format='csv'):
+    """
+    Statement Filename, the file name a statement export is saved under. The
+    same arguments always give the same name, so an interrupted bulk export
+    can be resumed.
+
+    Args:
+        account_id (str): ID of the account.
+
+        start_date (datetime, optional): Start of the statement's range.
+
+        end_date (datetime, optional): End of the statement's range.
+
+        file_format (str): Format of the statement.
+
+    Returns:
+        str: e.g. 'statement_<account_id>_20170501_20170531.pdf'
+
+    """
+    return 'statement_{0}_{1}_{2}.{3}'.format(
+        account_id,
+        start_date.strftime('%Y%m%d') if start_date else 'default',
+        end_date.strftime('%Y%m%d') if end_date else 'default',
+        file_format
+    )
+
+
+def part_path(path):
+    """
+    Part Path, the temporary path a file is written to before it is
+    complete.
+
+    Args:
+        path (str): Final path of the file.
+
+    Returns:
+        str: The path with a '.part' suffix.
+
+    """
+    return '{0}.part'.format(path)
+
+
+def replace_file(source, destination):
+    """
+    Replace File, moves a file over another in one step where the platform
+    allows it.
+
+    os.replace is atomic on Python 3.3 and later. Before that os.rename is
+    used, which only replaces a file in place on POSIX, so on Windows the
+    destination is removed first.
+
+    Args:
+        source (str): Path of the file to move.
+
+        destination (str): Path it is moved to.
+
+    """
+    if hasattr(os, 'replace'):
+        os.replace(source, destination)
+        return
+    if os.name == 'nt' and os.path.exists(destination):
+        os.remove(destination)
+    os.rename(source, destination)
+
+
+def write_chunks(chunks, destination):
+    """
+    Write Chunks, writes a body to a path or file object chunk by chunk.
+
+    A path is written through a '.part' file that is renamed over the path
+    once the whole body has been written, so the path only ever holds a
+    complete file. The '.part' file is removed if writing fails.
+
+    Args:
+        chunks (iterable): Chunks of the body as bytes.
+
+        destination (str|file): A path, or a file object opened in binary
+            mode which is left open.
+
+    Returns:
+        int: Bytes written.
+
+    """
+    written = 0
+    if hasattr(destination, 'write'):
+        for chunk in chunks:
+            destination.write(chunk)
+            written += len(chunk)
+        return written
+
+    temp_path = part_path(destination)
+    try:
+        with open(temp_path, 'wb') as out:
+            for chunk in chunks:
+                out.write(chunk)
+                written += len(chunk)
+        replace_file(temp_path, destination)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return written
+
+
+def export_response(response, destination, started, file_format=None,
+                    chunk_size=http_client.CHUNK_SIZE):
+    """
+    Export Response, writes a streamed response's body to a destination.
+
+    Args:
+        response (emburse.http_client.StreamedResponse): A successful
+            response, it is closed once written.
+
+        destination (str|file): A path or a binary file object.
+
+        started (float): time.time() when the request was sent.
+
+        file_format (str, optional): Format of the export.
+
+        chunk_size (int): Bytes read at a time.
+
+    Returns:
+        ExportResult
+
+    """
+    with response:
+        written = write_chunks(response.iter_chunks(chunk_size), destination)
+    return ExportResult(
+        None if hasattr(destination, 'write') else destination,
+        written,
+        time.time() - started,
+        file_format=file_format
+    )
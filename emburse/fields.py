@@ -0,0 +1,94 @@
+import sys
+
+import emburse.util as util
+
+if sys.version_info < (3, 0):
+    string_types = (str, unicode)
+else:
+    string_types = (str,)
+
+
+class Field(object):
+    """
+    Field, decodes one known field of an api response. Resources list their
+    fields in APIResource.fields so each value is converted directly instead
+    of being inspected to guess its type.
+    """
+
+    def decode(self, value, resource):
+        """
+        Decode, converts a raw value from the api.
+
+        Args:
+            value: The value from the decoded JSON response.
+
+            resource (emburse.resource.APIResource): The resource the value
+                belongs to.
+
+        Returns:
+            The converted value.
+
+        """
+        return value
+
+
+class Timestamp(Field):
+    """
+    Timestamp Field, a date or date and time string, decoded to a
+    datetime.datetime. Values that are not date strings, such as None or a
+    partial date like '2019-05', are left as they are.
+    """
+
+    def decode(self, value, resource):
+        if not isinstance(value, string_types) or not util.DATE_RE.match(value):
+            return value
+        try:
+            return util.parse_datetime(value)
+        except (ValueError, OverflowError):
+            return value
+
+
+class Amount(Field):
+    """
+    Amount Field, a money amount, decoded to a float when the api sends it
+    as a string.
+    """
+
+    def decode(self, value, resource):
+        if not isinstance(value, string_types):
+            return value
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+
+class Resource(Field):
+    """
+    Resource Field, a nested resource or list of resources, built as
+    instances of the named resource class sharing the parent's context.
+    Objects without a resource class of their own, e.g. an address, are
+    built as plain APIResource instances.
+    """
+
+    def __init__(self, klass_name=None):
+        """
+        Resource Field
+
+        Args:
+            klass_name (str, optional): Name of the resource, e.g. 'card',
+                defaults to the class of the resource the field belongs to.
+
+        """
+        self.klass_name = klass_name
+
+    def decode(self, value, resource):
+        if not isinstance(value, (dict, list)):
+            return value
+        from emburse.resource import convert_to_emburse_object
+        return convert_to_emburse_object(
+            value,
+            resource.auth_token,
+            klass_name=self.klass_name or resource.class_name(),
+            context=resource.context
+        )
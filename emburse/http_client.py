@@ -1,6 +1,7 @@
 import os
 import sys
 import textwrap
+import threading
 import warnings
 
 import emburse.errors as error
@@ -38,6 +39,10 @@ except ImportError:
     urlfetch = None
 
 
+#: Bytes read from the socket at a time by streamed responses
+CHUNK_SIZE = 64 * 1024
+
+
 def new_default_http_client(*args, **kwargs):
     if requests:
         impl = RequestsClient
@@ -52,6 +57,137 @@ def new_default_http_client(*args, **kwargs):
     return impl(*args, **kwargs)
 
 
+class StreamedResponse(object):
+    """
+    Streamed Response, an HTTP response whose body has not been read yet.
+    The body is read in chunks with iter_chunks, e.g. to write it to a file
+    or feed it to an incremental parser, so it is never held in memory as a
+    whole. Close the response, or use it as a context manager, to release
+    the connection when the body is not read to the end.
+
+        >>> with client.request_stream('get', url, headers) as resp:
+        >>>     for chunk in resp.iter_chunks():
+        >>>         out.write(chunk)
+
+    """
+
+    def __init__(self, status_code, headers, read_chunks, close=None):
+        """
+        Streamed Response
+
+        Args:
+            status_code (int): HTTP status of the response.
+
+            headers (dict): Response headers.
+
+            read_chunks (callable): Called with a chunk size, returns an
+                iterator of the body's chunks as bytes.
+
+            close (callable, optional): Releases the underlying connection.
+
+        """
+        self.status_code = status_code
+        self.headers = headers
+        self._read_chunks = read_chunks
+        self._close = close
+        self._consumed = False
+
+    @classmethod
+    def buffered(cls, body, status_code, headers):
+        """
+        Buffered, a streamed response over a body that was already read, for
+        transports that cannot stream.
+
+        Args:
+            body (bytes|str): The response body.
+
+            status_code (int): HTTP status of the response.
+
+            headers (dict): Response headers.
+
+        Returns:
+            StreamedResponse
+
+        """
+        if not isinstance(body, bytes):
+            body = body.encode('utf-8')
+
+        def read_chunks(chunk_size):
+            for start in range(0, len(body), chunk_size):
+                yield body[start:start + chunk_size]
+
+        return cls(status_code, headers, read_chunks)
+
+    @property
+    def content_length(self):
+        """
+        Content Length, size of the body from the Content-Length header.
+
+        Returns:
+            int: Bytes in the body as sent, or None when the server did not
+            say, e.g. for a chunked response.
+
+        """
+        for key, value in (self.headers or {}).items():
+            if key.lower() == 'content-length':
+                try:
+                    return int(value)
+                except (TypeError, ValueError):
+                    return None
+        return None
+
+    def iter_chunks(self, chunk_size=CHUNK_SIZE):
+        """
+        Iter Chunks, generator of the body's chunks. The body can only be
+        read once, the connection is released once it has been.
+
+        Args:
+            chunk_size (int): Maximum bytes per chunk.
+
+        Returns:
+            generator: Chunks of the body as bytes.
+
+        Raises:
+            emburse.errors.EmburseAPIConnectionError: if reading the body
+                fails, or it was already read.
+
+        """
+        if self._consumed:
+            raise error.EmburseAPIConnectionError(
+                'The response body has already been read.')
+        self._consumed = True
+        try:
+            for chunk in self._read_chunks(chunk_size):
+                if chunk:
+                    yield chunk
+        finally:
+            self.close()
+
+    def read(self):
+        """
+        Read, reads the whole remaining body.
+
+        Returns:
+            bytes: The body.
+
+        """
+        return b''.join(self.iter_chunks())
+
+    def close(self):
+        """
+        Close, releases the connection, the rest of the body is discarded.
+        """
+        close, self._close = self._close, None
+        if close is not None:
+            close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
 class HTTPClient(object):
     def __init__(self, verify_ssl_certs=True, proxy=None):
         self._verify_ssl_certs = verify_ssl_certs
@@ -63,19 +199,198 @@ class HTTPClient(object):
                     "Proxy(ies) must be specified as either a string URL or a dict() with string URL under the ""https"" and/or ""http"" keys.")
         self._proxy = proxy.copy() if proxy else None
 
-    def request(self, method, url, headers, post_data=None):
+    def request(self, method, url, headers, post_data=None, timeout=None):
+        """
+        Request, sends a request and returns its body, status and headers.
+
+        Args:
+            method (str): Lower case HTTP method.
+
+            url (str): Absolute URL.
+
+            headers (dict): Request headers.
+
+            post_data (str, optional): Request body.
+
+            timeout (float, optional): Seconds left for this call, lowers the
+                client's configured timeouts when smaller.
+
+        Returns:
+            tuple (str, int, dict): Response body, status code and headers.
+
+        """
         raise NotImplementedError(
             'HTTPClient subclasses must implement `request`')
 
+    def request_stream(self, method, url, headers, post_data=None,
+                       timeout=None):
+        """
+        Request Stream, sends a request and returns the response without
+        reading its body. Transports that cannot stream fall back to reading
+        the body with request.
+
+        Args:
+            method (str): Lower case HTTP method.
+
+            url (str): Absolute URL.
+
+            headers (dict): Request headers.
+
+            post_data (str, optional): Request body.
+
+            timeout (float, optional): Seconds left for this call, lowers the
+                client's configured timeouts when smaller.
+
+        Returns:
+            StreamedResponse: The response, its body read in chunks.
+
+        """
+        content, status_code, resp_headers = self.request(
+            method, url, headers, post_data=post_data, timeout=timeout)
+        return StreamedResponse.buffered(content, status_code, resp_headers)
+
+    def close(self):
+        """
+        Close, releases any pooled connections held by the client. Clients
+        that do not keep connections open between requests do nothing.
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
 
 class RequestsClient(HTTPClient):
     name = 'requests'
 
-    def __init__(self, timeout=80, **kwargs):
+    def __init__(self, timeout=80, connect_timeout=None, read_timeout=None,
+                 session=None, use_session=True, pool_connections=10,
+                 pool_maxsize=10, pool_block=False, **kwargs):
+        """
+        Requests Client, HTTP client backed by the requests library.
+
+        By default requests are sent through a single keep-alive
+        requests.Session so connections are reused across calls, and every
+        Requestor sharing this client shares its connection pool.
+
+        Args:
+            timeout (int): Seconds to wait for the API to respond.
+
+            connect_timeout (float, optional): Seconds to wait for a
+                connection to be established, defaults to timeout.
+
+            read_timeout (float, optional): Seconds to wait between bytes of
+                the response, defaults to timeout.
+
+            session (requests.Session, optional): Session to send requests
+                through. The client will not close a session it did not
+                create.
+
+            use_session (bool): Set to False to send each request with a new
+                connection through requests.request.
+
+            pool_connections (int): Number of per host connection pools to
+                keep.
+
+            pool_maxsize (int): Maximum number of connections kept open per
+                host.
+
+            pool_block (bool): If True, callers wait for a free connection
+                once pool_maxsize connections to a host are in use instead of
+                opening extra, non-pooled connections.
+
+        """
         super(RequestsClient, self).__init__(**kwargs)
         self._timeout = timeout
+        self._connect_timeout = (
+            connect_timeout if connect_timeout is not None else timeout)
+        self._read_timeout = (
+            read_timeout if read_timeout is not None else timeout)
+        self._use_session = use_session or session is not None
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._session = session
+        self._owns_session = session is None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self):
+        """
+        Session, the pooled requests.Session used by this client, created on
+        first use.
+
+        Returns:
+            requests.Session: The shared session.
+
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def _build_session(self):
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=self._pool_block
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def close(self):
+        """
+        Close, closes the pooled session if this client created it. A new
+        session is created if the client is used again afterwards.
+        """
+        if not self._owns_session:
+            return
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def _timeouts(self, timeout=None):
+        connect, read = self._connect_timeout, self._read_timeout
+        if timeout is not None:
+            connect = min(connect, timeout)
+            read = min(read, timeout)
+        return connect, read
+
+    def request(self, method, url, headers, post_data=None, timeout=None):
+        try:
+            result = self._send(method, url, headers, post_data, timeout)
+            content = result.content
+            status_code = result.status_code
+        except Exception as e:
+            self._handle_request_error(e)
+        return content, status_code, result.headers
 
-    def request(self, method, url, headers, post_data=None):
+    def request_stream(self, method, url, headers, post_data=None,
+                       timeout=None):
+        try:
+            result = self._send(method, url, headers, post_data, timeout,
+                                stream=True)
+        except Exception as e:
+            self._handle_request_error(e)
+
+        def read_chunks(chunk_size):
+            try:
+                for chunk in result.iter_content(chunk_size=chunk_size):
+                    yield chunk
+            except Exception as e:
+                self._handle_request_error(e)
+
+        return StreamedResponse(result.status_code, result.headers,
+                                read_chunks, close=result.close)
+
+    def _send(self, method, url, headers, post_data, timeout, stream=False):
         kwargs = {}
         if self._verify_ssl_certs:
             kwargs['verify'] = os.path.join(
@@ -86,24 +401,24 @@ class RequestsClient(HTTPClient):
         if self._proxy:
             kwargs['proxies'] = self._proxy
 
-        try:
-            try:
-                result = requests.request(method,
-                                          url,
-                                          headers=headers,
-                                          data=post_data,
-                                          timeout=self._timeout,
-                                          **kwargs)
-            except TypeError as e:
-                raise error.EmburseTypeError(
-                    'Warning: It looks like your installed version of the "requests" library is not compatible with Emburse\'s usage thereof. (HINT: The most likely cause is that your "requests" library is out of date. You can fix that by running "pip install -U requests".) The underlying error was: {0}'.format(
-                        e))
+        if stream:
+            kwargs['stream'] = True
 
-            content = result.content
-            status_code = result.status_code
-        except Exception as e:
-            self._handle_request_error(e)
-        return content, status_code, result.headers
+        try:
+            if self._use_session:
+                send = self.session.request
+            else:
+                send = requests.request
+            return send(method,
+                        url,
+                        headers=headers,
+                        data=post_data,
+                        timeout=self._timeouts(timeout),
+                        **kwargs)
+        except TypeError as e:
+            raise error.EmburseTypeError(
+                'Warning: It looks like your installed version of the "requests" library is not compatible with Emburse\'s usage thereof. (HINT: The most likely cause is that your "requests" library is out of date. You can fix that by running "pip install -U requests".) The underlying error was: {0}'.format(
+                    e))
 
     def _handle_request_error(self, e):
         if isinstance(e, requests.exceptions.RequestException):
@@ -134,14 +449,17 @@ class UrlFetchClient(HTTPClient):
         self._verify_ssl_certs = verify_ssl_certs
         self._deadline = deadline
 
-    def request(self, method, url, headers, post_data=None):
+    def request(self, method, url, headers, post_data=None, timeout=None):
+        deadline = self._deadline
+        if timeout is not None:
+            deadline = min(deadline, timeout)
         try:
             result = urlfetch.fetch(
                 url=url,
                 method=method,
                 headers=headers,
                 validate_certificate=self._verify_ssl_certs,
-                deadline=self._deadline,
+                deadline=deadline,
                 payload=post_data
             )
         except urlfetch.Error as e:
@@ -170,15 +488,27 @@ class Urllib2Client(HTTPClient):
     else:
         name = 'urllib2'
 
-    def __init__(self, verify_ssl_certs=True, proxy=None):
+    def __init__(self, verify_ssl_certs=True, proxy=None, timeout=80):
         super(Urllib2Client, self).__init__(
             verify_ssl_certs=verify_ssl_certs, proxy=proxy)
+        self._timeout = timeout
         self._opener = None
         if self._proxy:
             proxy = urllib2.ProxyHandler(self._proxy)
             self._opener = urllib2.build_opener(proxy)
 
-    def request(self, method, url, headers, post_data=None):
+    def request(self, method, url, headers, post_data=None, timeout=None):
+        response = self.request_stream(method, url, headers,
+                                       post_data=post_data, timeout=timeout)
+        return response.read(), response.status_code, response.headers
+
+    def request_stream(self, method, url, headers, post_data=None,
+                       timeout=None):
+        if timeout is not None:
+            timeout = min(self._timeout, timeout)
+        else:
+            timeout = self._timeout
+
         if sys.version_info >= (3, 0) and isinstance(post_data, str):
             post_data = post_data.encode('utf-8')
 
@@ -189,18 +519,28 @@ class Urllib2Client(HTTPClient):
 
         try:
             response = self._opener.open(
-                req) if self._opener else urllib2.urlopen(req)
-            rbody = response.read()
+                req, timeout=timeout) if self._opener else urllib2.urlopen(
+                req, timeout=timeout)
             rcode = response.code
-            headers = dict(response.info())
         except urllib2.HTTPError as e:
+            # HTTPError is also the response, its body is read the same way.
+            response = e
             rcode = e.code
-            rbody = e.read()
-            headers = dict(e.info())
         except (urllib2.URLError, ValueError) as e:
             self._handle_request_error(e)
-        lh = dict((k.lower(), v) for k, v in dict(headers).iteritems())
-        return rbody, rcode, lh
+        lh = dict((k.lower(), v) for k, v in dict(response.info()).items())
+
+        def read_chunks(chunk_size):
+            try:
+                while True:
+                    chunk = response.read(chunk_size)
+                    if not chunk:
+                        return
+                    yield chunk
+            except (urllib2.URLError, IOError, ValueError) as e:
+                self._handle_request_error(e)
+
+        return StreamedResponse(rcode, lh, read_chunks, close=response.close)
 
     def _handle_request_error(self, e):
         msg = "Unexpected error communicating with Emburse."
@@ -0,0 +1,238 @@
+import re
+
+import emburse.codec as codec
+
+_STRUCTURE_RE = re.compile(br'[\[\]{},:"]')
+
+_STRING_RE = re.compile(br'["\\]')
+
+_WHITESPACE = b' \t\r\n'
+
+#: Bytes handed to the parser at a time when splitting a buffered body
+CHUNK_SIZE = 64 * 1024
+
+
+class ArrayItemParser(object):
+    """
+    Array Item Parser
+
+    Incremental pull parser for the listings the api returns, e.g.
+    {"transactions": [{...}, {...}]}. Bytes are fed in as they arrive and
+    every complete element of the array under `key` is decoded and returned
+    as soon as its closing byte is seen, so only the element being received
+    is held in the buffer rather than the whole body and object tree.
+
+        >>> parser = ArrayItemParser('transactions')
+        >>> for chunk in chunks:
+        >>>     for transaction in parser.feed(chunk):
+        >>>         ...
+        >>> parser.close()
+
+    Only the structure needed to find element boundaries is scanned here,
+    each element is decoded by the JSON codec. Other keys of the top level
+    object are skipped.
+
+    """
+
+    def __init__(self, key=None, json_codec=None):
+        """
+        Array Item Parser
+
+        Args:
+            key (str, optional): Key of the array in the top level object, or
+                None when the document itself is the array.
+
+            json_codec (str|emburse.codec.JSONCodec, optional): Codec used to
+                decode each element, defaults to emburse.codec's default.
+
+        """
+        self.key = key.encode('utf-8') if key is not None else None
+        self.json_codec = codec.get_codec(json_codec)
+        self._buf = b''
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._string_start = None
+        self._last_string = None
+        self._pending_key = None
+        self._pending_start = None
+        self._array_depth = None
+        self._item_start = None
+        self._done = False
+
+    @property
+    def done(self):
+        """
+        Done, whether the end of the array has been reached.
+        """
+        return self._done
+
+    def feed(self, chunk):
+        """
+        Feed, adds bytes from the body and returns the elements they
+        complete.
+
+        Args:
+            chunk (bytes): The next bytes of the body.
+
+        Returns:
+            list: Decoded elements, possibly empty.
+
+        Raises:
+            ValueError: if the body is not valid JSON.
+
+        """
+        if self._done or not chunk:
+            return []
+        self._buf += chunk
+        items = []
+        self._scan(items)
+        self._trim()
+        return items
+
+    def close(self):
+        """
+        Close, checks the whole array was received.
+
+        Raises:
+            ValueError: if the body ended before the array was complete.
+
+        """
+        if self._array_depth is not None and not self._done:
+            raise ValueError('JSON body ended inside the array')
+
+    def _scan(self, items):
+        buf = self._buf
+        pos = self._pos
+        end = len(buf)
+        while pos < end and not self._done:
+            if self._in_string:
+                match = _STRING_RE.search(buf, pos)
+                if match is None:
+                    pos = end
+                    break
+                pos = match.start()
+                if buf[pos:pos + 1] == b'\\':
+                    if pos + 1 >= end:
+                        break
+                    pos += 2
+                    continue
+                self._in_string = False
+                if self._string_start is not None:
+                    self._last_string = buf[self._string_start:pos]
+                    self._string_start = None
+                pos += 1
+                continue
+            match = _STRUCTURE_RE.search(buf, pos)
+            if match is None:
+                pos = end
+                break
+            pos = match.start()
+            char = buf[pos:pos + 1]
+            if self._pending_key is not None and char != b'"':
+                # First byte of the value of a top level key.
+                if (self._pending_key == self.key and char == b'[' and
+                        not buf[self._pending_start:pos].strip(_WHITESPACE)):
+                    self._array_depth = self._depth + 1
+                    self._item_start = pos + 1
+                self._pending_key = None
+                self._pending_start = None
+            if char == b'"':
+                self._pending_key = None
+                self._pending_start = None
+                self._in_string = True
+                if self._depth == 1 and self._array_depth is None:
+                    self._string_start = pos + 1
+            elif char in b'{[':
+                if self._depth == 0 and self.key is None and char == b'[':
+                    self._array_depth = 1
+                    self._item_start = pos + 1
+                self._depth += 1
+            elif char in b']}':
+                if self._depth == self._array_depth:
+                    self._emit(buf, pos, items)
+                    self._done = True
+                self._depth -= 1
+                if self._depth < 0:
+                    raise ValueError('Unbalanced JSON body')
+            elif char == b',':
+                if self._depth == self._array_depth:
+                    self._emit(buf, pos, items)
+                    self._item_start = pos + 1
+            elif char == b':':
+                if self._depth == 1 and self._array_depth is None:
+                    self._pending_key = self._last_string
+                    self._pending_start = pos + 1
+            pos += 1
+        self._pos = pos
+
+    def _emit(self, buf, pos, items):
+        raw = buf[self._item_start:pos].strip(_WHITESPACE)
+        self._item_start = None
+        if raw:
+            items.append(self.json_codec.loads(raw))
+
+    def _trim(self):
+        # Drop the bytes before anything still needed from the buffer.
+        starts = [self._pos, self._item_start, self._string_start,
+                  self._pending_start]
+        keep = min(start for start in starts if start is not None)
+        if keep <= 0:
+            return
+        self._buf = self._buf[keep:]
+        self._pos -= keep
+        if self._item_start is not None:
+            self._item_start -= keep
+        if self._string_start is not None:
+            self._string_start -= keep
+        if self._pending_start is not None:
+            self._pending_start -= keep
+
+
+def iter_chunks(body, chunk_size=CHUNK_SIZE):
+    """
+    Iter Chunks, splits a buffered body into chunks for a parser.
+
+    Args:
+        body (bytes|str): The body, text is encoded as UTF-8.
+
+        chunk_size (int): Bytes per chunk.
+
+    Returns:
+        generator: The chunks.
+
+    """
+    if not isinstance(body, bytes):
+        body = body.encode('utf-8')
+    for start in range(0, len(body), chunk_size):
+        yield body[start:start + chunk_size]
+
+
+def iter_items(chunks, key=None, json_codec=None):
+    """
+    Iter Items, generator of the elements of a JSON array read from an
+    iterable of body chunks.
+
+    Args:
+        chunks (iterable): Chunks of the body as bytes.
+
+        key (str, optional): Key of the array in the top level object, or
+            None when the document itself is the array.
+
+        json_codec (str|emburse.codec.JSONCodec, optional): Codec used to
+            decode each element.
+
+    Returns:
+        generator: The decoded elements, in order.
+
+    Raises:
+        ValueError: if the body is not valid JSON or ends early.
+
+    """
+    parser = ArrayItemParser(key, json_codec=json_codec)
+    for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+        if parser.done:
+            return
+    parser.close()
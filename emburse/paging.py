@@ -0,0 +1,131 @@
+import sys
+import threading
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+
+def iter_pages(fetch_page, page_size, first_page=1):
+    """
+    Iter Pages, generator that fetches pages of a listing one at a time.
+
+    A page is only requested once the previous one has been consumed, so
+    stopping iteration early never fetches the remaining pages. Iteration
+    ends on the first empty page or the first page shorter than page_size.
+
+    Args:
+        fetch_page (callable): Called with a page number, returns the list of
+            raw objects on that page.
+
+        page_size (int): Number of objects requested per page.
+
+        first_page (int): Number of the first page to fetch.
+
+    Returns:
+        generator: Lists of raw objects, one per page.
+
+    """
+    page = first_page
+    while True:
+        items = fetch_page(page)
+        if items:
+            yield items
+        if not items or len(items) < page_size:
+            return
+        page += 1
+
+
+def iter_page_items(fetch_items, page_size, first_page=1):
+    """
+    Iter Page Items, generator that pages through a listing yielding the
+    objects one at a time as each page is read, for pages that are parsed
+    incrementally rather than fetched as a whole list.
+
+    Paging stops the same way as iter_pages: after the first empty page or
+    the first page shorter than page_size.
+
+    Args:
+        fetch_items (callable): Called with a page number, returns an
+            iterable of the raw objects on that page.
+
+        page_size (int): Number of objects requested per page.
+
+        first_page (int): Number of the first page to fetch.
+
+    Returns:
+        generator: Raw objects, in order.
+
+    """
+    page = first_page
+    while True:
+        count = 0
+        for item in fetch_items(page):
+            count += 1
+            yield item
+        if count < page_size:
+            return
+        page += 1
+
+
+def prefetch_pages(pages, depth):
+    """
+    Prefetch Pages, fetches pages from a page generator in a background
+    thread while the caller consumes earlier ones.
+
+    At most `depth` fetched pages wait in the buffer, once it is full the
+    background thread blocks until the caller catches up, so a slow consumer
+    holds back fetching instead of letting pages pile up in memory. Errors
+    raised while fetching are re-raised to the caller in order, and closing
+    the returned generator stops the background thread.
+
+    Args:
+        pages (generator): Page generator, e.g. from iter_pages.
+
+        depth (int): Maximum number of pages fetched ahead of the caller.
+
+    Returns:
+        generator: The pages of `pages`, in order.
+
+    """
+    buffered = queue.Queue(maxsize=max(int(depth), 1))
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                buffered.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for page in pages:
+                if not put((page, None)):
+                    return
+        except Exception:
+            put((None, sys.exc_info()))
+            return
+        finally:
+            close = getattr(pages, 'close', None)
+            if close is not None:
+                close()
+        put((done, None))
+
+    worker = threading.Thread(target=produce, name='emburse-prefetch')
+    worker.daemon = True
+    worker.start()
+    try:
+        while True:
+            page, exc_info = buffered.get()
+            if exc_info is not None:
+                raise exc_info[1]
+            if page is done:
+                return
+            yield page
+    finally:
+        stop.set()
@@ -0,0 +1,249 @@
+import os
+import struct
+import threading
+import time
+
+import emburse.errors as error
+import emburse.util as util
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class MemoryBackend(object):
+    """
+    Memory Backend, keeps a TokenBucket's state in this process, guarded by
+    a threading lock. Shares the budget between threads only.
+    """
+
+    def __init__(self):
+        self._state = None
+        self._lock = threading.Lock()
+
+    def transact(self, func):
+        """
+        Transact, atomically updates the bucket state.
+
+        Args:
+            func (callable): Called with the current state, a tuple of
+                (tokens, updated) or None for a new bucket. Returns a tuple of
+                the new state and a result.
+
+        Returns:
+            The result returned by func.
+
+        """
+        with self._lock:
+            self._state, result = func(self._state)
+        return result
+
+
+class FileLockBackend(object):
+    """
+    File Lock Backend, keeps a TokenBucket's state in a small file guarded by
+    an exclusive fcntl lock, so every process on the host that uses the same
+    path shares one budget. Useful for prefork servers and worker pools where
+    each process builds its own Client.
+
+        >>> limiter = TokenBucket(
+        >>>     rate=10,
+        >>>     burst=20,
+        >>>     backend=FileLockBackend('/var/run/myapp/emburse.bucket')
+        >>> )
+
+    The file is opened on first use in each process, so a backend created
+    before forking is safe to use in the children.
+
+    """
+
+    _format = struct.Struct('<dd')
+
+    def __init__(self, path):
+        """
+        File Lock Backend
+
+        Args:
+            path (str): Path of the state file, created if missing.
+
+        Raises:
+            emburse.errors.EmburseNotImplementedError: if fcntl file locking
+                is not available on this platform.
+
+        """
+        if fcntl is None:
+            raise error.EmburseNotImplementedError(
+                'FileLockBackend requires fcntl file locking, which is not '
+                'available on this platform.'
+            )
+        self.path = path
+        self._fd = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _file(self):
+        if self._fd is None or self._pid != os.getpid():
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._pid = os.getpid()
+        return self._fd
+
+    def transact(self, func):
+        """
+        Transact, atomically updates the bucket state across processes.
+
+        Args:
+            func (callable): Called with the current state, a tuple of
+                (tokens, updated) or None for a new bucket. Returns a tuple of
+                the new state and a result.
+
+        Returns:
+            The result returned by func.
+
+        """
+        with self._lock:
+            fd = self._file()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                os.lseek(fd, 0, os.SEEK_SET)
+                raw = os.read(fd, self._format.size)
+                state = None
+                if len(raw) == self._format.size:
+                    state = self._format.unpack(raw)
+                state, result = func(state)
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.write(fd, self._format.pack(*state))
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        return result
+
+    def close(self):
+        """
+        Close, closes the state file in this process. The file itself is
+        left in place for the other processes.
+        """
+        with self._lock:
+            if self._fd is not None and self._pid == os.getpid():
+                os.close(self._fd)
+            self._fd = None
+
+
+class TokenBucket(object):
+    """
+    Token Bucket
+
+    Thread safe client side rate limiter. The bucket holds up to `burst`
+    tokens and refills at `rate` tokens per second, every request takes one.
+    When the bucket is empty callers are given a place in line and wait
+    locally until their token is due, instead of being throttled by the API,
+    so a busy client runs at the allowed ceiling.
+
+    Share one bucket between every thread using an auth token, e.g. by
+    passing it to the Client they all use:
+
+        >>> client = emburse.Client(
+        >>>     auth_token='abc123',
+        >>>     rate_limiter=TokenBucket(rate=10, burst=20)
+        >>> )
+
+    The bucket's state lives in a backend, in memory by default. Use a
+    FileLockBackend to share the budget between processes on one host.
+
+    """
+
+    def __init__(self, rate, burst=None, backend=None):
+        """
+        Token Bucket
+
+        Args:
+            rate (float): Tokens added per second, the sustained request rate.
+
+            burst (int, optional): Size of the bucket, the number of requests
+                that can be sent at once after a quiet period. Defaults to
+                rate, rounded up, and at least 1.
+
+            backend (optional): Where the bucket state is kept, a
+                MemoryBackend if not given.
+
+        """
+        if rate <= 0:
+            raise ValueError('rate must be greater than 0')
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(int(rate + 0.5), 1))
+        self.backend = backend or MemoryBackend()
+
+    def _refill(self, state, now):
+        if state is None:
+            return self.burst
+        tokens, updated = state
+        elapsed = max(now - updated, 0.0)
+        return min(self.burst, tokens + elapsed * self.rate)
+
+    def reserve(self, tokens=1):
+        """
+        Reserve, takes tokens from the bucket, going into debt if it is
+        empty, and tells the caller how long to wait before using them.
+        Debt is paid back in order, so waiting callers are served first in,
+        first out.
+
+        Args:
+            tokens (int): Number of tokens to take.
+
+        Returns:
+            float: Seconds to wait before sending, 0 if the tokens are
+            available now.
+
+        """
+        def take(state):
+            now = util.monotonic()
+            available = self._refill(state, now) - tokens
+            wait = 0.0 if available >= 0 else -available / self.rate
+            return (available, now), wait
+        return self.backend.transact(take)
+
+    def refund(self, tokens=1):
+        """
+        Refund, puts back tokens taken with reserve that were not used, e.g.
+        because the call was abandoned before it was sent.
+
+        Args:
+            tokens (int): Number of tokens to put back.
+
+        """
+        def give(state):
+            now = util.monotonic()
+            available = min(self.burst, self._refill(state, now) + tokens)
+            return (available, now), available
+        self.backend.transact(give)
+
+    def acquire(self, tokens=1):
+        """
+        Acquire, blocks until the given number of tokens is available.
+
+        Args:
+            tokens (int): Number of tokens to take.
+
+        Returns:
+            float: Seconds spent waiting.
+
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def level(self):
+        """
+        Level, the current fill level of the bucket, for monitoring. A
+        negative level is the number of tokens already promised to waiting
+        callers.
+
+        Returns:
+            float: Tokens in the bucket.
+
+        """
+        def peek(state):
+            now = util.monotonic()
+            available = self._refill(state, now)
+            return (available, now), available
+        return self.backend.transact(peek)
@@ -1,24 +1,67 @@
 import urllib
 import platform
-from pytz import utc as UTC
+import time
 import datetime
 import emburse.util as util
 import emburse.errors as error
+import emburse.codec as codec
 import emburse.http_client as http_client
+import emburse.jsonstream as jsonstream
 import emburse.version as version
+from emburse.deadline import Deadline
+from emburse.retry import RetryAttempt, RetryPolicy
 
 
 class Requestor(object):
+
+    #: Step of Requestor.attempts, wait the given seconds
+    SLEEP = 'sleep'
+
+    #: Step of Requestor.attempts, send an attempt with the given kwargs
+    SEND = 'send'
+
+    #: Step of Requestor.attempts, the call is over with the given response
+    DONE = 'done'
+
     def __init__(self, token=None, proxy=None, client=None,
-                 verify_ssl_certs=True):
+                 verify_ssl_certs=True, retry_policy=None,
+                 rate_limiter=None, circuit_breaker=None, json_codec=None):
         self.api_base = 'https://api.emburse.com/{api_version}'.format(
             api_version=version.API_VERSION)
         self.auth_token = token
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=1)
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self._json_codec = (
+            codec.get_codec(json_codec) if json_codec is not None else None)
+        self._client_user_agent = None
 
+        self._owns_client = client is None
         self._client = client or http_client.new_default_http_client(
             verify_ssl_certs=verify_ssl_certs, proxy=proxy)
 
-    def request(self, method, url_, params=None, headers=None):
+    @property
+    def json_codec(self):
+        """
+        JSON Codec, encodes request bodies and decodes responses, the
+        default codec of emburse.codec unless one was given.
+
+        Returns:
+            emburse.codec.JSONCodec
+
+        """
+        return self._json_codec or codec.get_codec()
+
+    def close(self):
+        """
+        Close, releases the pooled connections of the HTTP client if this
+        requestor created it. A client passed in by the caller may be shared
+        with other requestors and is left open.
+        """
+        if self._owns_client:
+            self._client.close()
+
+    def request(self, method, url_, params=None, headers=None, deadline=None):
         """
         Request, makes a request to the emburse API
         Args:
@@ -26,15 +69,59 @@ class Requestor(object):
             url_ (str): The URL to make request to. 
             params (dict): Params to send to the API 
             headers (dict): Custom Headers to send to with request. 
+            deadline (Deadline|float): Time budget for the call, retries
+                included.
 
         Returns:
             set (dict, str): Dict of response body and the api key in a set.
         """
         resp_body, resp_code, resp_headers, my_api_key = self.request_raw(
-            method.lower(), url_, params, headers)
+            method.lower(), url_, params, headers, deadline=deadline)
         resp = self.interpret_response(resp_body, resp_code, resp_headers)
         return resp, my_api_key
 
+    def request_items(self, method, url_, key, params=None, headers=None,
+                      deadline=None):
+        """
+        Request Items, makes a request to the emburse API and yields the
+        elements of the array under `key` in the response one at a time,
+        parsing the body incrementally instead of decoding it whole.
+        Args:
+            method (str): The HTTP method used to send request
+            url_ (str): The URL to make request to.
+            key (str): Key of the array in the response, e.g. 'transactions'
+            params (dict): Params to send to the API
+            headers (dict): Custom Headers to send to with request.
+            deadline (Deadline|float): Time budget for the call, retries
+                included.
+
+        Returns:
+            generator: The decoded elements of the array, nothing is sent
+            until iteration starts. The body is read off the connection as
+            the elements are consumed.
+
+        Raises:
+            emburse.errors.EmburseAPIError: if the API returns an error or the
+                body is not a valid listing.
+        """
+        resp = self.request_stream(method, url_, params, headers,
+                                   deadline=deadline)
+        with resp:
+            if not (200 <= resp.status_code < 300):
+                self.interpret_response(resp.read(), resp.status_code,
+                                        resp.headers)
+            try:
+                for item in jsonstream.iter_items(resp.iter_chunks(), key,
+                                                  json_codec=self.json_codec):
+                    yield item
+            except ValueError as e:
+                raise error.EmburseAPIError(
+                    "Invalid response body from API: {0} (HTTP response code was {1})".format(
+                        e, resp.status_code),
+                    http_status=resp.status_code,
+                    headers=resp.headers
+                )
+
     def handle_api_error(self, resp_body, resp_code, resp, resp_headers):
         """
         Handle API Error, used to tell what kind of error was sent back from 
@@ -75,10 +162,335 @@ class Requestor(object):
             raise error.EmburseAPIError(err.get('message'), resp_body,
                                         resp_code, resp, resp_headers)
 
-    def request_raw(self, method, url, params=None, supplied_headers=None):
+    def request_raw(self, method, url, params=None, supplied_headers=None,
+                    deadline=None):
         """
         Request Raw, method for issuing an API call
         """
+        return self.request_raw_prepared(
+            method, self.prepare_request(method, url, params, supplied_headers),
+            deadline=deadline)
+
+    def request_prepared(self, method, prepared, deadline=None):
+        """
+        Request Prepared, sends a request built earlier with prepare_request,
+        e.g. by a bulk operation that encodes every payload before sending
+        any of them.
+        Args:
+            method (str): Lower case HTTP method
+            prepared (tuple): What prepare_request returned
+            deadline (Deadline|float): Time budget for the call, retries
+                included.
+
+        Returns:
+            set (dict, str): Dict of response body and the api key in a set.
+        """
+        resp_body, resp_code, resp_headers, my_api_key = self.request_raw_prepared(
+            method, prepared, deadline=deadline)
+        resp = self.interpret_response(resp_body, resp_code, resp_headers)
+        return resp, my_api_key
+
+    def request_raw_prepared(self, method, prepared, deadline=None):
+        """
+        Request Raw Prepared, issues an API call built with prepare_request
+        without interpreting the response.
+        """
+        deadline = Deadline.coerce(deadline)
+        abs_url, headers, post_data, my_auth_token = prepared
+
+        def send(**transport_kwargs):
+            return self._client.request(
+                method, abs_url, headers, post_data, **transport_kwargs)
+
+        resp_body, resp_code, resp_headers = self.send_with_retries(
+            send, method, abs_url, headers, deadline)
+        self.log_response(method, abs_url, resp_code, resp_body)
+        return resp_body, resp_code, resp_headers, my_auth_token
+
+    def request_stream(self, method, url_, params=None, headers=None,
+                       deadline=None):
+        """
+        Request Stream, makes a request to the emburse API and returns the
+        response before its body is read, with the same retries, rate
+        limiting and circuit breaking as request. The deadline bounds getting
+        the response, reading the body is bounded by the transport's read
+        timeout.
+        Args:
+            method (str): The HTTP method used to send request
+            url_ (str): The URL to make request to.
+            params (dict): Params to send to the API
+            headers (dict): Custom Headers to send to with request.
+            deadline (Deadline|float): Time budget for the call, retries
+                included.
+
+        Returns:
+            emburse.http_client.StreamedResponse: The response, close it or
+            read it to the end to release the connection.
+        """
+        method = method.lower()
+        deadline = Deadline.coerce(deadline)
+        abs_url, headers, post_data, my_auth_token = self.prepare_request(
+            method, url_, params, headers)
+
+        def send(**transport_kwargs):
+            resp = self._client.request_stream(
+                method, abs_url, headers, post_data, **transport_kwargs)
+            return resp, resp.status_code, resp.headers
+
+        resp, resp_code, resp_headers = self.send_with_retries(
+            send, method, abs_url, headers, deadline,
+            discard=lambda discarded: discarded.close())
+        self.log_response(method, abs_url, resp_code, '<streamed>')
+        return resp
+
+    def send_with_retries(self, send, method, abs_url, headers, deadline=None,
+                          discard=None):
+        """
+        Send With Retries, sends a request through the transport until it
+        succeeds, or the retry policy or deadline stop retrying.
+        Args:
+            send (callable): Sends one attempt, called with the transport
+                kwargs, returns a tuple of the response, status and headers.
+            method (str): Lower case HTTP method
+            abs_url (str): Absolute URL requested
+            headers (dict): Request headers
+            deadline (Deadline): Time budget of the call, if any
+            discard (callable, optional): Called with a response that is
+                being retried, e.g. to close it.
+
+        Returns:
+            tuple: What send returned for the last attempt.
+        """
+        steps = self.attempts(method, abs_url, headers, deadline, discard)
+        action, value = next(steps)
+        while action != Requestor.DONE:
+            try:
+                if action == Requestor.SLEEP:
+                    time.sleep(value)
+                    outcome = None
+                else:
+                    outcome = send(**value)
+            except BaseException as e:
+                action, value = steps.throw(e)
+            else:
+                action, value = steps.send(outcome)
+        return value
+
+    def attempts(self, method, abs_url, headers, deadline=None, discard=None):
+        """
+        Attempts, the retry loop shared by the blocking and asyncio
+        requestors. The generator takes every decision, rate limiting, the
+        circuit breaker, the deadline and retries, and leaves the waiting and
+        sending to its caller through the (action, value) steps it yields:
+
+            SLEEP, seconds: wait, then send() None.
+            SEND, transport kwargs: send an attempt, then send() back the
+                tuple of the response, status and headers, or throw() in
+                what the transport raised.
+            DONE, tuple: the final response, the generator is finished.
+
+        An exception the call ends with is raised out of send() or throw().
+        Args:
+            method (str): Lower case HTTP method
+            abs_url (str): Absolute URL requested
+            headers (dict): Request headers
+            deadline (Deadline): Time budget of the call, if any
+            discard (callable, optional): Called with a response that is
+                being retried, e.g. to close it.
+
+        Returns:
+            generator: Of (action, value) steps.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            wait = self.before_attempt(deadline)
+            try:
+                if wait > 0:
+                    yield Requestor.SLEEP, wait
+                transport_kwargs = self.transport_kwargs(deadline)
+            except BaseException:
+                self.abort_attempt()
+                raise
+            started = time.time()
+            try:
+                resp, resp_code, resp_headers = yield Requestor.SEND, transport_kwargs
+            except error.EmburseAPIConnectionError as e:
+                delay = self.record_attempt(attempt, method, abs_url, headers, started, error=e,
+                                            deadline=deadline)
+                if delay is None:
+                    raise
+            except Exception as e:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record(time.time() - started, error=e)
+                raise
+            else:
+                delay = self.record_attempt(attempt, method, abs_url, headers, started,
+                                            status_code=resp_code, resp_headers=resp_headers,
+                                            deadline=deadline)
+                if delay is None:
+                    yield Requestor.DONE, (resp, resp_code, resp_headers)
+                    return
+                if discard is not None:
+                    discard(resp)
+            yield Requestor.SLEEP, delay
+
+    def before_attempt(self, deadline=None):
+        """
+        Before Attempt, checks the deadline, takes a token from the rate
+        limiter and then checks the circuit breaker before an attempt. The
+        token is put back if the attempt is given up here, so is the trial
+        slot of a half-open circuit by abort_attempt.
+        Args:
+            deadline (Deadline): Time budget of the call, if any
+
+        Returns:
+            float: Seconds to wait for the rate limiter before sending.
+
+        Raises:
+            emburse.errors.EmburseDeadlineExceededError: if the deadline has
+                passed or would pass while waiting for the rate limiter.
+
+            emburse.errors.EmburseCircuitOpenError: if the circuit is open.
+        """
+        if deadline is not None:
+            deadline.check()
+        wait = 0.0
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.reserve()
+        if deadline is not None and wait >= deadline.remaining():
+            self.refund_token()
+            raise error.EmburseDeadlineExceededError(
+                'Deadline of {0:.3f}s would be exceeded waiting {1:.3f}s for the rate limiter.'.format(
+                    deadline.seconds, wait)
+            )
+        if self.circuit_breaker is not None:
+            try:
+                self.circuit_breaker.before_call()
+            except error.EmburseCircuitOpenError:
+                self.refund_token()
+                raise
+        return wait
+
+    def abort_attempt(self):
+        """
+        Abort Attempt, undoes before_attempt for an attempt that is given up
+        before being sent: the rate limiter token is put back and the trial
+        slot of a half-open circuit breaker released, so it is not held for
+        a call that never happened.
+        """
+        self.refund_token()
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release()
+
+    def refund_token(self):
+        """
+        Refund Token, puts back the rate limiter token of an attempt that was
+        not sent, for limiters that support it.
+        """
+        refund = getattr(self.rate_limiter, 'refund', None)
+        if refund is not None:
+            refund()
+
+    def transport_kwargs(self, deadline=None):
+        """
+        Transport Kwargs, extra arguments for HTTPClient.request, the time
+        left before the deadline when there is one.
+        """
+        if deadline is None:
+            return {}
+        return {'timeout': deadline.check()}
+
+    def record_attempt(self, attempt, method, abs_url, headers, started,
+                       status_code=None, resp_headers=None, error=None,
+                       deadline=None):
+        """
+        Record Attempt, reports a finished attempt to the circuit breaker and
+        the retry policy, and asks the policy whether it is retried.
+        Args:
+            attempt (int): Attempt number, starting at 1
+            method (str): Lower case HTTP method
+            abs_url (str): Absolute URL requested
+            headers (dict): Request headers
+            started (float): time.time() when the attempt started
+            status_code (int): HTTP status of the response, if any
+            resp_headers (dict): Response headers, if any
+            error (Exception): Error raised by the transport, if any
+            deadline (Deadline): Time budget of the call, no retry is made
+                that could not start before it passes
+
+        Returns:
+            float: Seconds to wait before the next attempt, or None if the
+            call is not retried.
+
+        Raises:
+            emburse.errors.EmburseDeadlineExceededError: if the transport
+                raised error once the deadline had passed, or when it left no
+                time for the retry, with error as its cause.
+        """
+        elapsed = time.time() - started
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(elapsed, status_code=status_code, error=error)
+        delay = self.retry_policy.next_delay(
+            attempt, method, headers, status_code=status_code,
+            resp_headers=resp_headers, error=error)
+        out_of_time = deadline is not None and (
+            deadline.expired or (delay is not None and delay >= deadline.remaining()))
+        if out_of_time:
+            delay = None
+        self.retry_policy.record(RetryAttempt(
+            attempt, method, abs_url, elapsed, status_code=status_code,
+            error=error, delay=delay))
+        if out_of_time and error is not None:
+            raise self.deadline_exceeded(deadline, error)
+        if delay is not None:
+            util.logger.info(
+                '{req_method} {req_url} attempt {attempt} failed ({reason}) after {elapsed:.3f}s, '
+                'retrying in {delay:.3f}s'.format(
+                    req_method=method.upper(),
+                    req_url=abs_url,
+                    attempt=attempt,
+                    reason=status_code or type(error).__name__,
+                    elapsed=elapsed,
+                    delay=delay
+                )
+            )
+        return delay
+
+    def deadline_exceeded(self, deadline, cause):
+        """
+        Deadline Exceeded, the error for a transport error that ended a call
+        because its deadline ran out.
+        Args:
+            deadline (Deadline): Time budget of the call
+            cause (Exception): Error raised by the transport
+
+        Returns:
+            emburse.errors.EmburseDeadlineExceededError: With cause as its
+            __cause__, or cause itself if it already is one.
+        """
+        if isinstance(cause, error.EmburseDeadlineExceededError):
+            return cause
+        exceeded = error.EmburseDeadlineExceededError(
+            'Deadline of {0:.3f}s exceeded: {1}'.format(deadline.seconds, cause)
+        )
+        exceeded.__cause__ = cause
+        return exceeded
+
+    def prepare_request(self, method, url, params=None, supplied_headers=None):
+        """
+        Prepare Request, builds everything needed to send an API call without
+        sending it, shared by the blocking and asyncio requestors.
+        Args:
+            method (str): Lower case HTTP method
+            url (str): API endpoint URL, relative to the API base
+            params (dict): Params to send to the API
+            supplied_headers (dict): Custom Headers to send with the request
+
+        Returns:
+            tuple (str, dict, str, str): The absolute URL, request headers,
+            request body and the auth token used.
+        """
 
         if self.auth_token:
             my_auth_token = self.auth_token
@@ -94,39 +506,56 @@ class Requestor(object):
             if params:
                 abs_url = self.build_api_url(abs_url, encoded_params)
             post_data = None
-        elif method == 'post':
+        elif method == 'post' or method == 'put':
             if not supplied_headers:
                 supplied_headers = {'Content-Type': 'application/json'}
-            post_data = util.json.dumps(self.api_encode_post(params or {}))
+            post_data = self.json_codec.dumps(self.api_encode_post(params or {}))
         else:
             raise error.EmburseAPIConnectionError('Unrecognized HTTP method {0}'.format(method))
 
-        ua = {
-            'bindings_version': version.VERSION,
-            'lang': 'python',
-            'publisher': 'pigeonly',
-            'httplib': self._client.name,
-        }
-        for attr, func in [['lang_version', platform.python_version], ['platform', platform.platform],
-                           ['uname', lambda: ' '.join(platform.uname())]]:
-            try:
-                val = func()
-            except Exception as e:
-                val = "!! {0}".format(e)
-            ua[attr] = val
-
         headers = {
-            'X-Client-User-Agent': util.json.dumps(ua),
+            'X-Client-User-Agent': self.client_user_agent(),
             'User-Agent': 'Pigeonly Emburse/v1 PythonBindings/{0}'.format(version.VERSION),
             'Authorization': 'Token {0}'.format(my_auth_token)
         }
 
         if supplied_headers is not None:
-            for key, value in supplied_headers.iteritems():
+            for key, value in supplied_headers.items():
                 headers[key] = value
 
-        resp_body, resp_code, resp_headers = self._client.request(method, abs_url, headers, post_data)
+        return abs_url, headers, post_data, my_auth_token
+
+    def client_user_agent(self):
+        """
+        Client User Agent, the X-Client-User-Agent header describing the
+        bindings and platform. Built once per requestor, as looking up the
+        platform is slow.
+
+        Returns:
+            str: JSON encoded description.
 
+        """
+        if self._client_user_agent is None:
+            ua = {
+                'bindings_version': version.VERSION,
+                'lang': 'python',
+                'publisher': 'pigeonly',
+                'httplib': self._client.name,
+            }
+            for attr, func in [['lang_version', platform.python_version], ['platform', platform.platform],
+                               ['uname', lambda: ' '.join(platform.uname())]]:
+                try:
+                    val = func()
+                except Exception as e:
+                    val = "!! {0}".format(e)
+                ua[attr] = val
+            self._client_user_agent = self.json_codec.dumps(ua)
+        return self._client_user_agent
+
+    def log_response(self, method, abs_url, resp_code, resp_body):
+        """
+        Log Response, logs the outcome of an API call.
+        """
         util.logger.info(
             '{req_method} {req_url} {code}'.format(req_method=method.upper(), req_url=abs_url, code=resp_code)
         )
@@ -137,13 +566,10 @@ class Requestor(object):
                 body=resp_body
             )
         )
-        return resp_body, resp_code, resp_headers, my_auth_token
 
     def interpret_response(self, resp_body, resp_code, resp_headers):
         try:
-            if hasattr(resp_body, 'decode'):
-                resp_body = resp_body.decode('utf-8')
-            resp = util.json.loads(resp_body)
+            resp = self.json_codec.loads(resp_body)
         except Exception:
             raise error.EmburseAPIError(
                 "Invalid response body from API: {0} (HTTP response code was {1})".format(
@@ -193,12 +619,7 @@ class Requestor(object):
         :return: ISO 8601 formatted datetime
         :rtype: str
         """
-        if dttime.tzinfo and dttime.tzinfo.utcoffset(dttime) is not None:
-            utc_timestamp = dttime.astimezone(tz=UTC)
-        else:
-            utc_timestamp = dttime.replace(tzinfo=UTC)
-
-        return utc_timestamp.isoformat()
+        return util.to_utc(dttime).isoformat()
 
     def encode_nested_dict(self, key, data, fmt='{0}[{1}]'):
         """
@@ -1,12 +1,28 @@
+import io
+import os
 import re
-from dateutil.parser import parse as date_parser
+import time
 import datetime
 import emburse.util as util
 import emburse.errors as error
-from emburse.requestor import Requestor
+import emburse.fields as field
+import emburse.http_client as http_client
+from emburse.bulk import DeleteResult, RetrieveResult, run_bulk
+from emburse.compact import compact as compact_values
+from emburse.context import ClientContext
+from emburse.daterange import fetch_windows, merge_csv, merge_unique
+from emburse.deadline import Deadline
+from emburse.concurrency import DEFAULT_CONCURRENCY, run_tasks
+from emburse.export import (ExportReport, ExportResult, export_response,
+                            statement_filename)
+from emburse.paging import iter_page_items, iter_pages, prefetch_pages
 
+DATE_RE = util.DATE_RE
 
-def convert_to_emburse_object(resp, auth_token, klass_name=None):
+FLOAT_RE = re.compile(r'^\d*\.\d$')
+
+
+def convert_to_emburse_object(resp, auth_token, klass_name=None, context=None):
     """
     Convert to Emburse Object, function to build emburse objects from the given
     response data.
@@ -18,46 +34,38 @@ def convert_to_emburse_object(resp, auth_token, klass_name=None):
             https://app.emburse.com/applications
         
         klass_name (str, optional): Name of the resource
+
+        context (emburse.context.ClientContext, optional): Context shared by
+            the built objects, a new one is created if not given.
     
     Returns:
         An Emburse Object
     
     """
-    types = {
-        'account': Account,
-        'allowance': Allowance,
-        'card': Card,
-        'category': Category,
-        'company': Company,
-        'department': Department,
-        'label': Label,
-        'location': Location,
-        'member': Member,
-        'sharedlink': SharedLink,
-        'statement': Statement,
-        'transaction': Transaction,
-    }
-
     if isinstance(resp, list):
-        return [convert_to_emburse_object(i, auth_token, klass_name=klass_name)
+        if context is None:
+            context = ClientContext(auth_token)
+        return [convert_to_emburse_object(i, auth_token, klass_name=klass_name,
+                                          context=context)
                 for i in resp]
     elif isinstance(resp, dict) and not isinstance(resp, APIResource):
         resp = resp.copy()
         if isinstance(klass_name, str):
             klass_name = re.sub('[^a-zA-Z]', '', klass_name)
-            klass = types.get(klass_name, APIResource)
+            klass = RESOURCE_TYPES.get(klass_name, APIResource)
         else:
             klass = APIResource
-        emburse_obj = klass(auth_token=auth_token)
+        emburse_obj = klass(auth_token=auth_token, context=context)
         return emburse_obj.refresh_from(resp)
-    else:
-        float_regex = re.compile(r'^\d*\.\d$')
-        if isinstance(resp, str) and is_date(resp):
-            return date_parser(resp)
-        elif isinstance(resp, str) and float_regex.match(resp):
+    elif isinstance(resp, str):
+        if DATE_RE.match(resp):
+            try:
+                return util.parse_datetime(resp)
+            except Exception:
+                pass
+        if FLOAT_RE.match(resp):
             return float(resp)
-        else:
-            return resp
+    return resp
 
 
 def is_date(resp):
@@ -71,11 +79,10 @@ def is_date(resp):
         bool: True if value is a date, False otherwise.
      
     """
-    date_re = re.compile(r'\d{4}\W\d{2}\W\d{2}')
-    if not date_re.match(resp):
+    if not DATE_RE.match(resp):
         return False
     try:
-        date_parser(resp)
+        util.parse_datetime(resp)
         return True
     except Exception:
         return False
@@ -89,18 +96,26 @@ class EmburseObject(object):
     
     """
 
-    def __init__(self, auth_token, **kwargs):
+    def __init__(self, auth_token=None, context=None, **kwargs):
         """
         Emburse Object
         
         Args:
             auth_token (str): Your application's auth token from
                 https://app.emburse.com/applications
+
+            context (emburse.context.ClientContext, optional): Shared client
+                context, if not given a new one is created for the auth token.
             
             **kwargs: if 'id' is given the resources id is set from the value.
             
         """
+        if context is None:
+            context = ClientContext(auth_token)
+        elif auth_token is None:
+            auth_token = context.auth_token
         self.auth_token = auth_token
+        self.context = context
         if 'id' in kwargs:
             self.id = kwargs['id']
 
@@ -114,34 +129,63 @@ class APIResource(EmburseObject):
     
     """
 
-    def __init__(self, auth_token, **params):
+    #: Schema of the resource, a dict of field name to emburse.fields.Field.
+    #: Listed fields are decoded directly, other values are kept as the api
+    #: sent them, apart from nested objects and lists which are still built
+    #: into resources. None guesses the type of every value instead.
+    fields = {}
+
+    #: Attributes the resource keeps for itself, never replaced by a lazy
+    #: refresh even if the api sends a field of the same name.
+    _internal_attrs = frozenset([
+        'auth_token', 'context', 'request_params', 'build_params',
+        '_lazy_values'
+    ])
+
+    def __init__(self, auth_token=None, context=None, **params):
         """
         Emburse API Resource Object
         
         Args:
             auth_token (str): Your application's auth token.
+
+            context (emburse.context.ClientContext, optional): Shared client
+                context the resource sends its requests through.
             
             **params: Values to set on the Resource
          
         """
-        super(APIResource, self).__init__(auth_token=auth_token, **params)
-        self.build_params = params
+        super(APIResource, self).__init__(
+            auth_token=auth_token,
+            context=context,
+            **params
+        )
         self.request_params = None
-        self.requestor = Requestor(token=self.auth_token)
-        for param_name, param_value in params.items():
-            klass_name = param_name
-            if klass_name == 'parent':
-                klass_name = self.class_name()
-
-            setattr(
-                self,
-                param_name,
-                convert_to_emburse_object(
-                    param_value,
-                    auth_token=auth_token,
-                    klass_name=klass_name
-                )
+        self.refresh_from(params)
+
+    @property
+    def requestor(self):
+        """
+        Requestor, the Requestor of the shared client context.
+
+        Returns:
+            emburse.requestor.Requestor
+
+        """
+        return self.context.requestor
+
+    def __getattr__(self, name):
+        # Only called for attributes that are not set, i.e. fields of a lazy
+        # resource that have not been read yet.
+        values = self.__dict__.get('_lazy_values')
+        if values is None or name not in values:
+            raise AttributeError(
+                "'{0}' object has no attribute '{1}'".format(
+                    type(self).__name__, name)
             )
+        value = self.decode_field(name, values[name])
+        setattr(self, name, value)
+        return value
 
     def __repr__(self):
         obj_params = []
@@ -159,13 +203,21 @@ class APIResource(EmburseObject):
             params=param_str
         )
 
-    def retrieve(self, identifier):
+    def retrieve(self, identifier, deadline=None, raw=False, typed=False):
         """
         Retrieve, gets data from api for the object type by a given identifier,
         object id.
         
         Args:
             identifier (str): UUID of the object.
+
+            deadline (Deadline|float, optional): Time budget for the call in
+                seconds, retries included.
+
+            raw (bool): Return the dictionary decoded from the api response
+                instead of a resource object.
+
+            typed (bool): With raw, convert the typed fields of the schema.
         
         Returns:
             An instance of the same type of api resource as the calling object
@@ -178,27 +230,104 @@ class APIResource(EmburseObject):
             <Card id='2316d331-e2d5-43f1-9c9d-8ca3a738df28'>
         
         """
-        instance = self.__class__(auth_token=self.auth_token)
+        instance = self.__class__(
+            auth_token=self.auth_token,
+            context=self.context
+        )
         instance.id = identifier
-        instance.refresh()
+        if raw:
+            return self.hydrate(
+                instance.make_request(method='GET',
+                                      url_=instance.instance_url(),
+                                      deadline=deadline),
+                raw=True,
+                typed=typed
+            )
+        instance.refresh(deadline=deadline)
         return instance
 
-    def refresh(self):
+    def retrieve_many(self, ids, concurrency=DEFAULT_CONCURRENCY,
+                      rate_limiter=None, deadline=None, raw=False,
+                      typed=False):
+        """
+        Retrieve Many, gets many objects of the current resource type by id
+        in parallel, e.g. the cards behind a set of transactions. Each id is
+        only requested once however often it is given, and every request
+        goes through the client's shared requestor.
+
+            >>> card_ids = [t.card.id for t in transactions if t.card]
+            >>> cards = client.Card.retrieve_many(card_ids)
+            >>> cards[card_ids[0]]
+            <Card id='2316d331-e2d5-43f1-9c9d-8ca3a738df28'>
+
+        Args:
+            ids (iterable): UUIDs of the objects.
+
+            concurrency (int): Maximum number of requests running at once.
+
+            rate_limiter (emburse.ratelimit.TokenBucket, optional): Extra
+                limit on this batch, on top of the client's rate limiter.
+
+            deadline (Deadline|float, optional): Time budget in seconds for
+                each request, retries included.
+
+            raw (bool): Return the dictionaries decoded from the api responses
+                instead of resource objects.
+
+            typed (bool): With raw, convert the typed fields of the schema.
+
+        Returns:
+            emburse.bulk.RetrieveResult: An ordered dict of the objects by id
+            in the order given, with the ids the api has no object for in
+            `missing` and any other errors by id in `failed`.
+
+        """
+        unique = []
+        seen = set()
+        for identifier in ids:
+            if identifier not in seen:
+                seen.add(identifier)
+                unique.append(identifier)
+
+        def fetch(identifier):
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            return self.retrieve(identifier, deadline=deadline, raw=raw,
+                                 typed=typed)
+
+        result = RetrieveResult()
+        for task in run_tasks(fetch, unique, concurrency=concurrency,
+                              ordered=True):
+            if task.ok:
+                result[task.item] = task.value
+            elif getattr(task.error, 'http_status', None) == 404:
+                result.missing.append(task.item)
+            else:
+                result.failed[task.item] = task.error
+        return result
+
+    def refresh(self, deadline=None):
         """
         Refresh, updates the current instance with data from the api.
+
+        Args:
+            deadline (Deadline|float, optional): Time budget for the call in
+                seconds, retries included.
         
         Returns:
             self: The current APIResource instance with updated properties
         
         """
         return self.refresh_from(
-            self.make_request(method='GET', url_=self.instance_url())
+            self.make_request(method='GET', url_=self.instance_url(),
+                              deadline=deadline)
         )
 
     def refresh_from(self, resp):
         """
         Refresh From, updates the properties of the current instance with values
-        from a dictionary 
+        from a dictionary. When the client context is lazy the values are
+        kept as they are and each one is converted the first time it is read.
         
         Args:
             resp (dict): Data to update teh instance properties with
@@ -208,22 +337,117 @@ class APIResource(EmburseObject):
         
         """
         self.build_params = resp
+        if self.context.lazy:
+            attrs = self.__dict__
+            for k in resp:
+                if k not in self._internal_attrs:
+                    attrs.pop(k, None)
+            previous = attrs.get('_lazy_values')
+            if previous:
+                values = dict(previous)
+                values.update(resp)
+                resp = values
+            self._lazy_values = resp
+            return self
         for k, v in resp.items():
-            klass_name = k
-            if klass_name == 'parent':
-                klass_name = self.class_name()
-
-            setattr(
-                self,
-                k,
-                convert_to_emburse_object(
-                    v,
-                    self.auth_token,
-                    klass_name=klass_name
-                )
-            )
+            setattr(self, k, self.decode_field(k, v))
         return self
 
+    def decode_field(self, name, value):
+        """
+        Decode Field, converts a value from the api using the resource's
+        fields schema.
+
+        Args:
+            name (str): Name of the field.
+
+            value: The value from the decoded JSON response.
+
+        Returns:
+            The converted value.
+
+        """
+        schema = self.fields
+        if schema is not None:
+            decoder = schema.get(name)
+            if decoder is not None:
+                return decoder.decode(value, self)
+            if not isinstance(value, (dict, list)):
+                return value
+        klass_name = name
+        if klass_name == 'parent':
+            klass_name = self.class_name()
+        return convert_to_emburse_object(
+            value,
+            self.auth_token,
+            klass_name=klass_name,
+            context=self.context
+        )
+
+    def hydrate(self, values, compact=False, raw=False, typed=False):
+        """
+        Hydrate, builds objects of the current resource type from api
+        response data.
+
+        Args:
+            values (dict|list): A resource's values or a list of them.
+
+            compact (bool): Build emburse.compact.CompactResource objects
+                instead of full resources.
+
+            raw (bool): Return the values as they are, no objects are built.
+
+            typed (bool): With raw, convert the typed fields of the schema in
+                copies of the values.
+
+        Returns:
+            A resource object, a dictionary, or a list of them.
+
+        """
+        if raw:
+            return self.typed_values(values) if typed else values
+        if compact:
+            return compact_values(values, self.class_name(), self.context)
+        return convert_to_emburse_object(
+            resp=values,
+            auth_token=self.auth_token,
+            klass_name=self.class_name(),
+            context=self.context
+        )
+
+    @classmethod
+    def typed_values(cls, values):
+        """
+        Typed Values, converts the timestamp, amount and nested resource
+        fields of the resource's schema, leaving everything else as the api
+        sent it. Nothing is converted when the resource has no schema.
+
+        Args:
+            values (dict|list): A resource's values or a list of them.
+
+        Returns:
+            dict|list: Copies of the values with the typed fields converted.
+
+        """
+        if isinstance(values, list):
+            return [cls.typed_values(item) for item in values]
+        schema = cls.fields
+        if not schema or not isinstance(values, dict):
+            return values
+        typed = dict(values)
+        for name, value in values.items():
+            decoder = schema.get(name)
+            if decoder is None or type(decoder) is field.Field:
+                continue
+            if isinstance(decoder, field.Resource):
+                klass_name = decoder.klass_name or cls.class_name()
+                klass = RESOURCE_TYPES.get(re.sub('[^a-zA-Z]', '', klass_name))
+                if klass is not None:
+                    typed[name] = klass.typed_values(value)
+            else:
+                typed[name] = decoder.decode(value, None)
+        return typed
+
     def instance_url(self):
         """
         Instance URL, gets the api end point for the current instance.
@@ -249,7 +473,7 @@ class APIResource(EmburseObject):
         extn = util.quote_plus(id_)
         return "{0}/{1}".format(base, extn)
 
-    def make_request(self, method, url_, **params):
+    def make_request(self, method, url_, deadline=None, **params):
         """
         Make Request, method to send requests to the given api end point with
         given parameters. 
@@ -258,6 +482,9 @@ class APIResource(EmburseObject):
             method (str): HTTP Method to use when making a request to the API.
             
             url_ (str): API endpoint URL for request.
+
+            deadline (Deadline|float, optional): Time budget for the call in
+                seconds, retries included.
             
             **params: The data to send to the API endpoint
         
@@ -269,7 +496,8 @@ class APIResource(EmburseObject):
         response, api_key = self.requestor.request(
             method=method.lower(),
             url_=url_,
-            params=params
+            params=params,
+            deadline=deadline
         )
 
         return response
@@ -294,7 +522,7 @@ class APIResource(EmburseObject):
         return resource_as_dict
 
     @classmethod
-    def construct_from(cls, values, auth_token):
+    def construct_from(cls, values, auth_token, context=None):
         """
         Construct From, builds an APIResource instance from the given data
         
@@ -302,13 +530,16 @@ class APIResource(EmburseObject):
             values (dict): the data to build the instance from.
             
             auth_token (str): Your application's auth token.
+
+            context (emburse.context.ClientContext, optional): Shared client
+                context for the new instance.
             
         Returns:
             An APIResource instance of the same type with data from the given
             values.
         
         """
-        instance = cls(auth_token=auth_token, **values)
+        instance = cls(auth_token=auth_token, context=context, **values)
         return instance
 
     @classmethod
@@ -364,25 +595,213 @@ class ListableAPIResource(APIResource):
     
     """
 
-    def list(self, **params):
+    #: Query param holding the page number when paging through a listing
+    page_param = 'page'
+
+    #: Query param holding the number of objects per page
+    page_size_param = 'limit'
+
+    #: Number of objects requested per page by iter
+    default_page_size = 100
+
+    #: Query param holding the start of a date range, used by list_range
+    start_date_param = 'start_date'
+
+    #: Query param holding the end of a date range, used by list_range
+    end_date_param = 'end_date'
+
+    def list(self, deadline=None, compact=False, raw=False, typed=False,
+             **params):
         """
         List, method to get a list of objects of the current resource type from
         the emburse api.
         
         Args:
+            deadline (Deadline|float, optional): Time budget for the call in
+                seconds, retries included.
+
+            compact (bool): Return emburse.compact.CompactResource objects,
+                read only and much smaller in memory.
+
+            raw (bool): Return the objects as the dictionaries decoded from
+                the api response, without building resource objects.
+
+            typed (bool): With raw, convert the typed fields of the schema,
+                e.g. timestamps to datetimes, in copies of the dictionaries.
+
             **params: Query parameters to filter list objects.
         
         Returns:
             A list of resource objects.
         
         """
-        resp = self.make_request(method='GET', url_=self.class_url(), **params)
+        return self.hydrate(self.list_raw(deadline=deadline, **params),
+                            compact=compact, raw=raw, typed=typed)
 
-        return convert_to_emburse_object(
-            resp=resp.get(self.class_name_plural(), []),
-            auth_token=self.auth_token,
-            klass_name=self.class_name()
-        )
+    def list_raw(self, deadline=None, **params):
+        """
+        List Raw, gets one listing from the emburse api without building
+        resource objects.
+
+        Args:
+            deadline (Deadline|float, optional): Time budget for the call in
+                seconds, retries included.
+
+            **params: Query parameters to filter list objects.
+
+        Returns:
+            list: The objects in the response as dictionaries.
+
+        """
+        resp = self.make_request(method='GET', url_=self.class_url(),
+                                 deadline=deadline, **params)
+        return resp.get(self.class_name_plural(), [])
+
+    def iter(self, page_size=None, prefetch=0, deadline=None, compact=False,
+             raw=False, typed=False, stream=False, **params):
+        """
+        Iter, generator that pages through every object of the current
+        resource type. Pages are fetched as iteration reaches them and only
+        the current page is held in memory, so breaking out of the loop
+        early skips the remaining requests.
+
+        Args:
+            page_size (int, optional): Objects to request per page, defaults
+                to default_page_size.
+
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread while the current page is consumed. Off by
+                default.
+
+            deadline (Deadline|float, optional): Time budget in seconds for
+                fetching every page, shared by all of the requests. Starts
+                when iteration starts.
+
+            compact (bool): Yield emburse.compact.CompactResource objects,
+                read only and much smaller in memory.
+
+            raw (bool): Yield the dictionaries decoded from the api response
+                without building resource objects.
+
+            typed (bool): With raw, convert the typed fields of the schema.
+
+            stream (bool): Parse each page incrementally and yield objects as
+                they are decoded, rather than decoding the whole page into
+                memory first. Useful with very large page sizes, cannot be
+                combined with prefetch.
+
+            **params: Query parameters to filter list objects.
+
+        Returns:
+            generator: Resource objects, in the order the api returns them.
+
+        Raises:
+            emburse.errors.EmburseValueError: if both prefetch and stream are
+                given.
+
+        :Example:
+            >>> for transaction in client.Transaction.iter(page_size=500):
+            >>>     print(transaction.amount)
+
+        """
+        if prefetch and stream:
+            raise error.EmburseValueError(
+                'prefetch cannot be used with stream, streamed pages are read '
+                'as they are consumed.')
+        page_size = page_size or self.default_page_size
+        deadline = Deadline.coerce(deadline)
+
+        def page_params(page):
+            query = dict(params)
+            query[self.page_param] = page
+            query[self.page_size_param] = page_size
+            return query
+
+        if stream:
+            def fetch_items(page):
+                return self.requestor.request_items(
+                    'get', self.class_url(), self.class_name_plural(),
+                    params=page_params(page), deadline=deadline)
+
+            for item in iter_page_items(fetch_items, page_size):
+                yield self.hydrate(item, compact=compact, raw=raw, typed=typed)
+            return
+
+        def fetch_page(page):
+            return self.list_raw(deadline=deadline, **page_params(page))
+
+        pages = iter_pages(fetch_page, page_size)
+        if prefetch:
+            pages = prefetch_pages(pages, prefetch)
+        for page in pages:
+            for item in page:
+                yield self.hydrate(item, compact=compact, raw=raw, typed=typed)
+
+    def list_range(self, start_date, end_date, windows=4, concurrency=None,
+                   deadline=None, compact=False, raw=False, typed=False,
+                   **params):
+        """
+        List Range, lists the objects in a date range by splitting it into
+        windows fetched in parallel, each paged through with iter, instead
+        of one long running query. Results are merged in date order and an
+        object returned by two windows, e.g. one on the edge between them,
+        is kept once.
+
+            >>> transactions = client.Transaction.list_range(
+            >>>     datetime(2017, 1, 1), datetime(2018, 1, 1), windows=12)
+
+        Args:
+            start_date (datetime): Start of the range, sent as
+                start_date_param.
+
+            end_date (datetime): End of the range, sent as end_date_param.
+
+            windows (int): Number of windows to split the range into.
+
+            concurrency (int, optional): Maximum windows fetched at once,
+                defaults to all of them.
+
+            deadline (Deadline|float, optional): Time budget in seconds for
+                the whole range.
+
+            compact (bool): Return emburse.compact.CompactResource objects.
+
+            raw (bool): Return the dictionaries decoded from the api.
+
+            typed (bool): With raw, convert the typed fields of the schema.
+
+            **params: Query parameters to filter list objects.
+
+        Returns:
+            list: Resource objects, ordered by window.
+
+        Raises:
+            emburse.errors.EmburseValueError: if end_date is before
+                start_date.
+
+        """
+        deadline = Deadline.coerce(deadline)
+
+        def fetch(start, end):
+            window_params = dict(params)
+            window_params[self.start_date_param] = start
+            window_params[self.end_date_param] = end
+            return list(self.iter(deadline=deadline, raw=True,
+                                  **window_params))
+
+        items = merge_unique(fetch_windows(fetch, start_date, end_date,
+                                           windows, concurrency=concurrency))
+        return self.hydrate(items, compact=compact, raw=raw, typed=typed)
+
+    def auto_paging_iter(self, page_size=None, prefetch=0, deadline=None,
+                         compact=False, raw=False, typed=False, stream=False,
+                         **params):
+        """
+        Auto Paging Iter, alias of iter.
+        """
+        return self.iter(page_size=page_size, prefetch=prefetch,
+                         deadline=deadline, compact=compact, raw=raw,
+                         typed=typed, stream=stream, **params)
 
 
 class CreateableAPIResource(APIResource):
@@ -409,11 +828,14 @@ class CreateableAPIResource(APIResource):
         """
         return []
 
-    def create(self, **params):
+    def create(self, deadline=None, **params):
         """
         Create, creates a new resource with the given values.
         
         Args:
+            deadline (Deadline|float, optional): Time budget for the call in
+                seconds, retries included.
+
             **params: Values to create a new resource
         
         Returns:
@@ -426,6 +848,105 @@ class CreateableAPIResource(APIResource):
             emburse.errors.EmburseAttributeError: if a required param is missing
                 or of the wrong type.
             
+        """
+        params = self.build_create_params(params)
+        resp = self.make_request(
+            method='post',
+            url_=self.class_url(),
+            deadline=deadline,
+            **params
+        )
+
+        return self.construct_from(
+            values=resp,
+            auth_token=self.auth_token,
+            context=self.context
+        )
+
+    def create_many(self, specs, concurrency=DEFAULT_CONCURRENCY,
+                    rate_limiter=None, deadline=None):
+        """
+        Create Many, creates a batch of resources in parallel, e.g. vendor
+        cards for every supplier.
+
+        Every spec is validated against required_create_params and encoded
+        before any request is sent, so a bad spec fails the whole batch
+        up front instead of half way through. The creates then run in the
+        background through the client's shared requestor, with its retries
+        and rate limiting, and the returned BulkResult yields each one as it
+        completes. A failed create is reported in the result and does not
+        stop the others.
+
+            >>> result = client.Card.create_many(
+            >>>     [{'description': name, 'allowance': allowance,
+            >>>       'is_virtual': True} for name in vendors],
+            >>>     concurrency=8)
+            >>> cards = result.wait().succeeded
+
+        Args:
+            specs (iterable): A dict of create params per resource.
+
+            concurrency (int): Maximum number of creates running at once.
+
+            rate_limiter (emburse.ratelimit.TokenBucket, optional): Extra
+                limit on this batch, on top of the client's rate limiter.
+
+            deadline (Deadline|float, optional): Time budget in seconds for
+                each create, retries included.
+
+        Returns:
+            emburse.bulk.BulkResult: Created resources and failures, each
+            with the spec it was made from.
+
+        Raises:
+            emburse.errors.EmburseResourceError: if the required_create_params
+                list is empty.
+
+            emburse.errors.EmburseAttributeError: if a required param of any
+                spec is missing or of the wrong type.
+
+        """
+        specs = list(specs)
+        prepared = []
+        for index, spec in enumerate(specs):
+            try:
+                params = self.build_create_params(dict(spec))
+            except error.EmburseAttributeError as e:
+                raise error.EmburseAttributeError(
+                    'Spec {0}: {1}'.format(index, e))
+            prepared.append(self.requestor.prepare_request(
+                'post', self.class_url(), params))
+
+        def create(index):
+            resp, api_key = self.requestor.request_prepared(
+                'post', prepared[index], deadline=deadline)
+            return self.construct_from(
+                values=resp,
+                auth_token=self.auth_token,
+                context=self.context
+            )
+
+        return run_bulk(create, specs, concurrency=concurrency,
+                        rate_limiter=rate_limiter)
+
+    def build_create_params(self, params):
+        """
+        Build Create Params, validates the values for a new resource against
+        required_create_params and converts resource values to dictionaries.
+
+        Args:
+            params (dict): Values to create a new resource
+
+        Returns:
+            dict: The params to send to the api
+
+        Raises:
+            emburse.errors.EmburseResourceError: if the required_create_params
+                list is empty.
+
+            emburse.errors.EmburseAttributeError: if a required param is missing
+                or of the wrong type.
+
         """
         if len(self.required_create_params) <= 0:
             raise error.EmburseResourceError(
@@ -448,16 +969,7 @@ class CreateableAPIResource(APIResource):
             if isinstance(params.get(required.get('name')), APIResource):
                 params[required.get('name')] = params[
                     required.get('name')].as_dict()
-        resp = self.make_request(
-            method='post',
-            url_=self.class_url(),
-            **params
-        )
-
-        return self.construct_from(
-            values=resp,
-            auth_token=self.auth_token
-        )
+        return params
 
 
 class UpdateableAPIResource(APIResource):
@@ -467,11 +979,14 @@ class UpdateableAPIResource(APIResource):
     
     """
 
-    def update(self, **params):
+    def update(self, deadline=None, **params):
         """
         Update, updates the given values for the resource instance.
         
         Args:
+            deadline (Deadline|float, optional): Time budget for the call in
+                seconds, retries included.
+
             **params: Values to be updated
         
         Returns:
@@ -485,6 +1000,106 @@ class UpdateableAPIResource(APIResource):
             >>> card.update(state='suspended')
             <Card id='ce93d83a-8a43-439d-9f5b-cc6ed89ecf89', state='suspended'>
         
+        """
+        self.refresh_from(
+            resp=self.make_request(
+                method='put',
+                url_=self.instance_url(),
+                deadline=deadline,
+                **self.build_update_params(params)
+            ),
+        )
+        return self
+
+    def update_many(self, ids_or_objects, concurrency=DEFAULT_CONCURRENCY,
+                    rate_limiter=None, hydrate=True, deadline=None,
+                    **changes):
+        """
+        Update Many, applies the same changes to many resources in parallel,
+        e.g. suspending a set of cards.
+
+        The requests are encoded before any is sent, and run in the
+        background through the client's shared requestor, with its retries
+        and rate limiting. The returned BulkResult yields each update as it
+        completes. A failed update is reported in the result and does not
+        stop the others.
+
+            >>> result = client.Card.update_many(card_ids, state='suspended',
+            >>>                                  hydrate=False)
+            >>> for item in result.wait().failed:
+            >>>     print(item.item, item.error)
+
+        Args:
+            ids_or_objects (iterable): Resource ids, or resources with their
+                id set.
+
+            concurrency (int): Maximum number of updates running at once.
+
+            rate_limiter (emburse.ratelimit.TokenBucket, optional): Extra
+                limit on this batch, on top of the client's rate limiter.
+
+            hydrate (bool): Build a resource from each response; resources
+                passed in are refreshed in place. With False the responses are
+                returned as the dictionaries decoded from the api, skipping
+                the cost of building objects no one will read.
+
+            deadline (Deadline|float, optional): Time budget in seconds for
+                each update, retries included.
+
+            **changes: Values to update on every resource.
+
+        Returns:
+            emburse.bulk.BulkResult: The updated resources, or responses,
+            and failures, each with the id or object it was made from.
+
+        Raises:
+            emburse.errors.EmburseAttributeError: if an item has no id.
+
+        """
+        items = list(ids_or_objects)
+        targets = []
+        prepared = []
+        for index, item in enumerate(items):
+            if isinstance(item, APIResource):
+                target = item
+            else:
+                target = self.__class__(auth_token=self.auth_token,
+                                        context=self.context)
+                target.id = item
+            try:
+                params = target.build_update_params(dict(changes))
+            except error.EmburseAttributeError as e:
+                raise error.EmburseAttributeError(
+                    'Item {0}: {1}'.format(index, e))
+            targets.append(target)
+            prepared.append(self.requestor.prepare_request(
+                'put', target.instance_url(), params))
+
+        def update(index):
+            resp, api_key = self.requestor.request_prepared(
+                'put', prepared[index], deadline=deadline)
+            if not hydrate:
+                return resp
+            return targets[index].refresh_from(resp)
+
+        return run_bulk(update, items, concurrency=concurrency,
+                        rate_limiter=rate_limiter)
+
+    def build_update_params(self, params):
+        """
+        Build Update Params, sets the resource id from the params if needed and
+        converts resource values to dictionaries.
+
+        Args:
+            params (dict): Values to be updated
+
+        Returns:
+            dict: The params to send to the api
+
+        Raises:
+            emburse.errors.EmburseAttributeError: if instance does not have an
+            id set and the id was not in the params.
+
         """
         param_copy = params
         if not self.id:
@@ -498,14 +1113,7 @@ class UpdateableAPIResource(APIResource):
         for param_name, param_value in params.items():
             if isinstance(param_value, APIResource):
                 param_copy[param_name] = param_value.as_dict()
-        self.refresh_from(
-            resp=self.make_request(
-                method='put',
-                url_=self.instance_url(),
-                **param_copy
-            ),
-        )
-        return self
+        return param_copy
 
 
 class DeletableAPIResource(APIResource):
@@ -515,12 +1123,15 @@ class DeletableAPIResource(APIResource):
     
     """
 
-    def delete(self, identifier=None):
+    def delete(self, identifier=None, deadline=None):
         """
         Delete, deletes a resource from the api
         
         Args:
             identifier (str, optional): The id of the resource to delete.
+
+            deadline (Deadline|float, optional): Time budget for the call in
+                seconds, retries included.
         
         Returns:
             self: Current resource instance
@@ -537,9 +1148,59 @@ class DeletableAPIResource(APIResource):
                 ('ID: is a required property and must be set to delete this ' 
                  'resource!')
             )
-        self.make_request(method='delete', url_=self.instance_url())
+        self.make_request(method='delete', url_=self.instance_url(),
+                          deadline=deadline)
         return self
 
+    def delete_many(self, ids, concurrency=DEFAULT_CONCURRENCY,
+                    rate_limiter=None, deadline=None):
+        """
+        Delete Many, deletes many resources in parallel, e.g. cleaning up
+        test labels and locations, each one through delete.
+
+        A resource the api answers 404 for is counted as already deleted,
+        which is a success rather than a failure, so a clean up can safely be
+        run again. Other failures are reported in the result and do not stop
+        the others.
+
+            >>> result = client.Label.delete_many(label_ids).wait()
+            >>> result.summary()
+            {'total': 120, 'succeeded': 118, 'failed': 2, 'pending': 0,
+             'cancelled': 0, 'already_deleted': 5}
+
+        Args:
+            ids (iterable): Resource ids, or resources with their id set.
+
+            concurrency (int): Maximum number of deletes running at once.
+
+            rate_limiter (emburse.ratelimit.TokenBucket, optional): Extra
+                limit on this batch, on top of the client's rate limiter.
+
+            deadline (Deadline|float, optional): Time budget in seconds for
+                each delete, retries included.
+
+        Returns:
+            emburse.bulk.DeleteResult: For each id, True if it was deleted or
+            False if it was already gone, and the failures.
+
+        """
+        ids = list(ids)
+
+        def delete(index):
+            instance = self.__class__(auth_token=self.auth_token,
+                                      context=self.context)
+            instance.id = getattr(ids[index], 'id', ids[index])
+            try:
+                instance.delete(deadline=deadline)
+            except error.EmburseError as e:
+                if e.http_status == 404:
+                    return False
+                raise
+            return True
+
+        return run_bulk(delete, ids, concurrency=concurrency,
+                        rate_limiter=rate_limiter, result_class=DeleteResult)
+
 
 class Account(ListableAPIResource):
     """
@@ -549,6 +1210,14 @@ class Account(ListableAPIResource):
     
     """
 
+    fields = {
+        'available_balance': field.Amount(),
+        'created_at': field.Timestamp(),
+        'ledger_balance': field.Amount(),
+        'name': field.Field(),
+        'number': field.Field()
+    }
+
     @property
     def Statement(self):
         """
@@ -567,6 +1236,7 @@ class Account(ListableAPIResource):
             )
         return Statement(
             auth_token=self.auth_token,
+            context=self.context,
             account_id=self.id
         )
 
@@ -579,6 +1249,19 @@ class Allowance(ListableAPIResource):
     
     """
 
+    fields = {
+        'amount': field.Amount(),
+        'balance': field.Amount(),
+        'created_at': field.Timestamp(),
+        'daily_limit': field.Amount(),
+        'end_time': field.Timestamp(),
+        'interval': field.Field(),
+        'scope': field.Field(),
+        'transaction_limit': field.Amount(),
+        'usage_limit': field.Field(),
+        'uses_remaining': field.Field()
+    }
+
     @property
     def required_create_params(self):
         """
@@ -652,7 +1335,8 @@ class Allowance(ListableAPIResource):
             params['interval'] = None
         return self.construct_from(
             values=params,
-            auth_token=self.auth_token
+            auth_token=self.auth_token,
+            context=self.context
         )
 
 
@@ -665,6 +1349,24 @@ class Card(ListableAPIResource, CreateableAPIResource, UpdateableAPIResource,
     
     """
 
+    fields = {
+        'allowance': field.Resource('allowance'),
+        'assigned_to': field.Resource('member'),
+        'billing_address': field.Resource('address'),
+        'category': field.Resource('category'),
+        'created_at': field.Timestamp(),
+        'department': field.Resource('department'),
+        'description': field.Field(),
+        'expiration': field.Timestamp(),
+        'is_virtual': field.Field(),
+        'label': field.Resource('label'),
+        'last_four': field.Field(),
+        'location': field.Resource('location'),
+        'shared_link': field.Resource('sharedlink'),
+        'shipping_address': field.Resource('address'),
+        'state': field.Field()
+    }
+
     @property
     def required_create_params(self):
         """
@@ -691,6 +1393,13 @@ class Category(ListableAPIResource, CreateableAPIResource,
     API DOC: https://www.emburse.com/api/v1/docs#category
     """
 
+    fields = {
+        'code': field.Field(),
+        'created_at': field.Timestamp(),
+        'name': field.Field(),
+        'parent': field.Resource()
+    }
+
     @property
     def required_create_params(self):
         """
@@ -718,6 +1427,13 @@ class Company(APIResource):
     API DOC: https://www.emburse.com/api/v1/docs#company
     """
 
+    fields = {
+        'created_at': field.Timestamp(),
+        'name': field.Field(),
+        'shipping_address': field.Resource('address'),
+        'website': field.Field()
+    }
+
     @classmethod
     def class_name_plural(cls):
         return 'company'
@@ -732,6 +1448,12 @@ class Department(ListableAPIResource, CreateableAPIResource,
     
     """
 
+    fields = {
+        'created_at': field.Timestamp(),
+        'name': field.Field(),
+        'parent': field.Resource()
+    }
+
     @property
     def required_create_params(self):
         """
@@ -757,6 +1479,12 @@ class Label(ListableAPIResource, CreateableAPIResource, UpdateableAPIResource,
     
     """
 
+    fields = {
+        'created_at': field.Timestamp(),
+        'name': field.Field(),
+        'parent': field.Resource()
+    }
+
     @property
     def required_create_params(self):
         """
@@ -782,6 +1510,12 @@ class Location(ListableAPIResource, CreateableAPIResource,
     
     """
 
+    fields = {
+        'created_at': field.Timestamp(),
+        'name': field.Field(),
+        'parent': field.Resource()
+    }
+
     @property
     def required_create_params(self):
         """
@@ -806,7 +1540,13 @@ class Member(ListableAPIResource, CreateableAPIResource, UpdateableAPIResource,
     API DOC: https://www.emburse.com/api/v1/docs#member
     
     """
-    pass
+
+    fields = {
+        'created_at': field.Timestamp(),
+        'email': field.Field(),
+        'first_name': field.Field(),
+        'last_name': field.Field()
+    }
 
 
 class SharedLink(ListableAPIResource, CreateableAPIResource,
@@ -818,6 +1558,12 @@ class SharedLink(ListableAPIResource, CreateableAPIResource,
     
     """
 
+    fields = {
+        'card': field.Field(),
+        'created_at': field.Timestamp(),
+        'link': field.Field()
+    }
+
     @property
     def required_create_params(self):
         """
@@ -846,6 +1592,12 @@ class Statement(ListableAPIResource):
     
     """
 
+    fields = {
+        'created_at': field.Timestamp(),
+        'end_date': field.Timestamp(),
+        'start_date': field.Timestamp()
+    }
+
     #: Constant for comma separated value format file
     CSV_FORMAT = 'csv'
 
@@ -855,7 +1607,8 @@ class Statement(ListableAPIResource):
     #: Constant for open financial exchange format file
     OXF_FORMAT = 'oxf'
 
-    def export(self, start_date=None, end_date=None, file_format=None):
+    def export(self, start_date=None, end_date=None, file_format=None,
+               deadline=None):
         """
         Export, method to export the bank statement for the account in a
         optional date range. If no file format is given, will default to csv
@@ -869,6 +1622,9 @@ class Statement(ListableAPIResource):
 
             file_format (str): Optional file format for the bank statement 
 
+            deadline (Deadline|float): Optional time budget for the call in
+            seconds, retries included.
+
         Returns:
             The file contents in the requested format.
 
@@ -878,13 +1634,238 @@ class Statement(ListableAPIResource):
             error.EmburseTypeError if start_date or end_date are not of type
             datetime.
 
+        """
+        url, params, file_format = self.export_request(
+            start_date, end_date, file_format)
+        resp = self.make_request(method='GET', url_=url, deadline=deadline,
+                                 **params)
+        return resp
+
+    def export_to(self, destination, start_date=None, end_date=None,
+                  file_format=None, deadline=None,
+                  chunk_size=http_client.CHUNK_SIZE):
+        """
+        Export To, streams the bank statement for the account straight to a
+        file. The body is written as it is received, a chunk at a time, and
+        is not decoded, so large PDF statements are never held in memory.
+        Defaults are the same as export's.
+
+        A path is written through a '.part' file that is renamed into place
+        once complete, so a failed download never leaves a partial file at
+        the path.
+
+        Args:
+            destination (str|file): Path to write to, or a file object opened
+                in binary mode.
+
+            start_date (datetime): Optional start of date range for statement
+
+            end_date (datetime): Optional end of date range for bank statement
+
+            file_format (str): Optional file format for the bank statement
+
+            deadline (Deadline|float): Optional time budget in seconds for
+                getting the response, retries included. Reading the body is
+                bounded by the HTTP client's read timeout.
+
+            chunk_size (int): Bytes read and written at a time.
+
+        Returns:
+            emburse.export.ExportResult: The path, bytes written and seconds
+            taken.
+
+        Raises:
+            error.EmburseValueError if account_id is not set.
+
+            error.EmburseTypeError if start_date or end_date are not of type
+            datetime.
+
+            error.EmburseAPIError if the api returns an error.
+
+        """
+        url, params, file_format = self.export_request(
+            start_date, end_date, file_format)
+        started = time.time()
+        resp = self.requestor.request_stream(
+            'get', url, params=params, deadline=deadline)
+        if not (200 <= resp.status_code < 300):
+            with resp:
+                self.requestor.interpret_response(
+                    resp.read(), resp.status_code, resp.headers)
+        return export_response(resp, destination, started,
+                               file_format=file_format,
+                               chunk_size=chunk_size)
+
+    def export_many(self, accounts, directory, start_date=None, end_date=None,
+                    file_format=None, concurrency=4, resume=True,
+                    deadline=None):
+        """
+        Export Many, downloads the bank statements of many accounts at once,
+        e.g. for month end close, streaming each one to a file in directory.
+
+        Files are named by statement_filename from the account id, dates and
+        format, so running the same export again finds the files written
+        before. With resume, files that already exist are skipped; a file
+        only appears once it is complete, so an interrupted export is picked
+        up where it stopped. A failed account is reported in the result and
+        does not stop the others.
+
+            >>> report = client.Statement.export_many(
+            >>>     client.Account.list(), '/tmp/statements',
+            >>>     start_date=start, end_date=end, file_format='pdf')
+            >>> for failed in report.failed:
+            >>>     print(failed.key, failed.error)
+
+        Args:
+            accounts (list): Account ids, or emburse.resource.Account objects
+                such as the output of Account.list().
+
+            directory (str): Directory to write the statements to, created if
+                missing.
+
+            start_date (datetime): Optional start of date range for statement
+
+            end_date (datetime): Optional end of date range for bank statement
+
+            file_format (str): Optional file format for the bank statement
+
+            concurrency (int): Maximum number of statements downloaded at
+                once.
+
+            resume (bool): Skip statements whose file already exists.
+
+            deadline (Deadline|float): Optional time budget in seconds for
+                each statement's request.
+
+        Returns:
+            emburse.export.ExportReport: An ExportResult per account, in the
+            order given and once per account id, keyed by the account id, with
+            durations and errors.
+
+        Raises:
+            error.EmburseTypeError if start_date or end_date are not of type
+            datetime.
+
+        """
+        started = time.time()
+        # An account given twice is exported once, two downloads would race
+        # on the same file.
+        account_ids = []
+        seen = set()
+        for account in accounts:
+            account_id = getattr(account, 'id', account)
+            if account_id not in seen:
+                seen.add(account_id)
+                account_ids.append(account_id)
+        if not account_ids:
+            return ExportReport([], time.time() - started)
+        # Validates the dates and format once, before any request is sent.
+        url, params, file_format = self.export_request(
+            start_date, end_date, file_format, account_id=account_ids[0])
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        def export_account(account_id):
+            path = os.path.join(directory, statement_filename(
+                account_id, start_date, end_date, file_format))
+            if resume and os.path.exists(path):
+                return ExportResult(path, 0, 0.0, file_format=file_format,
+                                    skipped=True, key=account_id)
+            statement = Statement(auth_token=self.auth_token,
+                                  context=self.context, account_id=account_id)
+            result = statement.export_to(
+                path, start_date=start_date, end_date=end_date,
+                file_format=file_format, deadline=deadline)
+            result.key = account_id
+            return result
+
+        results = []
+        for task in run_tasks(export_account, account_ids,
+                              concurrency=concurrency, ordered=True):
+            if task.ok:
+                results.append(task.value)
+            else:
+                results.append(ExportResult(
+                    None, 0, task.elapsed, file_format=file_format,
+                    error=task.error, key=task.item))
+        return ExportReport(results, time.time() - started)
+
+    def export_range(self, start_date, end_date, windows=4, concurrency=None,
+                     deadline=None):
+        """
+        Export Range, exports a long CSV statement for the account by
+        splitting the date range into windows downloaded in parallel. The
+        CSV documents are joined in date order with a single header row.
+
+        Args:
+            start_date (datetime): Start of date range for statement
+
+            end_date (datetime): End of date range for bank statement
+
+            windows (int): Number of windows to split the range into.
+
+            concurrency (int, optional): Maximum windows downloaded at once,
+                defaults to all of them.
+
+            deadline (Deadline|float): Optional time budget in seconds for
+                the whole range.
+
+        Returns:
+            str: The statement as CSV.
+
+        Raises:
+            error.EmburseValueError if account_id is not set or end_date is
+            before start_date.
+
+            error.EmburseTypeError if start_date or end_date are not of type
+            datetime.
+
+        """
+        self.export_request(start_date, end_date, Statement.CSV_FORMAT)
+        deadline = Deadline.coerce(deadline)
+
+        def fetch(start, end):
+            body = io.BytesIO()
+            self.export_to(body, start_date=start, end_date=end,
+                           file_format=Statement.CSV_FORMAT, deadline=deadline)
+            return body.getvalue().decode('utf-8')
+
+        return merge_csv(fetch_windows(fetch, start_date, end_date, windows,
+                                       concurrency=concurrency))
+
+    def export_request(self, start_date=None, end_date=None,
+                       file_format=None, account_id=None):
+        """
+        Export Request, validates the arguments of an export and builds the
+        url and params to request it with.
+
+        Args:
+            start_date (datetime): Optional start of date range for statement
+
+            end_date (datetime): Optional end of date range for bank statement
+
+            file_format (str): Optional file format for the bank statement
+
+            account_id (str): Optional account to export, defaults to the
+                statement's account_id.
+
+        Returns:
+            tuple (str, dict, str): The url, the date params and the file
+            format used.
+
+        Raises:
+            error.EmburseValueError if account_id is not set.
+
+            error.EmburseTypeError if start_date or end_date are not of type
+            datetime.
+
         """
         valid_formats = [
             Statement.CSV_FORMAT,
             Statement.PDF_FORMAT,
             Statement.OXF_FORMAT
         ]
-        account_id = getattr(self, 'account_id', None)
+        account_id = account_id or getattr(self, 'account_id', None)
         params = {}
         if not account_id:
             raise error.EmburseValueError(
@@ -912,8 +1893,7 @@ class Statement(ListableAPIResource):
             acc_id=account_id,
             fmt=file_format
         )
-        resp = self.make_request(method='GET', url_=url, params=params)
-        return resp
+        return url, params, file_format
 
     def as_dict(self):
         """
@@ -930,7 +1910,7 @@ class Statement(ListableAPIResource):
             'Method not supported by this resource!'
         )
 
-    def refresh(self):
+    def refresh(self, deadline=None):
         """
         Refresh, is not implemented by this resource
 
@@ -945,13 +1925,19 @@ class Statement(ListableAPIResource):
             'Method not supported by this resource!'
         )
 
-    def retrieve(self, identifier):
+    def retrieve(self, identifier, deadline=None, raw=False, typed=False):
         """
         Retrieve,, is not implemented by this resource
 
         Args:
             identifier (str): ID of the resource. 
 
+            deadline (Deadline|float, optional): Unused.
+
+            raw (bool): Unused.
+
+            typed (bool): Unused.
+
         Returns:
             Never returns anything
 
@@ -971,4 +1957,35 @@ class Transaction(ListableAPIResource, UpdateableAPIResource):
     API DOC: https://www.emburse.com/api/v1/docs#transaction
     
     """
-    pass
\ No newline at end of file
+
+    fields = {
+        'amount': field.Amount(),
+        'card': field.Resource('card'),
+        'category': field.Resource('category'),
+        'created_at': field.Timestamp(),
+        'department': field.Resource('department'),
+        'label': field.Resource('label'),
+        'location': field.Resource('location'),
+        'member': field.Resource('member'),
+        'note': field.Field(),
+        'receipt': field.Resource('receipt'),
+        'state': field.Field(),
+        'time': field.Timestamp(),
+        'vendor': field.Resource('vendor')
+    }
+
+
+RESOURCE_TYPES = {
+    'account': Account,
+    'allowance': Allowance,
+    'card': Card,
+    'category': Category,
+    'company': Company,
+    'department': Department,
+    'label': Label,
+    'location': Location,
+    'member': Member,
+    'sharedlink': SharedLink,
+    'statement': Statement,
+    'transaction': Transaction,
+}
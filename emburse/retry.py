@@ -0,0 +1,251 @@
+import math
+import random
+import time
+from email.utils import parsedate_tz, mktime_tz
+
+#: HTTP methods that can be safely sent more than once
+IDEMPOTENT_METHODS = ('get', 'head', 'options', 'put', 'delete')
+
+#: Header that makes a non idempotent request safe to retry
+IDEMPOTENCY_KEY_HEADER = 'Idempotency-Key'
+
+
+def get_header(headers, name):
+    """
+    Get Header, case insensitive header lookup that works for plain dicts as
+    well as the header mappings returned by the HTTP clients.
+
+    Args:
+        headers (dict): Response or request headers.
+
+        name (str): Header name.
+
+    Returns:
+        The header value, or None if it is not set.
+
+    """
+    if not headers:
+        return None
+    value = headers.get(name)
+    if value is not None:
+        return value
+    lower = name.lower()
+    for key, value in headers.items():
+        if key.lower() == lower:
+            return value
+    return None
+
+
+class RetryAttempt(object):
+    """
+    Retry Attempt, record of one attempt at an API call, handed to the
+    policy's on_attempt callback so every attempt, not only the final one,
+    can be fed into latency metrics.
+    """
+
+    def __init__(self, attempt, method, url, elapsed, status_code=None,
+                 error=None, delay=None):
+        """
+        Retry Attempt
+
+        Args:
+            attempt (int): Attempt number, starting at 1.
+
+            method (str): HTTP method.
+
+            url (str): Absolute URL requested.
+
+            elapsed (float): Seconds the attempt took.
+
+            status_code (int, optional): HTTP status of the response, None if
+                the request failed before a response was received.
+
+            error (Exception, optional): Error raised by the transport.
+
+            delay (float, optional): Seconds waited before the next attempt,
+                None if the call is not retried.
+
+        """
+        self.attempt = attempt
+        self.method = method
+        self.url = url
+        self.elapsed = elapsed
+        self.status_code = status_code
+        self.error = error
+        self.delay = delay
+
+    @property
+    def will_retry(self):
+        return self.delay is not None
+
+    def __repr__(self):
+        return ('<RetryAttempt attempt={0} method={1} status_code={2} '
+                'elapsed={3:.3f} delay={4}>').format(
+            self.attempt, self.method.upper(), self.status_code, self.elapsed,
+            self.delay)
+
+
+class RetryPolicy(object):
+    """
+    Retry Policy
+
+    Decides whether a failed API call is attempted again and how long to
+    wait first. Connection errors and responses with a retryable status are
+    retried with exponential backoff and full jitter, waiting for the
+    server's Retry-After instead when one is sent. Only idempotent methods
+    are retried, unless the request carries an Idempotency-Key header.
+
+        >>> client = emburse.Client(
+        >>>     auth_token='abc123',
+        >>>     retry_policy=RetryPolicy(max_attempts=5)
+        >>> )
+
+    """
+
+    def __init__(self, max_attempts=3, backoff_base=0.5, backoff_max=30.0,
+                 retry_statuses=(429, 502, 503, 504),
+                 retry_connection_errors=True, respect_retry_after=True,
+                 on_attempt=None):
+        """
+        Retry Policy
+
+        Args:
+            max_attempts (int): Maximum number of attempts per call,
+                including the first one. 1 disables retries.
+
+            backoff_base (float): Seconds the backoff starts from, doubled
+                on every attempt.
+
+            backoff_max (float): Upper bound in seconds of the backoff and of
+                a Retry-After wait.
+
+            retry_statuses (tuple): HTTP statuses that are retried.
+
+            retry_connection_errors (bool): Retry when the transport raises
+                EmburseAPIConnectionError.
+
+            respect_retry_after (bool): Wait for the Retry-After header of the
+                response when present.
+
+            on_attempt (callable, optional): Called with a RetryAttempt after
+                every attempt.
+
+        """
+        self.max_attempts = max(int(max_attempts), 1)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = tuple(retry_statuses)
+        self.retry_connection_errors = retry_connection_errors
+        self.respect_retry_after = respect_retry_after
+        self.on_attempt = on_attempt
+
+    def is_retryable_method(self, method, headers=None):
+        """
+        Is Retryable Method, whether a request may be sent more than once.
+
+        Args:
+            method (str): HTTP method.
+
+            headers (dict, optional): Request headers.
+
+        Returns:
+            bool: True for idempotent methods or requests with an idempotency
+            key.
+
+        """
+        if method.lower() in IDEMPOTENT_METHODS:
+            return True
+        return bool(get_header(headers, IDEMPOTENCY_KEY_HEADER))
+
+    def backoff(self, attempt):
+        """
+        Backoff, full jitter exponential backoff for the given attempt.
+
+        Args:
+            attempt (int): The attempt that just failed, starting at 1.
+
+        Returns:
+            float: Seconds to wait.
+
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def retry_after(self, resp_headers):
+        """
+        Retry After, reads the Retry-After header in either its seconds or
+        HTTP date form.
+
+        Args:
+            resp_headers (dict): Response headers.
+
+        Returns:
+            float: Seconds to wait, or None if the header is missing or
+            invalid, which includes 'nan' and 'inf'.
+
+        """
+        value = get_header(resp_headers, 'Retry-After')
+        if value is None:
+            return None
+        try:
+            seconds = float(value)
+        except (TypeError, ValueError):
+            pass
+        else:
+            if math.isnan(seconds) or math.isinf(seconds):
+                return None
+            return max(seconds, 0.0)
+        parsed = parsedate_tz(str(value))
+        if parsed is None:
+            return None
+        return max(mktime_tz(parsed) - time.time(), 0.0)
+
+    def next_delay(self, attempt, method, headers=None, status_code=None,
+                   resp_headers=None, error=None):
+        """
+        Next Delay, decides if an attempt is retried.
+
+        Args:
+            attempt (int): The attempt that just finished, starting at 1.
+
+            method (str): HTTP method.
+
+            headers (dict, optional): Request headers.
+
+            status_code (int, optional): HTTP status of the response.
+
+            resp_headers (dict, optional): Response headers.
+
+            error (Exception, optional): Error raised by the transport.
+
+        Returns:
+            float: Seconds to wait before the next attempt, or None if the
+            call should not be retried.
+
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if not self.is_retryable_method(method, headers):
+            return None
+        if error is not None:
+            if not self.retry_connection_errors:
+                return None
+        elif status_code not in self.retry_statuses:
+            return None
+        if self.respect_retry_after and error is None:
+            retry_after = self.retry_after(resp_headers)
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+        return self.backoff(attempt)
+
+    def record(self, retry_attempt):
+        """
+        Record, passes an attempt to the on_attempt callback.
+
+        Args:
+            retry_attempt (RetryAttempt): The finished attempt.
+
+        """
+        if self.on_attempt is not None:
+            self.on_attempt(retry_attempt)
+
@@ -1,6 +1,11 @@
+import datetime
+import re
 import sys
 import logging
 
+from dateutil.parser import parse as date_parser
+from pytz import FixedOffset, utc as UTC
+
 
 logger = logging.getLogger('emburse')
 
@@ -37,6 +42,11 @@ try:
 except ImportError:
     from urllib.parse import urlencode
 
+try:
+    from time import monotonic
+except ImportError:
+    from time import time as monotonic
+
 try:
     import json
 except ImportError:
@@ -72,3 +82,95 @@ def utf8(value):
     if sys.version_info < (3, 0) and isinstance(value, unicode):
         return value.encode('utf-8')
     return value
+
+
+#: Start of a date string, e.g. '2017-05-01', only values matching it are
+#: parsed as dates
+DATE_RE = re.compile(r'\d{4}\W\d{2}\W\d{2}')
+
+ISO_DATETIME_RE = re.compile(
+    r'^(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d{1,9}))?)?'
+    r'(Z|[+-]\d{2}(?::?\d{2})?)?)?$'
+)
+
+#: Number of parsed timestamps kept by parse_datetime
+DATETIME_CACHE_SIZE = 1024
+
+_datetime_cache = {}
+
+
+def _tzinfo(offset_minutes):
+    if offset_minutes == 0:
+        return UTC
+    return FixedOffset(offset_minutes)
+
+
+def _parse_iso_datetime(value):
+    match = ISO_DATETIME_RE.match(value)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    tzinfo = None
+    if offset == 'Z':
+        tzinfo = UTC
+    elif offset:
+        sign = -1 if offset[0] == '-' else 1
+        offset = offset[1:].replace(':', '')
+        tzinfo = _tzinfo(sign * (int(offset[:2]) * 60 + int(offset[2:] or 0)))
+    return datetime.datetime(
+        int(year), int(month), int(day), int(hour or 0), int(minute or 0),
+        int(second or 0), int((fraction or '0')[:6].ljust(6, '0')),
+        tzinfo=tzinfo
+    )
+
+
+def parse_datetime(value):
+    """
+    Parse Datetime, parses a timestamp from the api. Strict ISO 8601 values,
+    the format the api sends, are parsed directly; anything else falls back
+    to dateutil's parser. Offsets are given fixed offset time zones, with
+    UTC as pytz.utc like Requestor.encode_datetime. Results are cached as
+    the same timestamps, e.g. statement periods, come back often.
+
+    Args:
+        value (str): The timestamp.
+
+    Returns:
+        datetime.datetime: The parsed value, naive if it has no offset.
+
+    Raises:
+        ValueError: if the value is not a date.
+
+    """
+    parsed = _datetime_cache.get(value)
+    if parsed is not None:
+        return parsed
+    parsed = _parse_iso_datetime(value)
+    if parsed is None:
+        parsed = date_parser(value)
+        offset = parsed.utcoffset()
+        if offset is not None:
+            parsed = parsed.replace(tzinfo=_tzinfo(
+                (offset.days * 86400 + offset.seconds) // 60))
+    if len(_datetime_cache) >= DATETIME_CACHE_SIZE:
+        _datetime_cache.clear()
+    _datetime_cache[value] = parsed
+    return parsed
+
+
+def to_utc(dttime):
+    """
+    To UTC, converts a datetime to UTC the way the api expects, naive values
+    being taken as UTC already.
+
+    Args:
+        dttime (datetime.datetime): The datetime.
+
+    Returns:
+        datetime.datetime: The same instant with the pytz.utc time zone.
+
+    """
+    if dttime.tzinfo and dttime.tzinfo.utcoffset(dttime) is not None:
+        return dttime.astimezone(UTC)
+    return dttime.replace(tzinfo=UTC)
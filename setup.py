@@ -46,6 +46,10 @@ setup(
     packages=['emburse'],
     package_data={'emburse': ['data/ca-certificates.crt']},
     install_requires=install_requires,
+    extras_require={
+        'async': ['aiohttp >= 3.0'],
+        'orjson': ['orjson'],
+    },
     test_suite='tests',
     tests_require=['pytest', 'pytest-mock'],
     use_2to3=True,
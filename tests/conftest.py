@@ -0,0 +1,7 @@
+import sys
+
+# The asyncio client and its tests use async/await, which is a syntax error
+# before Python 3.5.
+collect_ignore = []
+if sys.version_info < (3, 5):
+    collect_ignore.append('test_async_client.py')
@@ -0,0 +1,182 @@
+import datetime
+import sys
+import uuid
+import pytest
+
+if sys.version_info < (3, 5):
+    pytest.skip('asyncio client requires python 3.5+', allow_module_level=True)
+
+import asyncio
+aiohttp = pytest.importorskip('aiohttp')
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from emburse import AsyncClient, EmburseInvalidRequestError
+from emburse.errors import EmburseDeadlineExceededError
+from emburse.resource import Allowance, Card, Category
+
+
+def card_json(card_id):
+    return {
+        'id': card_id,
+        'description': 'Courier #125',
+        'is_virtual': True,
+        'state': 'active',
+        'category': {'id': str(uuid.uuid4()), 'name': 'Office Expenses'},
+        'created_at': '2016-08-19T23:56:22.020801Z'
+    }
+
+
+class StubEmburse(object):
+    """
+    Minimal stand-in for the Emburse card endpoints.
+    """
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = []
+
+    def app(self):
+        app = web.Application()
+        app.router.add_route('*', '/v1/cards', self.cards)
+        app.router.add_route('*', '/v1/cards/{card_id}', self.card)
+        return app
+
+    async def track(self, request):
+        self.requests.append((request.method, request.path))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+
+    async def cards(self, request):
+        await self.track(request)
+        if request.method == 'POST':
+            body = await request.json()
+            card = card_json(str(uuid.uuid4()))
+            card['description'] = body['description']
+            return web.json_response(card)
+        return web.json_response(
+            {'cards': [card_json(str(uuid.uuid4())) for _ in range(3)]})
+
+    async def card(self, request):
+        await self.track(request)
+        card_id = request.match_info['card_id']
+        if card_id == 'missing':
+            return web.json_response(
+                {'detail': {'message': 'Not found'}}, status=404)
+        card = card_json(card_id)
+        if request.method == 'PUT':
+            card.update(await request.json())
+        return web.json_response(card)
+
+
+def run_against_stub(coro_func, delay=0.0):
+    stub = StubEmburse(delay=delay)
+
+    async def runner():
+        server = TestServer(stub.app())
+        await server.start_server()
+        try:
+            async with AsyncClient(auth_token='Testing123') as client:
+                client.requestor.api_base = str(server.make_url('/v1'))
+                return await coro_func(client)
+        finally:
+            await server.close()
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(runner()), stub
+    finally:
+        loop.close()
+
+
+def test_async_retrieve():
+    async def go(client):
+        return await client.Card.retrieve('abc')
+
+    card, stub = run_against_stub(go)
+    assert isinstance(card, Card)
+    assert card.id == 'abc'
+    assert isinstance(card.category, Category)
+    assert stub.requests == [('GET', '/v1/cards/abc')]
+
+
+def test_async_list():
+    async def go(client):
+        return await client.Card.list()
+
+    cards, stub = run_against_stub(go)
+    assert len(cards) == 3
+    assert all(isinstance(card, Card) for card in cards)
+
+
+def test_async_list_raw():
+    async def go(client):
+        return await client.Card.list(raw=True, typed=True)
+
+    cards, stub = run_against_stub(go)
+    assert len(cards) == 3
+    assert all(isinstance(card, dict) for card in cards)
+    assert all(isinstance(card['created_at'], datetime.datetime)
+               for card in cards)
+
+
+def test_async_create_update_delete():
+    async def go(client):
+        card = await client.Card.create(
+            allowance=await client.Allowance.create(
+                amount=100.0, transaction_limit=100.0),
+            description='Vendor #125',
+            is_virtual=True
+        )
+        updated = await client.Card.update(card.id, state='suspended')
+        deleted = await client.Card.delete(card.id)
+        return card, updated, deleted
+
+    (card, updated, deleted), stub = run_against_stub(go)
+    assert card.description == 'Vendor #125'
+    assert updated.state == 'suspended'
+    assert deleted.id == card.id
+    assert [method for method, path in stub.requests] == [
+        'POST', 'PUT', 'DELETE']
+
+
+def test_async_allowance_create_is_local():
+    async def go(client):
+        return await client.Allowance.create(amount=100.0,
+                                             transaction_limit=100.0)
+
+    allowance, stub = run_against_stub(go)
+    assert isinstance(allowance, Allowance)
+    assert stub.requests == []
+
+
+def test_async_error():
+    async def go(client):
+        with pytest.raises(EmburseInvalidRequestError):
+            await client.Card.retrieve('missing')
+
+    run_against_stub(go)
+
+
+def test_async_deadline_during_request():
+    async def go(client):
+        with pytest.raises(EmburseDeadlineExceededError):
+            await client.Card.retrieve('slow', deadline=0.1)
+
+    stub = run_against_stub(go, delay=0.5)[1]
+    assert len(stub.requests) == 1
+
+
+def test_async_gather_overlaps():
+    card_ids = [str(uuid.uuid4()) for _ in range(20)]
+
+    async def go(client):
+        return await asyncio.gather(
+            *[client.Card.retrieve(card_id) for card_id in card_ids])
+
+    cards, stub = run_against_stub(go, delay=0.05)
+    assert [card.id for card in cards] == card_ids
+    assert stub.max_in_flight > 1
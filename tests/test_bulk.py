@@ -0,0 +1,230 @@
+import json
+import threading
+import time
+import pytest
+from pytest_mock import mocker
+from emburse.client import Client
+from emburse.errors import EmburseAPIError, EmburseAttributeError
+from emburse.http_client import new_default_http_client
+from emburse.resource import Allowance, Card
+from emburse.ratelimit import TokenBucket
+from emburse.bulk import run_bulk
+
+
+class FakeAPI(object):
+    """Answers requests from the worker threads of a bulk operation."""
+
+    def __init__(self, fail=()):
+        self.fail = fail
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, method, url, headers, post_data=None, **kwargs):
+        with self.lock:
+            self.calls.append((method, url, post_data))
+        body = json.loads(post_data) if post_data else {}
+        if (body.get('description') in self.fail or
+                url.rsplit('/', 1)[-1] in self.fail):
+            return json.dumps({'detail': {'message': 'Server error'}}), 500, {}
+        body.setdefault('id', url.rsplit('/', 1)[-1])
+        return json.dumps(body), 200, {}
+
+
+@pytest.fixture(scope='function')
+def api():
+    return FakeAPI(fail=('Vendor #3', 'card-3'))
+
+
+@pytest.fixture(scope='function')
+def emburse_client(mocker, api):
+    http = new_default_http_client()
+    mocker.patch.object(http, 'request', side_effect=api)
+    return Client(auth_token='Testing123', http_client=http)
+
+
+@pytest.fixture(scope='function')
+def card_specs():
+    allowance = Allowance(auth_token='Testing123', amount=100.0,
+                          interval='null')
+    return [
+        {'allowance': allowance, 'description': 'Vendor #{0}'.format(i),
+         'is_virtual': True}
+        for i in range(10)
+    ]
+
+
+def test_create_many(emburse_client, api, card_specs):
+    result = emburse_client.Card.create_many(card_specs, concurrency=4)
+    streamed = list(result)
+    assert len(streamed) == 10
+    assert result.done
+    assert len(api.calls) == 10
+    cards = result.succeeded
+    assert len(cards) == 9
+    assert all(isinstance(card, Card) for card in cards)
+    assert [card.description for card in cards][:3] == [
+        'Vendor #0', 'Vendor #1', 'Vendor #2']
+    assert cards[0].context is emburse_client.context
+    assert [item.item for item in result.failed] == [card_specs[3]]
+    assert isinstance(result.failed[0].error, EmburseAPIError)
+    assert result.inputs == card_specs
+    assert not result.ok
+    # The specs are left as they were given.
+    assert isinstance(card_specs[0]['allowance'], Allowance)
+
+
+def test_bulk_result_replays_completed_items():
+    result = run_bulk(lambda index: index * 2, ['a', 'b', 'c'],
+                      concurrency=2).wait()
+    assert sorted(task.value for task in result) == [0, 2, 4]
+    assert sorted(task.item for task in result) == ['a', 'b', 'c']
+    assert result.summary()['succeeded'] == 3
+
+
+def test_bulk_result_counts_without_iterating():
+    result = run_bulk(lambda index: index, range(5), concurrency=2)
+    # Every item is taken in as it finishes without anyone iterating.
+    for _ in range(500):
+        if result.done:
+            break
+        time.sleep(0.01)
+    assert result.summary() == {
+        'total': 5, 'succeeded': 5, 'failed': 0, 'pending': 0,
+        'cancelled': 0}
+    assert result.succeeded == [0, 1, 2, 3, 4]
+    assert result.ok
+
+
+def test_bulk_result_cancel():
+    started = threading.Event()
+    release = threading.Event()
+
+    def call(index):
+        started.set()
+        release.wait(5)
+        return index
+
+    result = run_bulk(call, range(4), concurrency=1)
+    started.wait(5)
+    assert result.summary()['pending'] == 4
+    result.cancel()
+    release.set()
+    result.wait()
+    # The call running when cancelled still finishes and is reported.
+    assert result.succeeded == [0]
+    assert result.summary() == {
+        'total': 4, 'succeeded': 1, 'failed': 0, 'pending': 0,
+        'cancelled': 3}
+    assert not result.ok
+
+
+def test_create_many_validates_up_front(emburse_client, api, card_specs):
+    del card_specs[7]['is_virtual']
+    with pytest.raises(EmburseAttributeError) as raised:
+        emburse_client.Card.create_many(card_specs)
+    assert 'Spec 7' in str(raised.value)
+    assert api.calls == []
+
+
+def test_create_many_rate_limited(mocker, emburse_client, card_specs):
+    limiter = TokenBucket(rate=1000)
+    mocker.patch.object(limiter, 'acquire')
+    result = emburse_client.Card.create_many(card_specs[:3],
+                                             rate_limiter=limiter).wait()
+    assert len(result.succeeded) == 3
+    assert limiter.acquire.call_count == 3
+
+
+def test_update_many(emburse_client, api):
+    card = Card(auth_token='Testing123', context=emburse_client.context,
+                id='card-0', state='active')
+    ids = [card] + ['card-{0}'.format(i) for i in range(1, 6)]
+    result = emburse_client.Card.update_many(ids, concurrency=3,
+                                             state='suspended').wait()
+    assert len(api.calls) == 6
+    assert all(method == 'put' for method, url, data in api.calls)
+    assert sorted(url.rsplit('/', 1)[-1] for _, url, _ in api.calls) == [
+        'card-{0}'.format(i) for i in range(6)]
+    updated = result.succeeded
+    assert len(updated) == 5
+    assert updated[0] is card
+    assert card.state == 'suspended'
+    assert all(isinstance(c, Card) and c.state == 'suspended' for c in updated)
+    assert [item.item for item in result.failed] == ['card-3']
+
+
+def test_update_many_without_hydrating(emburse_client, api):
+    result = emburse_client.Card.update_many(
+        ['card-1', 'card-2'], hydrate=False, state='suspended').wait()
+    assert result.succeeded == [
+        {'id': 'card-1', 'state': 'suspended'},
+        {'id': 'card-2', 'state': 'suspended'},
+    ]
+
+
+def test_update_many_requires_ids(emburse_client, api):
+    with pytest.raises(EmburseAttributeError) as excinfo:
+        emburse_client.Card.update_many(['card-1', None], state='suspended')
+    assert str(excinfo.value).startswith('Item 1: ID')
+    assert api.calls == []
+
+
+def test_delete_many(mocker, emburse_client):
+    def request(method, url, headers, post_data=None, **kwargs):
+        identifier = url.rsplit('/', 1)[-1]
+        if identifier == 'gone':
+            return json.dumps({'detail': {'message': 'Not found'}}), 404, {}
+        if identifier == 'broken':
+            return json.dumps({'detail': {'message': 'Denied'}}), 403, {}
+        return '{}', 200, {}
+
+    emburse_client.context.requestor._client.request.side_effect = request
+    label = emburse_client.Label.construct_from(
+        {'id': 'label-1'}, 'Testing123', context=emburse_client.context)
+    result = emburse_client.Label.delete_many(
+        [label, 'label-2', 'gone', 'broken'], concurrency=2).wait()
+    assert result.succeeded == [True, True, False]
+    assert [item.item for item in result.failed] == ['broken']
+    assert result.summary() == {
+        'total': 4, 'succeeded': 3, 'failed': 1, 'pending': 0,
+        'cancelled': 0, 'already_deleted': 1}
+    assert [item.item for item in result.already_deleted] == ['gone']
+    calls = emburse_client.context.requestor._client.request.call_args_list
+    assert sorted(call[0][0] for call in calls) == ['delete'] * 4
+
+
+def test_retrieve_many(mocker, emburse_client):
+    def request(method, url, headers, post_data=None, **kwargs):
+        identifier = url.rsplit('/', 1)[-1]
+        if identifier.startswith('gone'):
+            return json.dumps({'detail': {'message': 'Not found'}}), 404, {}
+        if identifier == 'broken':
+            return 'not json', 500, {}
+        return json.dumps({'id': identifier, 'state': 'active'}), 200, {}
+
+    http = emburse_client.context.requestor._client
+    http.request.side_effect = request
+    ids = ['card-1', 'gone-1', 'card-2', 'card-1', 'broken', 'gone-2',
+           'card-2']
+    limiter = TokenBucket(rate=1000)
+    mocker.patch.object(limiter, 'acquire')
+    cards = emburse_client.Card.retrieve_many(ids, concurrency=3,
+                                              rate_limiter=limiter)
+    assert http.request.call_count == 5
+    assert limiter.acquire.call_count == 5
+    assert list(cards) == ['card-1', 'card-2']
+    assert isinstance(cards['card-1'], Card)
+    assert cards['card-2'].state == 'active'
+    assert cards.missing == ['gone-1', 'gone-2']
+    assert list(cards.failed) == ['broken']
+    assert isinstance(cards.failed['broken'], EmburseAPIError)
+    assert not cards.ok
+
+
+def test_retrieve_many_raw(emburse_client):
+    http = emburse_client.context.requestor._client
+    http.request.side_effect = lambda method, url, headers, post_data=None, **kwargs: (
+        json.dumps({'id': url.rsplit('/', 1)[-1]}), 200, {})
+    cards = emburse_client.Card.retrieve_many(['a', 'b'], raw=True)
+    assert cards == {'a': {'id': 'a'}, 'b': {'id': 'b'}}
+    assert cards.ok
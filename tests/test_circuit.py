@@ -0,0 +1,95 @@
+import pytest
+from pytest_mock import mocker
+from emburse.circuit import CircuitBreaker
+from emburse.errors import (
+    EmburseAPIConnectionError,
+    EmburseAPIError,
+    EmburseCircuitOpenError
+)
+from emburse.http_client import new_default_http_client
+from emburse.requestor import Requestor
+
+
+@pytest.fixture(scope='function')
+def transitions():
+    return []
+
+
+@pytest.fixture(scope='function')
+def breaker(transitions):
+    return CircuitBreaker(
+        failure_rate_threshold=0.5,
+        window_size=4,
+        minimum_calls=4,
+        open_timeout=60,
+        on_state_change=lambda b, old, new: transitions.append((old, new))
+    )
+
+
+@pytest.fixture(scope='function')
+def requestor_obj(mocker, breaker):
+    client = new_default_http_client()
+    mocker.patch.object(client, 'request')
+    return Requestor(token='Testing123', client=client,
+                     circuit_breaker=breaker)
+
+
+def test_opens_on_failure_rate(breaker, transitions):
+    for status_code in (200, 503, 200, 502):
+        breaker.before_call()
+        breaker.record(0.1, status_code=status_code)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert transitions == [('closed', 'open')]
+    with pytest.raises(EmburseCircuitOpenError):
+        breaker.before_call()
+
+
+def test_stays_closed_below_minimum_calls(breaker):
+    for _ in range(3):
+        breaker.before_call()
+        breaker.record(0.1, error=EmburseAPIConnectionError('reset'))
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_opens_on_slow_calls(transitions):
+    breaker = CircuitBreaker(slow_call_threshold=1.0,
+                             slow_call_rate_threshold=0.5, window_size=2,
+                             minimum_calls=2)
+    breaker.record(1.5, status_code=200)
+    breaker.record(2.0, status_code=200)
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_half_open_recovers(mocker, breaker, transitions):
+    for _ in range(4):
+        breaker.record(0.1, status_code=503)
+    clock = mocker.patch('emburse.circuit.util.monotonic')
+    clock.return_value = breaker._opened_at + 61
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(EmburseCircuitOpenError):
+        breaker.before_call()
+    breaker.record(0.1, status_code=200)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert transitions == [('closed', 'open'), ('open', 'half-open'),
+                           ('half-open', 'closed')]
+
+
+def test_half_open_failure_reopens(mocker, breaker):
+    for _ in range(4):
+        breaker.record(0.1, status_code=503)
+    clock = mocker.patch('emburse.circuit.util.monotonic')
+    clock.return_value = breaker._opened_at + 61
+    breaker.before_call()
+    breaker.record(0.1, status_code=503)
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_requestor_fails_fast(requestor_obj):
+    requestor_obj._client.request.return_value = ('{}', 503, {})
+    for _ in range(4):
+        with pytest.raises(EmburseAPIError):
+            requestor_obj.request('get', '/cards/1')
+    with pytest.raises(EmburseCircuitOpenError):
+        requestor_obj.request('get', '/cards/1')
+    assert requestor_obj._client.request.call_count == 4
@@ -71,3 +71,33 @@ def test_statement_property(enburse_client):
 
 def test_transaction_property(enburse_client):
     assert isinstance(enburse_client.Transaction, Transaction)
+
+
+def test_resources_share_requestor(enburse_client):
+    card = enburse_client.Card
+    member = enburse_client.Member
+    assert card.context is enburse_client.context
+    assert card.requestor is member.requestor
+
+
+def test_hydrated_objects_share_requestor(mocker, enburse_client):
+    card = enburse_client.Card
+    mocker.patch.object(card, 'make_request')
+    card.make_request.return_value = {
+        'cards': [
+            {'id': '1', 'category': {'id': '2', 'name': 'Office'}},
+            {'id': '3', 'category': {'id': '4', 'name': 'Travel'}}
+        ]
+    }
+    cards = card.list()
+    for listed in cards:
+        assert listed.requestor is enburse_client.context.requestor
+        assert listed.category.context is enburse_client.context
+
+
+def test_client_close(mocker):
+    with Client(auth_token='Testing123') as client:
+        requestor = client.Card.requestor
+        mocker.patch.object(requestor, 'close')
+    assert requestor.close.call_count == 1
+    assert client.Card.requestor is not requestor
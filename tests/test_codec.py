@@ -0,0 +1,81 @@
+import json
+import pytest
+from pytest_mock import mocker
+import emburse.codec as codec
+from emburse import Client
+from emburse.errors import (
+    EmburseAPIError,
+    EmburseNotImplementedError,
+    EmburseValueError
+)
+from emburse.http_client import new_default_http_client
+from emburse.requestor import Requestor
+
+
+@pytest.fixture(scope='function', params=codec.available_codecs())
+def json_codec(request):
+    return codec.get_codec(request.param)
+
+
+@pytest.fixture(scope='function')
+def default_codec():
+    previous = codec.get_codec()
+    yield
+    codec.set_default_codec(previous)
+
+
+def test_codec_round_trip(json_codec):
+    value = {'id': '1', 'amount': -119.21, 'tags': [None, True, u'caf\xe9']}
+    encoded = json_codec.dumps(value)
+    assert isinstance(encoded, str)
+    assert json.loads(encoded) == value
+    assert json_codec.loads(encoded) == value
+    assert json_codec.loads(encoded.encode('utf-8')) == value
+    with pytest.raises(ValueError):
+        json_codec.loads(b'{"id": ')
+
+
+def test_get_codec():
+    assert codec.get_codec('json').name == 'json'
+    assert codec.get_codec('auto').name == codec.available_codecs()[0]
+    instance = codec.JSONCodec()
+    assert codec.get_codec(instance) is instance
+    with pytest.raises(EmburseValueError):
+        codec.get_codec('yaml')
+
+
+def test_missing_codec_library(mocker):
+    mocker.patch('emburse.codec.ujson', None)
+    with pytest.raises(EmburseNotImplementedError):
+        codec.get_codec('ujson')
+
+
+def test_set_default_codec(default_codec):
+    requestor = Requestor(token='Testing123')
+    instance = codec.JSONCodec()
+    codec.set_default_codec(instance)
+    assert requestor.json_codec is instance
+
+
+def test_requestor_decodes_bytes(mocker, json_codec):
+    client = new_default_http_client()
+    mocker.patch.object(client, 'request')
+    client.request.return_value = b'{"id": "1"}', 200, {}
+    requestor = Requestor(token='Testing123', client=client,
+                          json_codec=json_codec)
+    assert requestor.request('get', '/cards/1')[0] == {'id': '1'}
+    client.request.return_value = b'not json', 200, {}
+    with pytest.raises(EmburseAPIError):
+        requestor.request('get', '/cards/1')
+
+
+def test_client_user_agent_built_once(mocker):
+    requestor = Client(auth_token='Testing123',
+                       json_codec='json').Card.requestor
+    platform = mocker.patch('emburse.requestor.platform.platform')
+    platform.return_value = 'Linux'
+    first = requestor.prepare_request('get', '/cards', None, None)[1]
+    second = requestor.prepare_request('get', '/cards', None, None)[1]
+    assert first['X-Client-User-Agent'] == second['X-Client-User-Agent']
+    assert json.loads(first['X-Client-User-Agent'])['lang'] == 'python'
+    assert platform.call_count == 1
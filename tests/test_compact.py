@@ -0,0 +1,75 @@
+import datetime
+import pytest
+from pytest_mock import mocker
+from emburse.client import Client
+from emburse.compact import CompactResource, compact, compact_class
+from emburse.resource import Card, Transaction
+
+
+@pytest.fixture(scope='module')
+def emburse_client():
+    return Client(auth_token='Testing123')
+
+
+@pytest.fixture(scope='function')
+def transaction_dict():
+    return {
+        'id': '0849b836-bc20-4a83-8218-e50f8c9e56c4',
+        'url': 'https://api.emburse.com/v1/transactions/0849b836',
+        'amount': -119.21,
+        'state': 'pending',
+        'vendor': {'name': 'ADROLL', 'zip_code': '94103'},
+        'card': {'id': 'c195f95f', 'last_four': '7640'},
+        'member': None,
+        'custom': 'value',
+        'time': '2016-08-19T04:02:05Z'
+    }
+
+
+def test_compact_class_is_slotted():
+    klass = compact_class(Transaction)
+    assert klass is compact_class(Transaction)
+    assert klass.__name__ == 'CompactTransaction'
+    assert 'amount' in klass.__slots__
+    instance = klass(None, {'id': '1'})
+    assert not hasattr(instance, '__dict__')
+    with pytest.raises(AttributeError):
+        instance.missing
+
+
+def test_compact_values(emburse_client, transaction_dict):
+    transaction = compact(transaction_dict, 'transaction',
+                          emburse_client.context)
+    assert isinstance(transaction, CompactResource)
+    assert transaction.resource_class is Transaction
+    assert transaction.context is emburse_client.context
+    assert transaction.amount == -119.21
+    assert isinstance(transaction.time, datetime.datetime)
+    assert transaction.vendor == {'name': 'ADROLL', 'zip_code': '94103'}
+    assert transaction.card.resource_class is Card
+    assert transaction.card.last_four == '7640'
+    assert transaction.custom == 'value'
+    assert transaction.extra == {'custom': 'value'}
+
+
+def test_compact_round_trip(emburse_client, transaction_dict):
+    transaction = compact(transaction_dict, 'transaction',
+                          emburse_client.context)
+    values = transaction.as_dict()
+    assert values['card'] == {'id': 'c195f95f', 'last_four': '7640'}
+    assert 'member' not in values
+    resource = transaction.to_resource()
+    assert isinstance(resource, Transaction)
+    assert isinstance(resource.card, Card)
+    assert resource.context is emburse_client.context
+
+
+def test_list_compact(mocker, emburse_client, transaction_dict):
+    resource = emburse_client.Transaction
+    mocker.patch.object(resource, 'make_request')
+    resource.make_request.return_value = {'transactions': [transaction_dict]}
+    transactions = resource.list(compact=True)
+    assert transactions[0].id == transaction_dict['id']
+    assert isinstance(transactions[0], compact_class(Transaction))
+    transactions = list(resource.iter(compact=True))
+    assert isinstance(transactions[0], compact_class(Transaction))
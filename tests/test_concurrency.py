@@ -0,0 +1,68 @@
+import threading
+import time
+import pytest
+from emburse.concurrency import run_tasks
+
+
+def test_run_tasks_ordered():
+    def square(n):
+        time.sleep(0.001 * (5 - n))
+        return n * n
+
+    results = list(run_tasks(square, range(5), concurrency=5, ordered=True))
+    assert [r.value for r in results] == [0, 1, 4, 9, 16]
+    assert [r.item for r in results] == [0, 1, 2, 3, 4]
+
+
+def test_run_tasks_captures_errors():
+    def check(n):
+        if n == 2:
+            raise ValueError('bad item')
+        return n
+
+    results = list(run_tasks(check, range(4), concurrency=2))
+    assert sorted(r.item for r in results if r.ok) == [0, 1, 3]
+    failed = [r for r in results if not r.ok]
+    assert len(failed) == 1
+    assert failed[0].item == 2
+    assert isinstance(failed[0].error, ValueError)
+
+
+def test_run_tasks_bounds_concurrency():
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def work(n):
+        with lock:
+            running.append(n)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(n)
+
+    list(run_tasks(work, range(12), concurrency=3))
+    assert max(peak) <= 3
+
+
+def test_run_tasks_reads_input_lazily():
+    taken = []
+
+    def items():
+        for n in range(1000):
+            taken.append(n)
+            yield n
+
+    results = run_tasks(lambda n: n, items(), concurrency=2)
+    next(results)
+    results.close()
+    assert len(taken) < 1000
+
+
+def test_run_tasks_input_error():
+    def items():
+        yield 1
+        raise KeyError('broken input')
+
+    with pytest.raises(KeyError):
+        list(run_tasks(lambda n: n, items(), concurrency=1))
@@ -0,0 +1,89 @@
+import datetime
+import pytest
+from pytest_mock import mocker
+from pytz import FixedOffset
+from emburse.client import Client
+from emburse.daterange import merge_csv, merge_unique, split_date_range
+from emburse.errors import EmburseValueError
+from emburse.http_client import StreamedResponse
+from emburse.requestor import Requestor
+
+
+@pytest.fixture(scope='module')
+def emburse_client():
+    return Client(auth_token='Testing123')
+
+
+def test_split_date_range():
+    start = datetime.datetime(2017, 1, 1)
+    end = datetime.datetime(2017, 1, 5)
+    windows = split_date_range(start, end, 4)
+    assert len(windows) == 4
+    assert [w[1] - w[0] for w in windows] == [datetime.timedelta(days=1)] * 4
+    for previous, following in zip(windows, windows[1:]):
+        assert previous[1] == following[0]
+
+
+def test_split_date_range_edges_encode_like_single_request():
+    requestor = Requestor(token='Testing123')
+    start = datetime.datetime(2017, 1, 1, 8, 30, tzinfo=FixedOffset(-300))
+    end = datetime.datetime(2017, 3, 1, 12, 15, 30, 250)
+    windows = split_date_range(start, end, 7)
+    assert requestor.encode_datetime(windows[0][0]) == requestor.encode_datetime(start)
+    assert requestor.encode_datetime(windows[-1][1]) == requestor.encode_datetime(end)
+
+
+def test_split_date_range_short_or_invalid():
+    start = datetime.datetime(2017, 1, 1)
+    assert len(split_date_range(start, start, 4)) == 1
+    with pytest.raises(EmburseValueError):
+        split_date_range(start, start - datetime.timedelta(days=1), 2)
+    with pytest.raises(EmburseValueError):
+        split_date_range(start, start, 0)
+
+
+def test_merge_csv():
+    bodies = ['date,amount\r\n2017-01-01,1\r\n', 'date,amount\r\n',
+              '', 'date,amount\r\n2017-01-03,3']
+    assert merge_csv(bodies) == (
+        'date,amount\r\n2017-01-01,1\r\n2017-01-03,3')
+
+
+def test_merge_unique():
+    pages = [[{'id': '1'}, {'id': '2'}], [{'id': '2'}, {'id': '3'}, {}]]
+    assert merge_unique(pages) == [{'id': '1'}, {'id': '2'}, {'id': '3'}, {}]
+
+
+def test_list_range(mocker, emburse_client):
+    resource = emburse_client.Transaction
+
+    def list_raw(deadline=None, **params):
+        day = params['start_date'].day
+        return [{'id': str(day)}, {'id': str(day + 1)}]
+
+    mocker.patch.object(resource, 'list_raw', side_effect=list_raw)
+    transactions = resource.list_range(
+        datetime.datetime(2017, 1, 1), datetime.datetime(2017, 1, 4),
+        windows=3, state='cleared')
+    assert [t.id for t in transactions] == ['1', '2', '3', '4']
+    assert resource.list_raw.call_count == 3
+    params = resource.list_raw.call_args[1]
+    assert params['state'] == 'cleared'
+    assert params['end_date'] == datetime.datetime(2017, 1, 4).replace(
+        tzinfo=params['end_date'].tzinfo)
+
+
+def test_export_range(mocker, emburse_client):
+    statement = emburse_client.Statement
+    statement.account_id = 'acc1'
+
+    def request_stream(method, url_, params=None, deadline=None):
+        day = params['start_date'].day
+        return StreamedResponse.buffered(
+            'date,amount\n2017-01-{0:02d},{0}\n'.format(day), 200, {})
+
+    mocker.patch.object(statement.requestor, 'request_stream',
+                        side_effect=request_stream)
+    body = statement.export_range(datetime.datetime(2017, 1, 1),
+                                  datetime.datetime(2017, 1, 4), windows=3)
+    assert body == 'date,amount\n2017-01-01,1\n2017-01-02,2\n2017-01-03,3\n'
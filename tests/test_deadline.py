@@ -0,0 +1,160 @@
+import json
+import pytest
+from pytest_mock import mocker
+from emburse import Client
+from emburse.circuit import CircuitBreaker
+from emburse.deadline import Deadline
+from emburse.errors import (EmburseAPIConnectionError, EmburseAPIError,
+                            EmburseDeadlineExceededError)
+from emburse.http_client import RequestsClient, new_default_http_client
+from emburse.ratelimit import TokenBucket
+from emburse.requestor import Requestor
+from emburse.retry import RetryPolicy
+
+
+@pytest.fixture(scope='function')
+def clock(mocker):
+    clock = mocker.patch('emburse.deadline.util.monotonic')
+    clock.return_value = 100.0
+    return clock
+
+
+@pytest.fixture(scope='function')
+def requestor_obj(mocker):
+    client = new_default_http_client()
+    mocker.patch.object(client, 'request')
+    mocker.patch('emburse.requestor.time.sleep')
+    return Requestor(
+        token='Testing123',
+        client=client,
+        retry_policy=RetryPolicy(max_attempts=5, backoff_base=0.01)
+    )
+
+
+def test_deadline_remaining(clock):
+    deadline = Deadline(5)
+    assert deadline.remaining() == 5.0
+    clock.return_value = 103.0
+    assert deadline.check() == 2.0
+    clock.return_value = 106.0
+    assert deadline.remaining() == 0.0
+    assert deadline.expired
+    with pytest.raises(EmburseDeadlineExceededError):
+        deadline.check()
+
+
+def test_deadline_coerce():
+    deadline = Deadline(1)
+    assert Deadline.coerce(deadline) is deadline
+    assert Deadline.coerce(None) is None
+    assert Deadline.coerce(2).seconds == 2.0
+
+
+def test_requests_client_timeouts():
+    client = RequestsClient(timeout=80, connect_timeout=3.05, read_timeout=30)
+    assert client._timeouts() == (3.05, 30)
+    assert client._timeouts(10) == (3.05, 10)
+    assert RequestsClient(timeout=20)._timeouts() == (20, 20)
+
+
+def test_request_passes_remaining_time(requestor_obj):
+    requestor_obj._client.request.return_value = json.dumps({'id': '1'}), 200, {}
+    requestor_obj.request('get', '/cards/1', deadline=10)
+    timeout = requestor_obj._client.request.call_args[1]['timeout']
+    assert 9 < timeout <= 10
+    requestor_obj.request('get', '/cards/1')
+    assert 'timeout' not in requestor_obj._client.request.call_args[1]
+
+
+def test_retries_stop_at_deadline(requestor_obj, clock):
+    def respond(*args, **kwargs):
+        clock.return_value += 2
+        return '{}', 503, {}
+    requestor_obj._client.request.side_effect = respond
+    # The third response leaves no time for a retry, so it is returned.
+    with pytest.raises(EmburseAPIError):
+        requestor_obj.request('get', '/cards/1', deadline=5)
+    assert requestor_obj._client.request.call_count == 3
+
+
+def test_transport_error_past_deadline(requestor_obj, clock):
+    timeout = EmburseAPIConnectionError('Read timed out')
+
+    def respond(*args, **kwargs):
+        clock.return_value += 6
+        raise timeout
+    requestor_obj._client.request.side_effect = respond
+    with pytest.raises(EmburseDeadlineExceededError) as excinfo:
+        requestor_obj.request('get', '/cards/1', deadline=5)
+    assert excinfo.value.__cause__ is timeout
+    assert requestor_obj._client.request.call_count == 1
+
+
+def test_transport_error_without_time_to_retry(requestor_obj, clock):
+    def respond(*args, **kwargs):
+        clock.return_value += 2
+        raise EmburseAPIConnectionError('Connection reset')
+    requestor_obj._client.request.side_effect = respond
+    with pytest.raises(EmburseDeadlineExceededError) as excinfo:
+        requestor_obj.request('get', '/cards/1', deadline=5)
+    assert isinstance(excinfo.value.__cause__, EmburseAPIConnectionError)
+    assert requestor_obj._client.request.call_count == 3
+
+
+def test_rate_limiter_wait_past_deadline(requestor_obj):
+    requestor_obj.rate_limiter = TokenBucket(rate=1, burst=1)
+    requestor_obj._client.request.return_value = json.dumps({'id': '1'}), 200, {}
+    requestor_obj.request('get', '/cards/1', deadline=0.5)
+    with pytest.raises(EmburseDeadlineExceededError):
+        requestor_obj.request('get', '/cards/1', deadline=0.5)
+    assert requestor_obj._client.request.call_count == 1
+
+
+def test_iter_shares_deadline(mocker):
+    client = Client(auth_token='Testing123')
+    requestor = client.Card.requestor
+    mocker.patch.object(requestor, 'request')
+    requestor.request.side_effect = [
+        ({'cards': [{'id': '1'}, {'id': '2'}]}, 'Testing123'),
+        ({'cards': [{'id': '3'}]}, 'Testing123')
+    ]
+    cards = list(client.Card.iter(page_size=2, deadline=30))
+    assert [card.id for card in cards] == ['1', '2', '3']
+    deadlines = [call[1]['deadline'] for call in requestor.request.call_args_list]
+    assert isinstance(deadlines[0], Deadline)
+    assert deadlines[0] is deadlines[1]
+
+
+def test_deadline_does_not_hold_half_open_slot(mocker, requestor_obj):
+    breaker = CircuitBreaker(window_size=1, minimum_calls=1, open_timeout=60)
+    breaker.record(0.1, status_code=503)
+    clock = mocker.patch('emburse.circuit.util.monotonic')
+    clock.return_value = breaker._opened_at + 61
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    limiter = TokenBucket(rate=1, burst=1)
+    limiter.reserve()
+    requestor_obj.circuit_breaker = breaker
+    requestor_obj.rate_limiter = limiter
+    requestor_obj._client.request.return_value = json.dumps({'id': '1'}), 200, {}
+    with pytest.raises(EmburseDeadlineExceededError):
+        requestor_obj.request('get', '/cards/1', deadline=0.5)
+    assert requestor_obj._client.request.call_count == 0
+    # The trial slot and the token were given back, the next call is let in.
+    assert limiter.level() > -0.5
+    requestor_obj.rate_limiter = None
+    requestor_obj.request('get', '/cards/1')
+    assert requestor_obj._client.request.call_count == 1
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_deadline_after_limiter_wait_releases_slot(mocker, requestor_obj):
+    breaker = CircuitBreaker(window_size=1, minimum_calls=1, open_timeout=60)
+    breaker.record(0.1, status_code=503)
+    clock = mocker.patch('emburse.circuit.util.monotonic')
+    clock.return_value = breaker._opened_at + 61
+    requestor_obj.circuit_breaker = breaker
+    mocker.patch.object(requestor_obj, 'transport_kwargs',
+                        side_effect=EmburseDeadlineExceededError('late'))
+    with pytest.raises(EmburseDeadlineExceededError):
+        requestor_obj.request('get', '/cards/1', deadline=5)
+    breaker.before_call()
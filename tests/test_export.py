@@ -0,0 +1,38 @@
+import os
+import pytest
+from pytest_mock import mocker
+from emburse.errors import EmburseAPIConnectionError
+from emburse.export import part_path, write_chunks
+
+
+def test_write_chunks_replaces_existing_file(tmpdir):
+    path = tmpdir.join('statement.csv')
+    path.write('old')
+    assert write_chunks([b'new ', b'file'], str(path)) == 8
+    assert path.read() == 'new file'
+    assert not tmpdir.join('statement.csv.part').exists()
+
+
+@pytest.mark.skipif(not hasattr(os, 'replace'), reason='needs os.replace')
+def test_write_chunks_replaces_atomically(mocker, tmpdir):
+    path = tmpdir.join('statement.csv')
+    path.write('old')
+    replace = mocker.patch('os.replace', wraps=os.replace)
+    remove = mocker.patch('os.remove', wraps=os.remove)
+    write_chunks([b'new'], str(path))
+    replace.assert_called_once_with(part_path(str(path)), str(path))
+    assert not remove.called
+    assert path.read() == 'new'
+
+
+def test_write_chunks_failure_removes_part_file(tmpdir):
+    path = str(tmpdir.join('statement.pdf'))
+
+    def chunks():
+        yield b'%PDF'
+        raise EmburseAPIConnectionError('connection reset')
+
+    with pytest.raises(EmburseAPIConnectionError):
+        write_chunks(chunks(), path)
+    assert part_path(path) == path + '.part'
+    assert tmpdir.listdir() == []
@@ -0,0 +1,72 @@
+import datetime
+import pytest
+from pytest_mock import mocker
+import emburse.fields as field
+from emburse.client import Client
+from emburse.resource import APIResource, Card, Transaction
+
+
+@pytest.fixture(scope='module')
+def emburse_client():
+    return Client(auth_token='Testing123')
+
+
+@pytest.fixture(scope='function')
+def transaction_dict():
+    return {
+        'id': '0849b836-bc20-4a83-8218-e50f8c9e56c4',
+        'amount': '12.5',
+        'note': '2016-08-19',
+        'last_four': '0.5',
+        'vendor': {'name': 'ADROLL', 'zip_code': '94103'},
+        'card': {'id': 'c195f95f-42ea-42b9-bf62-25ea0995a9a4'},
+        'member': None,
+        'time': '2016-08-19T04:02:05Z',
+        'created_at': 'null'
+    }
+
+
+def test_timestamp_field():
+    decoded = field.Timestamp().decode('2016-08-19T04:02:05Z', None)
+    assert decoded.replace(tzinfo=None) == datetime.datetime(2016, 8, 19, 4, 2, 5)
+    assert field.Timestamp().decode('null', None) == 'null'
+    assert field.Timestamp().decode(None, None) is None
+
+
+def test_timestamp_field_leaves_non_dates():
+    timestamp = field.Timestamp()
+    for value in ('2019-05', 'May 2019', 'pending', '12:30'):
+        assert timestamp.decode(value, None) == value
+    assert timestamp.decode('2019-05-01 garbage', None) == '2019-05-01 garbage'
+    transaction = Transaction(auth_token='Testing123', id='1',
+                              created_at='2019-05')
+    assert transaction.created_at == '2019-05'
+
+
+def test_amount_field():
+    assert field.Amount().decode('12.50', None) == 12.5
+    assert field.Amount().decode(-1, None) == -1
+    assert field.Amount().decode('n/a', None) == 'n/a'
+
+
+def test_schema_decoding(emburse_client, transaction_dict):
+    transaction = emburse_client.Transaction.refresh_from(transaction_dict)
+    assert transaction.amount == 12.5
+    assert isinstance(transaction.time, datetime.datetime)
+    assert transaction.created_at == 'null'
+    assert isinstance(transaction.card, Card)
+    assert transaction.card.context is emburse_client.context
+    assert transaction.member is None
+    # Fields outside the schema are not guessed at.
+    assert transaction.note == '2016-08-19'
+    assert transaction.last_four == '0.5'
+    assert isinstance(transaction.vendor, APIResource)
+    assert transaction.vendor.zip_code == '94103'
+
+
+def test_schema_none_guesses_types(mocker, emburse_client, transaction_dict):
+    mocker.patch.object(Transaction, 'fields', None)
+    transaction = emburse_client.Transaction.refresh_from(transaction_dict)
+    assert isinstance(transaction.note, datetime.datetime)
+    assert transaction.last_four == 0.5
+    assert isinstance(transaction.card, Card)
@@ -0,0 +1,112 @@
+import pytest
+import requests
+from pytest_mock import mocker
+from emburse.errors import EmburseAPIConnectionError
+from emburse.http_client import RequestsClient, StreamedResponse
+from emburse.requestor import Requestor
+
+
+@pytest.fixture(scope='function')
+def requests_response(mocker):
+    resp = mocker.Mock()
+    resp.content = b'{"id": "1"}'
+    resp.status_code = 200
+    resp.headers = {'status': 'OK'}
+    return resp
+
+
+def test_session_is_reused(mocker, requests_response):
+    client = RequestsClient()
+    mocker.patch.object(requests.Session, 'request')
+    requests.Session.request.return_value = requests_response
+    session = client.session
+    client.request('get', 'https://api.emburse.com/v1/cards', {})
+    client.request('get', 'https://api.emburse.com/v1/cards', {})
+    assert client.session is session
+    assert requests.Session.request.call_count == 2
+
+
+def test_session_pool_config():
+    client = RequestsClient(pool_connections=2, pool_maxsize=25,
+                            pool_block=True)
+    adapter = client.session.get_adapter('https://api.emburse.com/v1')
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 25
+    assert adapter._pool_block
+
+
+def test_without_session(mocker, requests_response):
+    client = RequestsClient(use_session=False)
+    mocker.patch.object(requests, 'request')
+    requests.request.return_value = requests_response
+    content, status, headers = client.request(
+        'get', 'https://api.emburse.com/v1/cards', {})
+    assert status == 200
+    assert requests.request.call_count == 1
+
+
+def test_close(mocker):
+    client = RequestsClient()
+    session = client.session
+    mocker.patch.object(session, 'close')
+    client.close()
+    assert session.close.call_count == 1
+    assert client.session is not session
+
+
+def test_close_leaves_supplied_session_open(mocker):
+    session = requests.Session()
+    mocker.patch.object(session, 'close')
+    with RequestsClient(session=session) as client:
+        assert client.session is session
+    assert session.close.call_count == 0
+
+
+def test_requestors_share_client(mocker):
+    client = RequestsClient()
+    mocker.patch.object(client, 'close')
+    first = Requestor(token='Testing123', client=client)
+    second = Requestor(token='Testing123', client=client)
+    assert first._client.session is second._client.session
+    first.close()
+    assert client.close.call_count == 0
+
+
+def test_request_stream(mocker, requests_response):
+    client = RequestsClient()
+    requests_response.headers = {'Content-Length': '11'}
+    requests_response.iter_content.return_value = iter([b'{"id"', b': "1"}'])
+    mocker.patch.object(requests.Session, 'request')
+    requests.Session.request.return_value = requests_response
+    with client.request_stream(
+            'get', 'https://api.emburse.com/v1/cards', {}) as resp:
+        assert resp.status_code == 200
+        assert resp.content_length == 11
+        assert list(resp.iter_chunks(chunk_size=5)) == [b'{"id"', b': "1"}']
+    assert requests.Session.request.call_args[1]['stream']
+    requests_response.iter_content.assert_called_with(chunk_size=5)
+    assert requests_response.close.call_count == 1
+
+
+def test_request_stream_error_while_reading(mocker, requests_response):
+    client = RequestsClient()
+
+    def broken(chunk_size):
+        yield b'{"id"'
+        raise requests.exceptions.ChunkedEncodingError('connection reset')
+
+    requests_response.iter_content.side_effect = broken
+    mocker.patch.object(requests.Session, 'request')
+    requests.Session.request.return_value = requests_response
+    resp = client.request_stream('get', 'https://api.emburse.com/v1/cards', {})
+    with pytest.raises(EmburseAPIConnectionError):
+        resp.read()
+    assert requests_response.close.call_count == 1
+
+
+def test_buffered_stream_response():
+    resp = StreamedResponse.buffered('abcdef', 200, {})
+    assert resp.content_length is None
+    assert list(resp.iter_chunks(chunk_size=4)) == [b'abcd', b'ef']
+    with pytest.raises(EmburseAPIConnectionError):
+        resp.read()
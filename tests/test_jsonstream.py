@@ -0,0 +1,83 @@
+import json
+import pytest
+from pytest_mock import mocker
+from emburse.client import Client
+from emburse.errors import EmburseAPIError, EmburseValueError
+from emburse.http_client import StreamedResponse, new_default_http_client
+from emburse.jsonstream import ArrayItemParser, iter_chunks, iter_items
+from emburse.resource import Transaction
+
+
+@pytest.fixture(scope='function')
+def listing():
+    return {
+        'meta': {'transactions': 'not this one', 'nested': [{'a': '}],'}]},
+        'note': 'transactions',
+        'transactions': [
+            {'id': str(i), 'note': 'quote \\" bracket ]}, comma ,' * i,
+             'labels': [{'id': 'l{0}'.format(i)}], 'amount': -i}
+            for i in range(10)
+        ] + [1, 'two', None, [], {}],
+        'after': [1, 2, 3]
+    }
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 7, 64, 1 << 20])
+def test_iter_items_chunked(listing, chunk_size):
+    body = json.dumps(listing, indent=2).encode('utf-8')
+    items = list(iter_items(iter_chunks(body, chunk_size), 'transactions'))
+    assert items == listing['transactions']
+
+
+def test_iter_items_top_level_array():
+    items = list(iter_items(iter_chunks(b' [1, {"a": [2]}, "x"] ', 1)))
+    assert items == [1, {'a': [2]}, 'x']
+
+
+def test_iter_items_missing_or_empty():
+    assert list(iter_items([b'{"cards": []}'], 'cards')) == []
+    assert list(iter_items([b'{"cards": {"id": 1}}'], 'cards')) == []
+    assert list(iter_items([b'{"count": 0}'], 'cards')) == []
+
+
+def test_parser_returns_items_as_they_complete():
+    parser = ArrayItemParser('cards')
+    assert parser.feed(b'{"cards": [{"id": "a"}, {"id"') == [{'id': 'a'}]
+    assert parser.feed(b': "b"}') == []
+    assert parser.feed(b']}') == [{'id': 'b'}]
+    assert parser.done
+    parser.close()
+
+
+def test_truncated_body_raises():
+    with pytest.raises(ValueError):
+        list(iter_items([b'{"cards": [{"id": "a"}, {"id"'], 'cards'))
+
+
+def test_iter_stream(mocker):
+    pages = [
+        {'transactions': [{'id': '1', 'amount': '2.5'}, {'id': '2'}]},
+        {'transactions': [{'id': '3'}]},
+    ]
+    http = new_default_http_client()
+    mocker.patch.object(http, 'request_stream', side_effect=[
+        StreamedResponse.buffered(json.dumps(page), 200, {}) for page in pages
+    ])
+    client = Client(auth_token='Testing123', http_client=http)
+    transactions = list(client.Transaction.iter(page_size=2, stream=True))
+    assert [t.id for t in transactions] == ['1', '2', '3']
+    assert isinstance(transactions[0], Transaction)
+    assert transactions[0].amount == 2.5
+    assert http.request_stream.call_count == 2
+    assert 'page=2' in http.request_stream.call_args[0][1]
+
+
+def test_iter_stream_errors(mocker):
+    http = new_default_http_client()
+    mocker.patch.object(http, 'request_stream', return_value=(
+        StreamedResponse.buffered('{"transactions": [{"id": "1"}', 200, {})))
+    client = Client(auth_token='Testing123', http_client=http)
+    with pytest.raises(EmburseAPIError):
+        list(client.Transaction.iter(stream=True))
+    with pytest.raises(EmburseValueError):
+        list(client.Transaction.iter(stream=True, prefetch=2))
@@ -0,0 +1,70 @@
+import datetime
+import pytest
+from pytest_mock import mocker
+from emburse.client import Client
+from emburse.resource import Card, Transaction
+
+
+@pytest.fixture(scope='function')
+def emburse_client():
+    return Client(auth_token='Testing123', lazy=True)
+
+
+@pytest.fixture(scope='function')
+def transaction_list():
+    return {
+        'transactions': [
+            {
+                'id': str(i),
+                'amount': '1{0}.5'.format(i),
+                'card': {'id': 'card-{0}'.format(i)},
+                'created_at': '2016-08-19T04:02:07.016369Z'
+            }
+            for i in range(3)
+        ]
+    }
+
+
+def test_fields_decoded_on_first_read(mocker, emburse_client, transaction_list):
+    decode = mocker.spy(Transaction, 'decode_field')
+    transaction = emburse_client.Transaction.construct_from(
+        transaction_list['transactions'][0], 'Testing123',
+        context=emburse_client.context)
+    assert decode.call_count == 0
+    assert 'card' not in vars(transaction)
+    card = transaction.card
+    assert isinstance(card, Card)
+    assert transaction.card is card
+    assert decode.call_count == 1
+    assert transaction.amount == 10.5
+    assert isinstance(transaction.created_at, datetime.datetime)
+    with pytest.raises(AttributeError):
+        transaction.missing
+
+
+def test_lazy_list(mocker, emburse_client, transaction_list):
+    resource = emburse_client.Transaction
+    mocker.patch.object(resource, 'make_request')
+    resource.make_request.return_value = transaction_list
+    transactions = resource.list()
+    assert [t.id for t in transactions] == ['0', '1', '2']
+    assert transactions[2].amount == 12.5
+    assert transactions[0].as_dict()['card'] == {'id': 'card-0'}
+
+
+def test_lazy_refresh_replaces_read_fields(emburse_client):
+    transaction = emburse_client.Transaction
+    transaction.refresh_from({'id': '1', 'amount': '1.5', 'note': 'a'})
+    assert transaction.amount == 1.5
+    transaction.refresh_from({'id': '1', 'amount': '2.5'})
+    assert transaction.amount == 2.5
+    assert transaction.note == 'a'
+
+
+def test_lazy_refresh_keeps_internal_attributes(emburse_client):
+    transaction = emburse_client.Transaction
+    transaction.refresh_from({'id': '1', 'context': 'api value',
+                              'auth_token': 'api value'})
+    assert transaction.context is emburse_client.context
+    assert transaction.auth_token == 'Testing123'
+    assert transaction.id == '1'
@@ -0,0 +1,72 @@
+import time
+import threading
+import pytest
+from emburse.paging import iter_page_items, iter_pages, prefetch_pages
+
+
+class PageSource(object):
+    def __init__(self, pages, page_size=2):
+        self.page_size = page_size
+        self.pages = pages
+        self.fetched = []
+        self.lock = threading.Lock()
+
+    def __call__(self, page):
+        with self.lock:
+            self.fetched.append(page)
+        if page > self.pages:
+            return []
+        if page == self.pages:
+            return ['item'] * (self.page_size - 1)
+        return ['item'] * self.page_size
+
+
+def test_iter_pages_stops_on_short_page():
+    source = PageSource(pages=3)
+    pages = list(iter_pages(source, page_size=2))
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert source.fetched == [1, 2, 3]
+
+
+def test_iter_pages_is_lazy():
+    source = PageSource(pages=10)
+    pages = iter_pages(source, page_size=2)
+    next(pages)
+    assert source.fetched == [1]
+
+
+def test_iter_page_items_stops_on_short_page():
+    source = PageSource(pages=3)
+    items = list(iter_page_items(lambda page: iter(source(page)), page_size=2))
+    assert len(items) == 5
+    assert source.fetched == [1, 2, 3]
+
+
+def test_prefetch_pages_order():
+    source = PageSource(pages=5)
+    pages = list(prefetch_pages(iter_pages(source, page_size=2), depth=2))
+    assert [len(page) for page in pages] == [2, 2, 2, 2, 1]
+
+
+def test_prefetch_pages_fetches_ahead_with_backpressure():
+    source = PageSource(pages=50)
+    pages = prefetch_pages(iter_pages(source, page_size=2), depth=2)
+    next(pages)
+    time.sleep(0.3)
+    # The consumed page, two buffered pages and one waiting to be buffered.
+    assert len(source.fetched) == 4
+    pages.close()
+    time.sleep(0.3)
+    assert len(source.fetched) == 4
+
+
+def test_prefetch_pages_reraises_errors():
+    def fetch_page(page):
+        if page == 2:
+            raise ValueError('boom')
+        return ['item', 'item']
+
+    pages = prefetch_pages(iter_pages(fetch_page, page_size=2), depth=1)
+    assert next(pages) == ['item', 'item']
+    with pytest.raises(ValueError):
+        next(pages)
@@ -0,0 +1,106 @@
+import json
+import multiprocessing
+import os
+import threading
+import time
+import pytest
+from pytest_mock import mocker
+from emburse import Client
+from emburse.ratelimit import FileLockBackend, TokenBucket
+
+
+def test_burst_then_wait():
+    bucket = TokenBucket(rate=10, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    wait = bucket.reserve()
+    assert 0.09 <= wait <= 0.1
+    # Later callers queue behind earlier ones.
+    assert bucket.reserve() > wait
+
+
+def test_refill():
+    bucket = TokenBucket(rate=100, burst=1)
+    bucket.reserve()
+    time.sleep(0.02)
+    assert bucket.reserve() == 0.0
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_threads_stay_under_rate():
+    bucket = TokenBucket(rate=50, burst=5)
+    stamps = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(5):
+            bucket.acquire()
+            with lock:
+                stamps.append(time.time())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    started = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # 20 requests, 5 from the burst and 15 at 50/s.
+    assert time.time() - started >= 0.28
+    assert len(stamps) == 20
+
+
+def test_client_shares_limiter(mocker):
+    bucket = TokenBucket(rate=1000, burst=10)
+    client = Client(auth_token='Testing123', rate_limiter=bucket)
+    mocker.patch.object(bucket, 'reserve', return_value=0.0)
+    requestor = client.Card.requestor
+    assert requestor is client.Member.requestor
+    assert requestor.rate_limiter is bucket
+    mocker.patch.object(requestor._client, 'request')
+    requestor._client.request.return_value = json.dumps({'id': '1'}), 200, {}
+    client.Card.retrieve('1')
+    client.Member.retrieve('2')
+    assert bucket.reserve.call_count == 2
+
+
+def test_level():
+    bucket = TokenBucket(rate=1, burst=4)
+    assert bucket.level() == 4
+    bucket.reserve()
+    bucket.reserve()
+    assert 2 <= bucket.level() < 2.1
+
+
+def test_file_lock_backend_shares_budget(tmpdir):
+    path = str(tmpdir.join('emburse.bucket'))
+    first = TokenBucket(rate=1, burst=3, backend=FileLockBackend(path))
+    second = TokenBucket(rate=1, burst=3, backend=FileLockBackend(path))
+    waits = [first.reserve(), second.reserve(), first.reserve(),
+             second.reserve()]
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] > 0.9
+    assert second.level() < 0
+
+
+def _reserve_in_child(path, results):
+    bucket = TokenBucket(rate=1, burst=5, backend=FileLockBackend(path))
+    for _ in range(3):
+        results.put(bucket.reserve())
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires fork')
+def test_file_lock_backend_across_processes(tmpdir):
+    path = str(tmpdir.join('emburse.bucket'))
+    ctx = multiprocessing.get_context('fork')
+    results = ctx.Queue()
+    workers = [ctx.Process(target=_reserve_in_child, args=(path, results))
+               for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    waits = [results.get() for _ in range(9)]
+    assert len([wait for wait in waits if wait == 0.0]) == 5
@@ -0,0 +1,123 @@
+import json
+import pytest
+from pytest_mock import mocker
+from emburse.errors import EmburseAPIConnectionError, EmburseAPIError
+from emburse.http_client import StreamedResponse, new_default_http_client
+from emburse.requestor import Requestor
+from emburse.retry import RetryPolicy
+
+
+@pytest.fixture(scope='function')
+def attempts():
+    return []
+
+
+@pytest.fixture(scope='function')
+def policy(attempts):
+    return RetryPolicy(max_attempts=3, backoff_base=0.01,
+                       on_attempt=attempts.append)
+
+
+@pytest.fixture(scope='function')
+def requestor_obj(mocker, policy):
+    client = new_default_http_client()
+    mocker.patch.object(client, 'request')
+    mocker.patch('emburse.requestor.time.sleep')
+    return Requestor(token='Testing123', client=client, retry_policy=policy)
+
+
+def test_backoff_full_jitter(policy):
+    for attempt in range(1, 10):
+        delay = policy.backoff(attempt)
+        assert 0 <= delay <= min(policy.backoff_max, 0.01 * 2 ** (attempt - 1))
+
+
+def test_retry_after_seconds(policy):
+    assert policy.retry_after({'retry-after': '2'}) == 2.0
+    assert policy.retry_after({'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}) == 0.0
+    assert policy.retry_after({}) is None
+
+
+def test_retry_after_not_finite(policy):
+    for value in ('nan', 'inf', '-inf', 'Infinity'):
+        assert policy.retry_after({'Retry-After': value}) is None
+    delay = policy.next_delay(1, 'get', None, 503, {'Retry-After': 'nan'})
+    assert 0 <= delay <= policy.backoff_max
+
+
+def test_next_delay(policy):
+    assert policy.next_delay(1, 'get', status_code=503) is not None
+    assert policy.next_delay(1, 'get', status_code=404) is None
+    assert policy.next_delay(3, 'get', status_code=503) is None
+    assert policy.next_delay(1, 'post', status_code=503) is None
+    assert policy.next_delay(1, 'post', {'Idempotency-Key': 'abc'},
+                             status_code=503) is not None
+    assert policy.next_delay(1, 'get', status_code=429,
+                             resp_headers={'Retry-After': '3'}) == 3.0
+
+
+def test_request_stream_retries_and_closes_discarded(mocker, requestor_obj,
+                                                    attempts):
+    failed = StreamedResponse.buffered('{}', 503, {})
+    mocker.patch.object(failed, 'close')
+    mocker.patch.object(requestor_obj._client, 'request_stream', side_effect=[
+        failed, StreamedResponse.buffered(json.dumps({'id': '1'}), 200, {})
+    ])
+    resp = requestor_obj.request_stream('get', '/cards/1')
+    assert resp.status_code == 200
+    assert json.loads(resp.read().decode('utf-8')) == {'id': '1'}
+    assert failed.close.call_count == 1
+    assert len(attempts) == 2
+
+
+def test_request_retries_transient_status(requestor_obj, attempts):
+    requestor_obj._client.request.side_effect = [
+        ('{}', 503, {}),
+        ('{}', 502, {}),
+        (json.dumps({'id': '1'}), 200, {})
+    ]
+    resp, token = requestor_obj.request('get', '/cards/1')
+    assert resp == {'id': '1'}
+    assert requestor_obj._client.request.call_count == 3
+    assert [a.status_code for a in attempts] == [503, 502, 200]
+    assert [a.will_retry for a in attempts] == [True, True, False]
+    assert all(a.elapsed >= 0 for a in attempts)
+
+
+def test_request_gives_up(requestor_obj):
+    requestor_obj._client.request.return_value = ('{}', 503, {})
+    with pytest.raises(EmburseAPIError):
+        requestor_obj.request('get', '/cards/1')
+    assert requestor_obj._client.request.call_count == 3
+
+
+def test_request_retries_connection_errors(requestor_obj):
+    requestor_obj._client.request.side_effect = [
+        EmburseAPIConnectionError('reset'),
+        (json.dumps({'id': '1'}), 200, {})
+    ]
+    resp, token = requestor_obj.request('get', '/cards/1')
+    assert resp == {'id': '1'}
+
+
+def test_post_not_retried(requestor_obj):
+    requestor_obj._client.request.side_effect = EmburseAPIConnectionError(
+        'reset')
+    with pytest.raises(EmburseAPIConnectionError):
+        requestor_obj.request('post', '/cards', {'description': 'test'})
+    assert requestor_obj._client.request.call_count == 1
+
+
+def test_attempts_steps(requestor_obj, attempts):
+    steps = requestor_obj.attempts('get', 'https://api.emburse.com/v1/cards',
+                                   {})
+    assert next(steps) == (Requestor.SEND, {})
+    action, delay = steps.throw(EmburseAPIConnectionError('reset'))
+    assert action == Requestor.SLEEP
+    assert delay >= 0
+    assert steps.send(None) == (Requestor.SEND, {})
+    action, delay = steps.send(('unavailable', 503, {}))
+    assert action == Requestor.SLEEP
+    assert steps.send(None) == (Requestor.SEND, {})
+    assert steps.send(('{}', 200, {})) == (Requestor.DONE, ('{}', 200, {}))
+    assert [a.status_code for a in attempts] == [None, 503, 200]
@@ -1,8 +1,12 @@
+import io
 import pytest
 import datetime
 from pytest_mock import mocker
-from emburse.client import Statement
-from emburse.errors import EmburseTypeError, EmburseValueError
+from emburse.client import Account, Statement
+from emburse.errors import (EmburseInvalidRequestError,
+                            EmburseNotImplementedError, EmburseTypeError,
+                            EmburseValueError)
+from emburse.http_client import StreamedResponse
 
 
 def test_statement_export_requires_account_id():
@@ -26,6 +30,15 @@ def test_statement_export_end_date():
         statement.export(end_date='2017-05-01')
 
 
+def test_statement_retrieve_many_not_supported():
+    statement = Statement(auth_token='Test123')
+    result = statement.retrieve_many(['1', '2'], raw=True)
+    assert list(result) == []
+    assert list(result.failed) == ['1', '2']
+    assert all(isinstance(e, EmburseNotImplementedError)
+               for e in result.failed.values())
+
+
 def test_statement_export_valid_request_call(mocker):
     statement = Statement(auth_token='Test123', account_id=1)
     e_date = datetime.datetime.utcnow()
@@ -40,8 +53,141 @@ def test_statement_export_valid_request_call(mocker):
     statement.make_request.assert_called_with(
         method='GET',
         url_='/accounts/1/statement.csv',
-        params={
-            'start_date': s_date,
-            'end_date': e_date
-        }
+        deadline=None,
+        start_date=s_date,
+        end_date=e_date
     )
+
+
+def test_statement_export_to_path(mocker, tmpdir):
+    statement = Statement(auth_token='Test123', account_id=1)
+    body = b'%PDF-1.4 \x00\xff' * 1000
+    mocker.patch.object(statement.requestor, 'request_stream')
+    statement.requestor.request_stream.return_value = StreamedResponse.buffered(
+        body, 200, {})
+    path = str(tmpdir.join('statement.pdf'))
+    result = statement.export_to(path, file_format=Statement.PDF_FORMAT,
+                                 chunk_size=100)
+    statement.requestor.request_stream.assert_called_with(
+        'get', '/accounts/1/statement.pdf', params={},
+        deadline=None)
+    assert result.path == path
+    assert result.bytes_written == len(body)
+    assert result.file_format == Statement.PDF_FORMAT
+    assert result.elapsed >= 0
+    with open(path, 'rb') as exported:
+        assert exported.read() == body
+    assert tmpdir.listdir() == [tmpdir.join('statement.pdf')]
+
+
+def test_statement_export_to_sends_flat_query(mocker, tmpdir):
+    statement = Statement(auth_token='Test123', account_id=1)
+    http = statement.requestor._client
+    mocker.patch.object(http, 'request_stream')
+    http.request_stream.return_value = StreamedResponse.buffered('a\n', 200, {})
+    statement.export_to(str(tmpdir.join('statement.csv')),
+                        start_date=datetime.datetime(2017, 5, 1),
+                        end_date=datetime.datetime(2017, 5, 31))
+    url = http.request_stream.call_args[0][1]
+    assert 'start_date=2017-05-01' in url
+    assert 'end_date=2017-05-31' in url
+    assert 'params' not in url
+
+
+def test_statement_export_to_file_object(mocker):
+    statement = Statement(auth_token='Test123', account_id=1)
+    mocker.patch.object(statement.requestor, 'request_stream')
+    statement.requestor.request_stream.return_value = StreamedResponse.buffered(
+        'a,b\n1,2\n', 200, {})
+    out = io.BytesIO()
+    result = statement.export_to(out)
+    assert out.getvalue() == b'a,b\n1,2\n'
+    assert result.path is None
+    assert result.file_format == Statement.CSV_FORMAT
+
+
+def test_statement_export_to_error_leaves_no_file(mocker, tmpdir):
+    statement = Statement(auth_token='Test123', account_id=1)
+    mocker.patch.object(statement.requestor, 'request_stream')
+    statement.requestor.request_stream.return_value = StreamedResponse.buffered(
+        '{"detail": {"message": "Not found"}}', 404, {})
+    with pytest.raises(EmburseInvalidRequestError):
+        statement.export_to(str(tmpdir.join('statement.csv')))
+    assert tmpdir.listdir() == []
+
+
+def test_statement_export_many(mocker, tmpdir):
+    statement = Statement(auth_token='Test123')
+    e_date = datetime.datetime(2017, 5, 31)
+    s_date = datetime.datetime(2017, 5, 1)
+    out = tmpdir.join('out')
+    out.ensure(dir=True)
+    out.join('statement_done_20170501_20170531.pdf').write('complete')
+
+    def request_stream(method, url_, params=None, deadline=None):
+        if 'bad' in url_:
+            return StreamedResponse.buffered(
+                '{"detail": {"message": "Not found"}}', 404, {})
+        return StreamedResponse.buffered(url_, 200, {})
+
+    mocker.patch.object(statement.requestor, 'request_stream',
+                        side_effect=request_stream)
+    account = Account(auth_token='Test123', id='acc1')
+    report = statement.export_many(
+        [account, 'bad', 'done', 'acc2'], str(tmpdir.join('out')),
+        start_date=s_date, end_date=e_date, file_format=Statement.PDF_FORMAT)
+    assert [r.key for r in report.results] == ['acc1', 'bad', 'done', 'acc2']
+    assert [r.key for r in report.exported] == ['acc1', 'acc2']
+    assert [r.key for r in report.failed] == ['bad']
+    assert isinstance(report.failed[0].error, EmburseInvalidRequestError)
+    assert statement.requestor.request_stream.call_count == 3
+    assert not report.ok
+    assert sorted(p.basename for p in out.listdir()) == [
+        'statement_acc1_20170501_20170531.pdf',
+        'statement_acc2_20170501_20170531.pdf',
+        'statement_done_20170501_20170531.pdf',
+    ]
+    assert out.join('statement_acc2_20170501_20170531.pdf').read() == (
+        '/accounts/acc2/statement.pdf')
+
+
+def test_statement_export_many_duplicate_accounts(mocker, tmpdir):
+    statement = Statement(auth_token='Test123')
+    mocker.patch.object(
+        statement.requestor, 'request_stream',
+        side_effect=lambda method, url_, params=None, deadline=None:
+            StreamedResponse.buffered(url_, 200, {}))
+    account = Account(auth_token='Test123', id='acc1')
+    report = statement.export_many(['acc1', 'acc2', account, 'acc2'],
+                                   str(tmpdir))
+    assert [r.key for r in report.results] == ['acc1', 'acc2']
+    assert statement.requestor.request_stream.call_count == 2
+    assert sorted(p.basename for p in tmpdir.listdir()) == [
+        'statement_acc1_default_default.csv',
+        'statement_acc2_default_default.csv',
+    ]
+
+
+def test_statement_export_many_resume(mocker, tmpdir):
+    statement = Statement(auth_token='Test123')
+    tmpdir.join('statement_acc1_default_default.csv').write('complete')
+    tmpdir.join('statement_acc2_default_default.csv.part').write('partial')
+    mocker.patch.object(
+        statement.requestor, 'request_stream',
+        side_effect=lambda *args, **kwargs: StreamedResponse.buffered(
+            'a,b', 200, {}))
+    report = statement.export_many(['acc1', 'acc2'], str(tmpdir))
+    assert [r.key for r in report.skipped] == ['acc1']
+    assert [r.key for r in report.exported] == ['acc2']
+    assert tmpdir.join('statement_acc2_default_default.csv').read() == 'a,b'
+    assert not tmpdir.join('statement_acc2_default_default.csv.part').exists()
+    report = statement.export_many(['acc1', 'acc2'], str(tmpdir), resume=False)
+    assert len(report.exported) == 2
+
+
+def test_statement_export_many_validates_first(mocker, tmpdir):
+    statement = Statement(auth_token='Test123')
+    mocker.patch.object(statement.requestor, 'request_stream')
+    with pytest.raises(EmburseTypeError):
+        statement.export_many(['acc1'], str(tmpdir), start_date='2017-05-01')
+    assert statement.requestor.request_stream.call_count == 0
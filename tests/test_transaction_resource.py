@@ -159,3 +159,80 @@ def test_department_update(mocker, emburse_client, transaction_dict):
     assert transaction.category.url == tran_update_data['url']
     assert transaction.category.code == tran_update_data['code']
     assert transaction.category.name == tran_update_data['name']
+
+
+def test_transaction_iter(mocker, emburse_client, transaction_list):
+    transaction = emburse_client.Transaction
+    mocker.patch.object(transaction, 'make_request')
+    transaction.make_request.side_effect = [
+        {'transactions': transaction_list[:4]},
+        {'transactions': transaction_list[4:8]},
+        {'transactions': transaction_list[8:]}
+    ]
+    transactions = list(transaction.iter(page_size=4, state='pending'))
+    assert [tran.id for tran in transactions] == [
+        x.get('id') for x in transaction_list]
+    assert all(isinstance(tran, Transaction) for tran in transactions)
+    assert transaction.make_request.call_count == 3
+    last_call = transaction.make_request.call_args
+    assert last_call[1]['page'] == 3
+    assert last_call[1]['limit'] == 4
+    assert last_call[1]['state'] == 'pending'
+
+
+def test_transaction_iter_stops_early(mocker, emburse_client,
+                                      transaction_list):
+    transaction = emburse_client.Transaction
+    mocker.patch.object(transaction, 'make_request')
+    transaction.make_request.return_value = {
+        'transactions': transaction_list[:5]}
+    for count, tran in enumerate(transaction.auto_paging_iter(page_size=5)):
+        if count == 6:
+            break
+    assert transaction.make_request.call_count == 2
+
+
+def test_transaction_iter_prefetch(mocker, emburse_client, transaction_list):
+    transaction = emburse_client.Transaction
+    mocker.patch.object(transaction, 'make_request')
+    transaction.make_request.side_effect = [
+        {'transactions': transaction_list[:5]},
+        {'transactions': transaction_list[5:]},
+        {'transactions': []}
+    ]
+    transactions = list(transaction.iter(page_size=5, prefetch=2))
+    assert [tran.id for tran in transactions] == [
+        x.get('id') for x in transaction_list]
+    assert transaction.make_request.call_count == 3
+
+
+def test_transaction_list_raw(mocker, emburse_client, transaction_list):
+    transaction = emburse_client.Transaction
+    mocker.patch.object(transaction, 'make_request')
+    transaction.make_request.return_value = {'transactions': transaction_list}
+    transactions = transaction.list(raw=True)
+    assert transactions == transaction_list
+    assert transactions[0] is transaction_list[0]
+
+
+def test_transaction_iter_raw_typed(mocker, emburse_client, transaction_dict):
+    transaction = emburse_client.Transaction
+    mocker.patch.object(transaction, 'make_request')
+    transaction.make_request.return_value = {'transactions': [transaction_dict]}
+    tran = next(transaction.iter(raw=True, typed=True))
+    assert isinstance(tran, dict)
+    assert isinstance(tran['created_at'], datetime.datetime)
+    assert isinstance(tran['time'], datetime.datetime)
+    assert tran['card'] == transaction_dict['card']
+    assert tran['vendor'] is transaction_dict['vendor']
+    assert transaction_dict['created_at'] == "2016-08-19T04:02:07.016369Z"
+
+
+def test_transaction_retrieve_raw(mocker, emburse_client, transaction_dict):
+    transaction = emburse_client.Transaction
+    mocker.patch.object(Transaction, 'make_request')
+    Transaction.make_request.return_value = transaction_dict
+    tran = transaction.retrieve(transaction_dict['id'], raw=True)
+    assert tran is transaction_dict
+    assert Transaction.make_request.call_args[1]['url_'] == (
+        '/transactions/{0}'.format(transaction_dict['id']))
@@ -1,5 +1,10 @@
+import datetime
 import sys
+import pytest
+from pytest_mock import mocker
+from pytz import utc as UTC
 from emburse import util
+from emburse.requestor import Requestor
 
 
 def test_json():
@@ -20,3 +25,39 @@ def test_utf8():
         assert util.utf8(unicode_str) == "this is a test"
     else:
         assert util.utf8('testing 1 2 3') == 'testing 1 2 3'
+
+
+def test_parse_datetime_iso():
+    parsed = util.parse_datetime('2016-08-19T04:02:07.016369Z')
+    assert parsed == datetime.datetime(2016, 8, 19, 4, 2, 7, 16369, tzinfo=UTC)
+    assert parsed.tzinfo is UTC
+    assert util.parse_datetime('2017-09-30') == datetime.datetime(2017, 9, 30)
+    assert util.parse_datetime('2016-08-19T04:02:05.5') == datetime.datetime(
+        2016, 8, 19, 4, 2, 5, 500000)
+
+
+def test_parse_datetime_offsets():
+    parsed = util.parse_datetime('2016-08-19T04:02:05-07:00')
+    assert parsed.utcoffset() == datetime.timedelta(hours=-7)
+    assert parsed.astimezone(UTC) == datetime.datetime(
+        2016, 8, 19, 11, 2, 5, tzinfo=UTC)
+    assert util.parse_datetime('2016-08-19T04:02:05+0000').tzinfo is UTC
+    requestor = Requestor(token='Testing123')
+    encoded = requestor.encode_datetime(parsed)
+    assert util.parse_datetime(encoded) == parsed
+
+
+def test_parse_datetime_fallback():
+    parsed = util.parse_datetime('Aug 19 2016 4:02 PM UTC')
+    assert parsed == datetime.datetime(2016, 8, 19, 16, 2, tzinfo=UTC)
+    assert parsed.tzinfo is UTC
+    with pytest.raises(ValueError):
+        util.parse_datetime('not a date')
+
+
+def test_parse_datetime_cache(mocker):
+    util._datetime_cache.clear()
+    parse = mocker.spy(util, '_parse_iso_datetime')
+    first = util.parse_datetime('2017-05-01T00:00:00Z')
+    assert util.parse_datetime('2017-05-01T00:00:00Z') is first
+    assert parse.call_count == 1